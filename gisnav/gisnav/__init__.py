@@ -12,13 +12,17 @@ down. They are imported here to package namespace for convenience. For example:
 ROS namespace and :term:`core` node names are hard-coded inside the static
 public node entrypoints defined here. Other node initialization arguments are p
 rovided via ROS 2 launch arguments.
+
+The :term:`core` nodes can also be run in a single process with
+:func:`.run_container`.
 """
 import cProfile
 import io
 import pstats
-from typing import Optional
+from typing import List, Tuple, Type
 
 import rclpy
+from rclpy.executors import Executor, MultiThreadedExecutor, SingleThreadedExecutor
 from rclpy.node import Node
 
 from .constants import (
@@ -33,6 +37,16 @@ from .constants import (
 )
 from .core import BBoxNode, GISNode, PoseNode, TransformNode
 
+_CONTAINER_NODES: List[Tuple[Type[Node], str]] = [
+    (BBoxNode, BBOX_NODE_NAME),
+    (GISNode, GIS_NODE_NAME),
+    (TransformNode, TRANSFORM_NODE_NAME),
+    (PoseNode, POSE_NODE_NAME),
+]
+"""Node constructors and names spun up by :func:`.run_container`, extended
+with :term:`extension` nodes that could be imported
+"""
+
 try:
     from .extensions.qgis_node import QGISNode
 
@@ -50,6 +64,8 @@ try:
         """Spins up a :class:`.MockGPSNode`"""
         _run(MockGPSNode, MOCK_GPS_NODE_NAME, **_rclpy_node_kwargs)
 
+    _CONTAINER_NODES.append((MockGPSNode, MOCK_GPS_NODE_NAME))
+
 except ModuleNotFoundError as e:
     print(f"Could not import MockGPSNode because a module was not found: {e}")
 
@@ -64,13 +80,19 @@ except ModuleNotFoundError as e:
     print(f"Could not import RVizNode because a module was not found: {e}")
 
 
-def _run(constructor: rclpy.node.Node, *args, **kwargs):
-    """Spins up a ROS 2 node
+def _spin(
+    nodes: List[Tuple[Type[Node], str]],
+    executor_type: Type[Executor],
+    **kwargs,
+):
+    """Spins up ROS 2 nodes on a shared executor
 
-    :param constructor: Node constructor
-    :param *args: Node constructor args
-    :param **kwargs: Node constructor kwargs
-    :return:
+    Prints out cProfile stats on keyboard interrupt unless Python is run with
+    optimizations (``-O``).
+
+    :param nodes: Node constructor and node name pairs
+    :param executor_type: Executor class
+    :param **kwargs: Node constructor kwargs shared by all nodes
     """
     if __debug__:
         profile = cProfile.Profile()
@@ -78,11 +100,15 @@ def _run(constructor: rclpy.node.Node, *args, **kwargs):
     else:
         profile = None
 
-    node: Optional[Node] = None
+    instances: List[Node] = []
     try:
         rclpy.init()
-        node = constructor(*args, **kwargs)
-        rclpy.spin(node)
+        executor = executor_type()
+        for constructor, name in nodes:
+            node = constructor(name, **kwargs)
+            instances.append(node)
+            executor.add_node(node)
+        executor.spin()
     except KeyboardInterrupt as e:
         print(f"Keyboard interrupt received:\n{e}")
         if profile is not None:
@@ -92,14 +118,37 @@ def _run(constructor: rclpy.node.Node, *args, **kwargs):
             s = io.StringIO()
             stats = pstats.Stats(profile, stream=s).sort_stats(pstats.SortKey.TIME)
             stats.print_stats(20)
-            if node is not None:
-                node.get_logger().info(s.getvalue())
+            if len(instances) > 0:
+                instances[0].get_logger().info(s.getvalue())
     finally:
-        if node is not None:
+        for node in instances:
             node.destroy_node()
         rclpy.shutdown()
 
 
+def _run(constructor: Type[Node], name: str, **kwargs):
+    """Spins up a ROS 2 node
+
+    :param constructor: Node constructor
+    :param name: Node name
+    :param **kwargs: Node constructor kwargs
+    """
+    _spin([(constructor, name)], SingleThreadedExecutor, **kwargs)
+
+
+def _run_container(nodes: List[Tuple[Type[Node], str]], **kwargs):
+    """Spins up multiple ROS 2 nodes in a single process
+
+    The nodes are spun on a shared multi-threaded executor. Each node keeps its
+    default mutually exclusive callback group so a node's own callbacks are
+    never run concurrently, but callbacks of different nodes are.
+
+    :param nodes: Node constructor and node name pairs
+    :param **kwargs: Node constructor kwargs shared by all nodes
+    """
+    _spin(nodes, MultiThreadedExecutor, **kwargs)
+
+
 _rclpy_node_kwargs = {
     "namespace": ROS_NAMESPACE,
     "allow_undeclared_parameters": True,
@@ -125,3 +174,18 @@ def run_transform_node():
 def run_pose_node():
     """Spins up a :class:`.PoseNode`"""
     _run(PoseNode, POSE_NODE_NAME, **_rclpy_node_kwargs)
+
+
+def run_container():
+    """Spins up :class:`.BBoxNode`, :class:`.GISNode`, :class:`.TransformNode`,
+    :class:`.PoseNode` and :class:`.MockGPSNode` (if available) in a single
+    process
+
+    .. note::
+        ``rclpy`` does not support intra-process communication, so messages
+        between the nodes are still passed through the ROS middleware. Running
+        in a single process lets the middleware use its same-process transport
+        instead of the network stack, and saves the per-process interpreter
+        and model memory overhead.
+    """
+    _run_container(_CONTAINER_NODES, **_rclpy_node_kwargs)
@@ -1,9 +1,13 @@
 """Common assertions for convenience"""
 import inspect
+import os
 from functools import wraps
+from types import CodeType
 from typing import (
     Any,
     Callable,
+    Dict,
+    Final,
     List,
     Optional,
     Tuple,
@@ -22,7 +26,7 @@ from rclpy.exceptions import (
 )
 from rclpy.node import Node
 from std_msgs.msg import Header
-from typing_extensions import ParamSpec
+from typing_extensions import ParamSpec, is_typeddict
 
 #: Original return type of the wrapped method
 T = TypeVar("T")
@@ -67,7 +71,157 @@ def _is_generic_instance(value, origin_type, type_args):
         return any(isinstance(value, type_arg) for type_arg in type_args)
 
 
-# TODO: make this work with typed dicts?
+NARROW_TYPES_FAST_MODE_ENV: Final = "GISNAV_NARROW_TYPES_FAST_MODE"
+"""Environment variable that enables :attr:`._NARROW_TYPES_FAST_MODE` when set
+to ``1`` or ``true``
+"""
+
+_NARROW_TYPES_FAST_MODE: Final = os.environ.get(
+    NARROW_TYPES_FAST_MODE_ENV, ""
+).lower() in ("1", "true")
+"""If True, :func:`.narrow_types` only checks that arguments whose type hints
+do not allow None are not None, instead of checking full types
+
+Enabled with the :attr:`.NARROW_TYPES_FAST_MODE_ENV` environment variable.
+Missing (None) inputs are still narrowed out, which is what the computed
+properties rely on, but argument type mismatches go unnoticed.
+"""
+
+_Mismatch = Tuple[str, Any, type]
+"""Argument name, expected type and actual type of a type hint mismatch"""
+
+_Checker = Callable[[tuple, dict], List[_Mismatch]]
+"""Compiled argument type checker returning type hint mismatches"""
+
+_checkers: Dict[CodeType, _Checker] = {}
+"""Compiled :func:`.narrow_types` checkers by decorated function code object
+
+Many decorated functions are inner functions that are redefined (and
+redecorated) on every call of the enclosing method. They share the same code
+object, so the checker only needs to be compiled once.
+"""
+
+
+def _compile_type_check(
+    expected_type: Any, fast_mode: bool
+) -> Optional[Callable[[Any], bool]]:
+    """Returns a predicate checking a value against a type hint, or None if
+    any value is accepted
+
+    :param expected_type: Type hint
+    :param fast_mode: True to only check for None (see
+        :attr:`._NARROW_TYPES_FAST_MODE`)
+    """
+    if expected_type is Any:
+        return None
+
+    origin_type = get_origin(expected_type)
+    type_args = get_args(expected_type)
+
+    if fast_mode:
+        if origin_type == Union and type(None) in type_args:
+            return None
+        return lambda value: value is not None
+
+    if origin_type is None:
+        if is_typeddict(expected_type):
+            return lambda value: isinstance(value, dict)
+        return lambda value: isinstance(value, expected_type)
+    elif origin_type == Union and all(get_origin(arg) is None for arg in type_args):
+        # e.g. Optional[Image], isinstance accepts a tuple of types directly
+        return lambda value: isinstance(value, type_args)
+    else:
+        return lambda value: _is_generic_instance(value, origin_type, type_args)
+
+
+def _compile_checker(
+    method: Callable, fast_mode: bool = _NARROW_TYPES_FAST_MODE
+) -> _Checker:
+    """Resolves type hints and signature of the method once and returns an
+    argument type checker for :func:`.narrow_types`
+
+    :param method: Decorated method
+    :param fast_mode: True to only check for None (see
+        :attr:`._NARROW_TYPES_FAST_MODE`)
+    """
+    type_hints = get_type_hints(method)
+    signature = inspect.signature(method)
+
+    checks = {}
+    for name, expected_type in type_hints.items():
+        if name in signature.parameters:
+            check = _compile_type_check(expected_type, fast_mode)
+            if check is not None:
+                checks[name] = (expected_type, check)
+
+    parameters = list(signature.parameters.values())
+    positional_kinds = (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    )
+    simple = all(
+        parameter.kind in positional_kinds
+        or parameter.kind == inspect.Parameter.KEYWORD_ONLY
+        for parameter in parameters
+    )
+    positional_count = sum(
+        1 for parameter in parameters if parameter.kind in positional_kinds
+    )
+    indexed_checks = [
+        (
+            index,
+            parameter.name,
+            parameter.kind in positional_kinds,
+            parameter.default,
+            *checks[parameter.name],
+        )
+        for index, parameter in enumerate(parameters)
+        if parameter.name in checks
+    ]
+
+    def _bound_check(args: tuple, kwargs: dict) -> List[_Mismatch]:
+        bound_arguments = signature.bind(*args, **kwargs)
+        bound_arguments.apply_defaults()
+        return [
+            (name, checks[name][0], type(value))
+            for name, value in bound_arguments.arguments.items()
+            if name in checks and not checks[name][1](value)
+        ]
+
+    def _check(args: tuple, kwargs: dict) -> List[_Mismatch]:
+        if not simple or len(args) > positional_count:
+            return _bound_check(args, kwargs)
+
+        mismatches = []
+        for index, name, positional, default, expected_type, check in indexed_checks:
+            if positional and index < len(args):
+                value = args[index]
+            elif name in kwargs:
+                value = kwargs[name]
+            elif default is not inspect.Parameter.empty:
+                value = default
+            else:
+                # Missing argument - let bind raise the appropriate TypeError
+                return _bound_check(args, kwargs)
+
+            if not check(value):
+                mismatches.append((name, expected_type, type(value)))
+
+        return mismatches
+
+    return _check
+
+
+def _get_checker(method: Callable) -> _Checker:
+    """Returns cached compiled checker for the method"""
+    code = method.__code__
+    checker = _checkers.get(code)
+    if checker is None:
+        checker = _compile_checker(method)
+        _checkers[code] = checker
+    return checker
+
+
 def narrow_types(
     arg: Union[Callable[..., T], Node] = None, return_value: Optional[Any] = None
 ):
@@ -103,44 +257,35 @@ def narrow_types(
         None if the types narrowing fails
     :return: The return value of the original method or parameter
         ``return_value`` if any argument does not match the type hints.
+
+    .. note::
+        Type hints and the signature are resolved once per decorated function
+        and compiled into a checker (see :func:`._compile_checker`). Only
+        None checks are made in fast mode (see
+        :attr:`._NARROW_TYPES_FAST_MODE`).
     """
 
     instance: Optional[Node] = None if not isinstance(arg, Node) else arg
     method: Optional[Callable] = arg if not isinstance(arg, Node) else None
 
     def inner_decorator(method):
+        try:
+            checker: Optional[_Checker] = _get_checker(method)
+        except NameError:
+            # Forward reference that cannot be resolved yet, compile on first
+            # call instead
+            checker = None
+
         @wraps(method)
         def wrapper(*args, **kwargs):
+            nonlocal checker
             node_instance: Node = args[0] if instance is None else instance
             assert isinstance(node_instance, Node)
 
-            type_hints = get_type_hints(method)
-            signature = inspect.signature(method)
-            bound_arguments = signature.bind(*args, **kwargs)
-            bound_arguments.apply_defaults()
-
-            mismatches = []
-            for name, value in bound_arguments.arguments.items():
-                if name in type_hints:
-                    expected_type = type_hints[name]
-                    origin_type = get_origin(expected_type)
-                    type_args = get_args(expected_type)
-
-                    if origin_type is None:
-                        try:
-                            check = isinstance(value, expected_type)
-                        except TypeError as te:
-                            # TODO: handle TypedDict better
-                            if isinstance(value, dict) and "TypedDict" in str(te):
-                                check = True
-                            else:
-                                raise te
-                    else:
-                        check = _is_generic_instance(value, origin_type, type_args)
-
-                    if not check:
-                        mismatches.append((name, expected_type, type(value)))
+            if checker is None:
+                checker = _get_checker(method)
 
+            mismatches = checker(args, kwargs)
             if mismatches:
                 mismatch_msgs = [
                     f"{name} (expected {expected}, got {actual})"
@@ -0,0 +1,128 @@
+"""Local :term:`raster` backend for reading :term:`orthoimagery <orthoimage>` and
+:term:`DEM` windows directly from GeoTIFF files
+
+Intended for Cloud-Optimized GeoTIFFs (COGs) on vehicles that do not run a
+:term:`WMS` server. Windows are read with a decimated ``out_shape`` so that GDAL
+reads from the internal overview closest to the requested resolution instead of
+the full resolution raster.
+
+.. note::
+    Requires the optional ``rasterio`` dependency.
+"""
+import threading
+from typing import Tuple
+
+import numpy as np
+import rasterio
+from rasterio.crs import CRS
+from rasterio.enums import Resampling
+from rasterio.errors import WindowError
+from rasterio.vrt import WarpedVRT
+from rasterio.windows import Window, from_bounds
+
+from ._messaging import BBox
+
+
+class LocalRaster:
+    """Windowed reader for a local GeoTIFF :term:`raster`
+
+    Rasters that are not in the requested :term:`SRS` are reprojected on the
+    fly through a GDAL warped VRT.
+
+    The reader is thread-safe. Reads are serialized because GDAL datasets
+    must not be shared between threads.
+    """
+
+    def __init__(self, path: str, srs: str) -> None:
+        """Class initializer
+
+        :param path: Path to the GeoTIFF file
+        :param srs: :term:`SRS` of the bounding boxes passed to :meth:`.read`
+        :raise rasterio.errors.RasterioIOError: If the file cannot be opened
+        """
+        self._lock = threading.Lock()
+        self._file = rasterio.open(path)
+        self._dataset = (
+            WarpedVRT(self._file, crs=srs, resampling=Resampling.bilinear)
+            if self._file.crs != CRS.from_user_input(srs)
+            else self._file
+        )
+
+    def close(self) -> None:
+        """Closes the underlying dataset"""
+        with self._lock:
+            if self._dataset is not self._file:
+                self._dataset.close()
+            self._file.close()
+
+    def read(self, bbox: BBox, size: Tuple[int, int], grayscale: bool) -> np.ndarray:
+        """Returns the :term:`raster` window for the bounding box
+
+        The output matches a decoded :term:`GetMap` response: color rasters
+        are 3-channel BGR and grayscale rasters are single channel 2D arrays.
+        Parts of the bounding box that fall outside the raster are filled with
+        zeros.
+
+        Grayscale (:term:`DEM`) rasters that are not 8-bit are returned as
+        16-bit elevations rounded to whole raster values so that
+        :class:`.GISNode` can encode them in the high and low byte
+        :term:`DEM` channels of the :term:`orthoimage` stack. Values outside
+        the 16-bit range, i.e. below zero, are clamped. Color rasters are
+        clamped to the 8-bit range.
+
+        :param bbox: Bounding box in the :term:`SRS` given at initialization
+        :param size: Output raster size in pixels (height, width)
+        :param grayscale: True to read only the first band
+        :return: Raster of shape (height, width) if grayscale, or
+            (height, width, 3) otherwise. Color rasters and 8-bit grayscale
+            rasters are 8-bit, other grayscale rasters are 16-bit.
+        """
+        height, width = size
+        dataset = self._dataset
+        if grayscale:
+            indexes = [1]
+        elif dataset.count >= 3:
+            indexes = [3, 2, 1]  # BGR like cv2.imdecode
+        else:
+            indexes = [1, 1, 1]
+
+        raster = np.zeros((len(indexes), height, width), dtype=dataset.dtypes[0])
+
+        with self._lock:
+            window = from_bounds(*bbox, transform=dataset.transform)
+            try:
+                read_window = window.intersection(
+                    Window(0, 0, dataset.width, dataset.height)
+                )
+            except WindowError:
+                # Bounding box is completely outside the raster
+                read_window = None
+
+            if read_window is not None:
+                scale_x, scale_y = width / window.width, height / window.height
+                col_min = round((read_window.col_off - window.col_off) * scale_x)
+                col_max = round(
+                    (read_window.col_off + read_window.width - window.col_off) * scale_x
+                )
+                row_min = round((read_window.row_off - window.row_off) * scale_y)
+                row_max = round(
+                    (read_window.row_off + read_window.height - window.row_off)
+                    * scale_y
+                )
+                if col_max > col_min and row_max > row_min:
+                    raster[:, row_min:row_max, col_min:col_max] = dataset.read(
+                        indexes,
+                        window=read_window,
+                        out_shape=(len(indexes), row_max - row_min, col_max - col_min),
+                        resampling=Resampling.bilinear,
+                    )
+
+        if grayscale and raster.dtype != np.uint8:
+            info = np.iinfo(np.uint16)
+            raster = np.clip(np.rint(raster), info.min, info.max).astype(np.uint16)
+        elif raster.dtype != np.uint8:
+            raster = np.clip(raster, 0, 255).astype(np.uint8)
+
+        if grayscale:
+            return raster[0]
+        return np.ascontiguousarray(np.moveaxis(raster, 0, -1))
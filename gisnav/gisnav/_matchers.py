@@ -0,0 +1,880 @@
+"""Keypoint matcher backends for :class:`.PoseNode`
+
+All matchers take a grayscale :term:`query` and :term:`reference` image pair
+and return a dictionary of NumPy arrays with the same keys:
+
+* ``keypoints0``: Matched query image keypoints, shape (N, 2)
+* ``keypoints1``: Matched reference image keypoints, shape (N, 2)
+* ``confidence``: Match confidences in range [0, 1], shape (N,)
+
+The :term:`reference` image only changes when a new :term:`orthoimage` is
+received or the rotation bin changes (see :attr:`.TransformNode.rotation_bin`),
+so the matchers cache reference image features by reference image content and
+only encode the query image for every frame.
+
+``torch`` and ``kornia`` are imported lazily because importing them takes a long
+time and they are not needed by the OpenCV matchers, nor by the ONNX Runtime
+engine once the model has been exported.
+"""
+import hashlib
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Final,
+    Generic,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import cv2
+import numpy as np
+
+if TYPE_CHECKING:
+    import torch
+
+MatcherName = Literal["loftr", "loftr_downscaled", "orb", "akaze"]
+"""Supported keypoint matcher backends (see :func:`.create_matcher`)"""
+
+MatcherEngine = Literal["eager", "torchscript", "onnx"]
+"""Supported LoFTR inference engines (see :func:`.create_matcher`)"""
+
+MatcherPrecision = Literal["fp32", "fp16", "int8"]
+"""Supported LoFTR inference precisions (see :func:`.create_matcher`)"""
+
+Matches = Dict[str, np.ndarray]
+"""Matched keypoints and their confidences"""
+
+#: Cached reference image features
+F = TypeVar("F")
+
+
+class ReferenceCache(Generic[F]):
+    """Least-recently-used (LRU) cache of :term:`reference` image features
+    keyed by reference image content
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Class initializer
+
+        :param max_size: Maximum number of cached references, 0 disables the
+            cache
+        :raise ValueError: If max size is negative
+        """
+        if max_size < 0:
+            raise ValueError(f"Cache size must not be negative ({max_size}).")
+
+        self._max_size = max_size
+        self._features: "OrderedDict[bytes, F]" = OrderedDict()
+        self.hits = 0
+        """Number of cache hits"""
+        self.misses = 0
+        """Number of cache misses"""
+
+    @staticmethod
+    def key(reference: np.ndarray) -> bytes:
+        """Returns content digest of the reference image
+
+        Hashing the image is orders of magnitude cheaper than encoding it.
+        """
+        digest = hashlib.blake2b(np.ascontiguousarray(reference), digest_size=16)
+        digest.update(repr(reference.shape).encode("utf-8"))
+        return digest.digest()
+
+    def get(self, reference: np.ndarray, encode: Callable[[], F]) -> F:
+        """Returns cached features for the reference image, encoding and
+        caching them on a cache miss
+
+        :param reference: Reference image
+        :param encode: Callable returning the reference image features
+        :return: Reference image features
+        """
+        if self._max_size == 0:
+            # Disabled, skip hashing the reference image
+            self.misses += 1
+            return encode()
+
+        key = self.key(reference)
+        if key in self._features:
+            self.hits += 1
+            self._features.move_to_end(key)
+            return self._features[key]
+
+        self.misses += 1
+        features = encode()
+        self._features[key] = features
+        while len(self._features) > self._max_size:
+            self._features.popitem(last=False)
+        return features
+
+
+class Matcher(ABC):
+    """Base class for keypoint matchers"""
+
+    def __init__(self, cache_size: int) -> None:
+        """Class initializer
+
+        :param cache_size: Maximum number of cached reference image features
+        """
+        self._reference_cache: ReferenceCache = ReferenceCache(cache_size)
+
+    @property
+    def cache_stats(self) -> Tuple[int, int]:
+        """Reference feature cache hits and misses"""
+        return self._reference_cache.hits, self._reference_cache.misses
+
+    @abstractmethod
+    def match(self, query: np.ndarray, reference: np.ndarray) -> Matches:
+        """Returns matching keypoints between the images
+
+        :param query: 8-bit grayscale query image
+        :param reference: 8-bit grayscale reference image
+        :return: Matched keypoints and confidences
+        """
+
+    def match_batch(self, pairs: List[Tuple[np.ndarray, np.ndarray]]) -> List[Matches]:
+        """Returns matching keypoints for multiple image pairs
+
+        Matches the pairs one at a time unless overridden by a matcher that
+        supports batching.
+
+        :param pairs: List of query and reference image pairs
+        :return: List of matches in the same order
+        """
+        return [self.match(query, reference) for query, reference in pairs]
+
+    def prepare(self, shape: Tuple[int, int], wait: bool = False) -> None:
+        """Prepares the matcher for query and reference images of given shape
+
+        Does nothing unless overridden by a matcher with expensive per
+        resolution setup, so that the setup can be done before the first
+        image pair arrives.
+
+        :param shape: Query and reference image shape (height, width)
+        :param wait: True to block until the setup is done, otherwise the
+            setup may continue in the background
+        """
+
+
+_logger = logging.getLogger(__name__)
+
+_LOFTR_SIZE_MULTIPLE: Final = 8
+"""LoFTR input image side lengths must be multiples of this"""
+
+_LOFTR_FORWARD_KORNIA_VERSION: Final = "0.6.10"
+"""``kornia`` version whose ``LoFTR.forward`` is mirrored by
+:meth:`.LoFTRMatcher._forward`
+"""
+
+
+def _quantize_dynamic(model: "torch.nn.Module") -> "torch.nn.Module":
+    """Returns the model with dynamically quantized INT8 linear layers
+
+    The linear layers of the LoFTR coarse and fine transformers make up most
+    of the model weights and CPU time. Dynamic quantization needs no
+    calibration data because activations are quantized at runtime. The CNN
+    backbone stays in fp32.
+    """
+    import torch
+
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+
+def _loftr_shape(shape: Tuple[int, ...], scale: float) -> Tuple[int, int]:
+    """Returns the LoFTR input shape (height, width) for an image of given
+    shape resized by the scaling factor
+    """
+    height, width = shape[0:2]
+    if scale == 1.0:
+        return height, width
+    height, width = (
+        max(
+            _LOFTR_SIZE_MULTIPLE,
+            round(side * scale / _LOFTR_SIZE_MULTIPLE) * _LOFTR_SIZE_MULTIPLE,
+        )
+        for side in (height, width)
+    )
+    return height, width
+
+
+def _resize_for_loftr(img: np.ndarray, scale: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the image resized by the scaling factor to LoFTR compatible
+    dimensions, and the factors for scaling matched keypoints back to the
+    original image
+    """
+    height, width = img.shape[0:2]
+    shape = _loftr_shape(img.shape, scale)
+    if shape != (height, width):
+        img = cv2.resize(img, shape[::-1], interpolation=cv2.INTER_AREA)
+
+    factors = np.array((width / img.shape[1], height / img.shape[0]), dtype=np.float32)
+    return img, factors
+
+
+class LoFTRMatcher(Matcher):
+    """Matches keypoints with the LoFTR transformer model
+
+    The images can optionally be downscaled before matching. Downscaling by
+    half cuts inference time roughly by four at the cost of keypoint
+    accuracy, which makes LoFTR usable on CPU-only hardware.
+
+    .. note::
+        Reference image backbone features are only cached with the ``kornia``
+        version pinned in ``setup.py`` because caching them relies on
+        ``kornia`` LoFTR internals (see :meth:`._forward`). With any other
+        version the matcher falls back to the public ``LoFTR`` forward pass
+        and encodes both images for every frame.
+    """
+
+    def __init__(
+        self,
+        device: Optional[str] = None,
+        scale: float = 1.0,
+        cache_size: int = 0,
+        precision: MatcherPrecision = "fp32",
+    ) -> None:
+        """Class initializer
+
+        :param device: Torch device to run the model on, or None to use CUDA if
+            available
+        :param scale: Image scaling factor applied before matching
+        :param cache_size: Maximum number of cached reference image backbone
+            features, ignored if the installed ``kornia`` version is not
+            supported by :meth:`._forward`
+        :param precision: Inference precision. ``int8`` dynamically quantizes
+            the transformer linear layers and is CPU only, ``fp16`` is CUDA
+            only.
+        :raise ValueError: If scale is not in range (0, 1], or precision is
+            not supported on the device
+        """
+        if not 0 < scale <= 1:
+            raise ValueError(f"LoFTR scale must be in range (0, 1] ({scale}).")
+
+        super().__init__(cache_size)
+
+        import kornia
+        import torch
+        from kornia.feature import LoFTR
+
+        self._cache_features = kornia.__version__ == _LOFTR_FORWARD_KORNIA_VERSION
+
+        if device is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self._device = torch.device(device)
+        self._scale = scale
+        self._model = LoFTR(pretrained="outdoor").eval()
+
+        if precision == "int8":
+            if self._device.type != "cpu":
+                raise ValueError(
+                    f"INT8 LoFTR inference is only supported on CPU, not on "
+                    f"{self._device}."
+                )
+            self._model = _quantize_dynamic(self._model)
+            self._dtype = torch.float32
+        elif precision == "fp16":
+            if self._device.type != "cuda":
+                raise ValueError(
+                    f"FP16 LoFTR inference is only supported on CUDA, not on "
+                    f"{self._device}. Use fp32 or int8 precision on CPU."
+                )
+            self._model = self._model.half()
+            self._dtype = torch.float16
+        elif precision == "fp32":
+            self._dtype = torch.float32
+        else:
+            raise ValueError(f"Unsupported inference precision: {precision}.")
+        self._model.to(self._device)
+
+    def _to_tensor(self, img: np.ndarray) -> Tuple["torch.Tensor", np.ndarray]:
+        """Returns the image as a normalized model input tensor, and the
+        factors for scaling the matched keypoints back to the original image
+        """
+        import torch
+
+        img, factors = _resize_for_loftr(img, self._scale)
+        tensor = torch.from_numpy(np.ascontiguousarray(img)).to(self._device)
+        return tensor[None, None].to(self._dtype) / 255.0, factors
+
+    def _encode_reference(
+        self, reference: np.ndarray
+    ) -> Tuple["torch.Tensor", "torch.Tensor", "torch.Size", np.ndarray]:
+        """Returns reference image coarse and fine backbone features, model
+        input size and keypoint scaling factors
+        """
+        import torch
+
+        tensor, scale = self._to_tensor(reference)
+        with torch.no_grad():
+            feat_c, feat_f = self._model.backbone(tensor)
+        return feat_c, feat_f, tensor.shape[2:], scale
+
+    @staticmethod
+    def _flatten(feat: "torch.Tensor") -> "torch.Tensor":
+        """Flattens feature map (N, C, H, W) into a sequence (N, H * W, C)"""
+        n, c = feat.shape[0:2]
+        return feat.permute(0, 2, 3, 1).reshape(n, -1, c)
+
+    def _forward(
+        self,
+        image0: "torch.Tensor",
+        feat_c1: "torch.Tensor",
+        feat_f1: "torch.Tensor",
+        hw1_i: "torch.Size",
+    ) -> Dict[str, "torch.Tensor"]:
+        """LoFTR forward pass with precomputed reference image backbone
+        features
+
+        Mirrors ``kornia.feature.LoFTR.forward`` of the ``kornia`` version
+        pinned in ``setup.py`` (see :data:`._LOFTR_FORWARD_KORNIA_VERSION`)
+        except that only the query image is run through the backbone. The
+        backbone is in eval mode so encoding the images separately gives the
+        same features as encoding them as a single batch.
+        """
+        model = self._model
+        feat_c0, feat_f0 = model.backbone(image0)
+
+        data = {
+            "bs": image0.size(0),
+            "hw0_i": image0.shape[2:],
+            "hw1_i": hw1_i,
+            "hw0_c": feat_c0.shape[2:],
+            "hw1_c": feat_c1.shape[2:],
+            "hw0_f": feat_f0.shape[2:],
+            "hw1_f": feat_f1.shape[2:],
+        }
+
+        # Coarse-level LoFTR module and matching
+        feat_c0 = self._flatten(model.pos_encoding(feat_c0))
+        feat_c1 = self._flatten(model.pos_encoding(feat_c1))
+        feat_c0, feat_c1 = model.loftr_coarse(feat_c0, feat_c1, None, None)
+        model.coarse_matching(feat_c0, feat_c1, data, mask_c0=None, mask_c1=None)
+
+        # Fine-level refinement and matching
+        feat_f0_unfold, feat_f1_unfold = model.fine_preprocess(
+            feat_f0, feat_f1, feat_c0, feat_c1, data
+        )
+        if feat_f0_unfold.size(0) != 0:
+            feat_f0_unfold, feat_f1_unfold = model.loftr_fine(
+                feat_f0_unfold, feat_f1_unfold
+            )
+        model.fine_matching(feat_f0_unfold, feat_f1_unfold, data)
+
+        return {
+            "keypoints0": data["mkpts0_f"],
+            "keypoints1": data["mkpts1_f"],
+            "confidence": data["mconf"],
+            "batch_indexes": data["b_ids"],
+        }
+
+    def match(self, query: np.ndarray, reference: np.ndarray) -> Matches:
+        """Returns matching keypoints between the images"""
+        return self.match_batch([(query, reference)])[0]
+
+    def match_batch(self, pairs: List[Tuple[np.ndarray, np.ndarray]]) -> List[Matches]:
+        """Returns matching keypoints for multiple image pairs in a single
+        forward pass per image resolution
+
+        Image pairs are batched by resolution because the model input must be
+        a single tensor. The matches are split back out per image pair using
+        the batch indexes returned by the model. Reference image backbone
+        features are read from the cache when available.
+        """
+        import torch
+
+        if not self._cache_features:
+            return [self._match_uncached(query, ref) for query, ref in pairs]
+
+        matches: List = [None] * len(pairs)
+
+        groups: Dict[tuple, List[int]] = {}
+        for i, (query, reference) in enumerate(pairs):
+            groups.setdefault((query.shape, reference.shape), []).append(i)
+
+        for indices in groups.values():
+            tensors0, feats_c1, feats_f1 = [], [], []
+            for i in indices:
+                query, reference = pairs[i]
+                tensor0, scale0 = self._to_tensor(query)
+                feat_c1, feat_f1, hw1_i, scale1 = self._reference_cache.get(
+                    reference, lambda: self._encode_reference(reference)
+                )
+                tensors0.append(tensor0)
+                feats_c1.append(feat_c1)
+                feats_f1.append(feat_f1)
+
+            with torch.no_grad():
+                results = self._forward(
+                    torch.cat(tensors0), torch.cat(feats_c1), torch.cat(feats_f1), hw1_i
+                )
+            results = {
+                key: value.cpu().numpy()
+                if key == "batch_indexes"
+                else value.float().cpu().numpy()
+                for key, value in results.items()
+            }
+
+            # Scale factors are the same for all pairs in the group
+            for batch_index, i in enumerate(indices):
+                mask = results["batch_indexes"] == batch_index
+                matches[i] = {
+                    "keypoints0": results["keypoints0"][mask] * scale0,
+                    "keypoints1": results["keypoints1"][mask] * scale1,
+                    "confidence": results["confidence"][mask],
+                }
+
+        return matches
+
+    def _match_uncached(self, query: np.ndarray, reference: np.ndarray) -> Matches:
+        """Returns matching keypoints between the images using the public
+        ``kornia`` LoFTR forward pass
+        """
+        import torch
+
+        tensor0, scale0 = self._to_tensor(query)
+        tensor1, scale1 = self._to_tensor(reference)
+        with torch.no_grad():
+            results = self._model({"image0": tensor0, "image1": tensor1})
+        return {
+            "keypoints0": results["keypoints0"].float().cpu().numpy() * scale0,
+            "keypoints1": results["keypoints1"].float().cpu().numpy() * scale1,
+            "confidence": results["confidence"].float().cpu().numpy(),
+        }
+
+
+def _export_pair(
+    shape0: Tuple[int, int], shape1: Tuple[int, int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns a correlated pair of normalized float32 images of shape
+    (1, 1, H, W) for tracing LoFTR
+
+    Tracing fixes the data-dependent branches of the ``kornia`` LoFTR forward
+    pass, such as skipping fine refinement when there are no coarse matches.
+    Unrelated noise images produce no coarse matches, so the traced graph
+    would never refine matches. The pair is a smooth random texture and a
+    slightly rotated and scaled copy of it, which produces plenty of coarse
+    matches.
+
+    :param shape0: First image shape (height, width)
+    :param shape1: Second image shape (height, width)
+    :return: Tuple of images
+    """
+    height, width = max(shape0[0], shape1[0]), max(shape0[1], shape1[1])
+    noise = np.random.default_rng(0).integers(
+        0, 255, size=(height // 8 + 1, width // 8 + 1), dtype=np.uint8
+    )
+    texture = cv2.GaussianBlur(
+        cv2.resize(noise, (width, height), interpolation=cv2.INTER_CUBIC), (0, 0), 1.5
+    )
+    matrix = cv2.getRotationMatrix2D((width / 2, height / 2), 5.0, 1.05)
+    warped = cv2.warpAffine(texture, matrix, (width, height))
+
+    def _crop(img: np.ndarray, shape: Tuple[int, int]) -> np.ndarray:
+        return (img[None, None, : shape[0], : shape[1]] / np.float32(255.0)).astype(
+            np.float32
+        )
+
+    return _crop(warped, shape0), _crop(texture, shape1)
+
+
+class ExportedLoFTRMatcher(Matcher):
+    """Matches keypoints with a LoFTR model exported to ONNX or TorchScript
+
+    The model is exported once per input image resolution and stored in the
+    model directory, so later runs skip the export and, with the ONNX engine,
+    do not import ``torch`` at all. The ONNX model runs on the ONNX Runtime
+    CPU execution provider.
+
+    Exporting a model takes from seconds to minutes, so models are exported
+    and loaded in a background thread. Image pairs are matched with an eager
+    :class:`.LoFTRMatcher` until the exported model for their resolution is
+    ready. Call :meth:`.prepare` with the expected image shape to start the
+    export before the first image pair arrives.
+
+    .. note::
+        The exported model runs the full LoFTR graph, so the reference image
+        features are not cached with this matcher.
+    """
+
+    def __init__(
+        self,
+        engine: MatcherEngine,
+        model_dir: str,
+        threads: int = 0,
+        scale: float = 1.0,
+        precision: MatcherPrecision = "fp32",
+    ) -> None:
+        """Class initializer
+
+        :param engine: Inference engine, ``torchscript`` or ``onnx``
+        :param model_dir: Directory for exported models, created if it does
+            not exist
+        :param threads: Number of intra-op threads, or 0 for the engine default.
+            The TorchScript engine only uses this many threads while running
+            the model and restores the process-wide ``torch`` setting
+            afterwards.
+        :param scale: Image scaling factor applied before matching
+        :param precision: Inference precision, ``fp32`` or ``int8``. ``int8``
+            dynamically quantizes the model linear layers after export (ONNX)
+            or before tracing (TorchScript).
+        :raise ValueError: If the engine or precision is not supported or scale
+            is not in range (0, 1]
+        """
+        if engine not in ("torchscript", "onnx"):
+            raise ValueError(f"Unsupported inference engine: {engine}.")
+        if precision not in ("fp32", "int8"):
+            raise ValueError(
+                f"Unsupported inference precision for {engine}: {precision}."
+            )
+        if not 0 < scale <= 1:
+            raise ValueError(f"LoFTR scale must be in range (0, 1] ({scale}).")
+
+        super().__init__(0)
+        self._engine = engine
+        self._precision = precision
+        self._model_dir = os.path.abspath(os.path.expanduser(model_dir))
+        self._threads = threads
+        self._scale = scale
+        self._models: Dict[tuple, Callable] = {}
+        # Models are exported and loaded in the background and may be prepared
+        # and run from different threads
+        self._models_lock = threading.Lock()
+        self._exports: Dict[tuple, Future] = {}
+        self._export_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="gisnav_loftr_export"
+        )
+        # Eager matcher used until the exported models are ready, created
+        # only when needed
+        self._eager: Optional[LoFTRMatcher] = None
+
+        os.makedirs(self._model_dir, exist_ok=True)
+
+    def _model_path(self, shape0: tuple, shape1: tuple) -> str:
+        """Returns exported model file path for the input image shapes"""
+        suffix = ".onnx" if self._engine == "onnx" else ".pt"
+        shapes = "_".join(f"{shape[0]}x{shape[1]}" for shape in (shape0, shape1))
+        return os.path.join(
+            self._model_dir, f"loftr_outdoor_{shapes}_{self._precision}{suffix}"
+        )
+
+    @staticmethod
+    def _export(
+        path: str, engine: str, precision: str, shape0: tuple, shape1: tuple
+    ) -> None:
+        """Exports LoFTR with fixed input shapes to the given path"""
+        import torch
+        from kornia.feature import LoFTR
+
+        class _LoFTRWrapper(torch.nn.Module):
+            """Exposes LoFTR with tensor inputs and outputs for export"""
+
+            def __init__(self):
+                super().__init__()
+                self.model = LoFTR(pretrained="outdoor").eval()
+
+            def forward(self, image0, image1):
+                results = self.model({"image0": image0, "image1": image1})
+                return (
+                    results["keypoints0"],
+                    results["keypoints1"],
+                    results["confidence"],
+                )
+
+        model = _LoFTRWrapper()
+        if engine == "torchscript" and precision == "int8":
+            model = _quantize_dynamic(model)
+        inputs = tuple(torch.from_numpy(img) for img in _export_pair(shape0, shape1))
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with torch.no_grad():
+            if engine == "onnx":
+                outputs = ("keypoints0", "keypoints1", "confidence")
+                torch.onnx.export(
+                    model,
+                    inputs,
+                    tmp_path,
+                    input_names=["image0", "image1"],
+                    output_names=list(outputs),
+                    dynamic_axes={name: {0: "matches"} for name in outputs},
+                    opset_version=17,
+                )
+            else:
+                torch.jit.trace(model, inputs, check_trace=False).save(tmp_path)
+
+        if engine == "onnx" and precision == "int8":
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            fp32_path = tmp_path
+            tmp_path = f"{path}.{os.getpid()}.int8.tmp"
+            quantize_dynamic(fp32_path, tmp_path, weight_type=QuantType.QInt8)
+            os.remove(fp32_path)
+
+        os.replace(tmp_path, path)
+
+    def _load(self, path: str) -> Callable:
+        """Returns a callable running the exported model on normalized float32
+        images of shape (1, 1, H, W)
+        """
+        if self._engine == "onnx":
+            import onnxruntime
+
+            options = onnxruntime.SessionOptions()
+            if self._threads > 0:
+                options.intra_op_num_threads = self._threads
+            session = onnxruntime.InferenceSession(
+                path, options, providers=["CPUExecutionProvider"]
+            )
+            return lambda image0, image1: session.run(
+                None, {"image0": image0, "image1": image1}
+            )
+        else:
+            import torch
+
+            model = torch.jit.load(path, map_location="cpu")
+
+            def _run(image0, image1):
+                threads = torch.get_num_threads()
+                if self._threads > 0:
+                    torch.set_num_threads(self._threads)
+                try:
+                    with torch.no_grad():
+                        outputs = model(
+                            torch.from_numpy(image0), torch.from_numpy(image1)
+                        )
+                finally:
+                    torch.set_num_threads(threads)
+                return [output.numpy() for output in outputs]
+
+            return _run
+
+    def _export_and_load(self, key: tuple) -> None:
+        """Exports the model for the input shapes if needed and loads it"""
+        path = self._model_path(*key)
+        if not os.path.isfile(path):
+            _logger.info(f"Exporting LoFTR {self._engine} model to {path}.")
+            self._export(path, self._engine, self._precision, *key)
+        model = self._load(path)
+        with self._models_lock:
+            self._models[key] = model
+
+    @staticmethod
+    def _log_export_error(future: Future) -> None:
+        """Logs a failed background export"""
+        if not future.cancelled() and future.exception() is not None:
+            _logger.error(
+                f"Could not export LoFTR model, using eager mode instead: "
+                f"{future.exception()}"
+            )
+
+    def _get_model(self, shape0: tuple, shape1: tuple) -> Optional[Future]:
+        """Returns the background export of the model for the input shapes,
+        starting it if needed
+
+        :return: Future that is done when the model is ready
+        """
+        key = (shape0, shape1)
+        with self._models_lock:
+            future = self._exports.get(key)
+            if future is None:
+                future = self._export_executor.submit(self._export_and_load, key)
+                future.add_done_callback(self._log_export_error)
+                self._exports[key] = future
+            return future
+
+    def prepare(self, shape: Tuple[int, int], wait: bool = False) -> None:
+        """Starts exporting and loading the model for query and reference
+        images of given shape if not done yet
+
+        :param shape: Query and reference image shape (height, width)
+        :param wait: True to block until the model is ready
+        :raise Exception: If waiting and the export or loading fails
+        """
+        shape = _loftr_shape(shape, self._scale)
+        future = self._get_model(shape, shape)
+        if wait:
+            future.result()
+
+    def _match_eager(self, query: np.ndarray, reference: np.ndarray) -> Matches:
+        """Returns matching keypoints between the images using the eager
+        matcher while the exported model is not ready
+        """
+        with self._models_lock:
+            if self._eager is None:
+                self._eager = LoFTRMatcher(
+                    device="cpu", scale=self._scale, precision=self._precision
+                )
+            eager = self._eager
+        return eager.match(query, reference)
+
+    def match(self, query: np.ndarray, reference: np.ndarray) -> Matches:
+        """Returns matching keypoints between the images
+
+        Starts exporting the model in the background on the first call for a
+        new input resolution unless it was already prepared with
+        :meth:`.prepare`, and matches with the eager matcher until the model
+        is ready.
+        """
+        resized_query, scale0 = _resize_for_loftr(query, self._scale)
+        resized_reference, scale1 = _resize_for_loftr(reference, self._scale)
+        key = (resized_query.shape, resized_reference.shape)
+        self._get_model(*key)
+        with self._models_lock:
+            model = self._models.get(key)
+            if model is not None and all(f.done() for f in self._exports.values()):
+                self._eager = None  # Release the eager model
+        if model is None:
+            return self._match_eager(query, reference)
+        query, reference = resized_query, resized_reference
+
+        keypoints0, keypoints1, confidence = model(
+            (query[None, None] / np.float32(255.0)).astype(np.float32),
+            (reference[None, None] / np.float32(255.0)).astype(np.float32),
+        )
+        return {
+            "keypoints0": keypoints0 * scale0,
+            "keypoints1": keypoints1 * scale1,
+            "confidence": confidence,
+        }
+
+
+class OpenCVMatcher(Matcher):
+    """Matches binary ORB or AKAZE features with a FLANN based matcher
+
+    Much faster than :class:`.LoFTRMatcher` on CPU but less robust to
+    appearance differences between the query and reference images.
+
+    Confidence is derived from Lowe's ratio test: a ratio ``r`` between the
+    best and second best match distances maps to confidence ``1 - 0.4 * r``, so
+    that the commonly used ratio threshold 0.75 maps to the
+    :attr:`.PoseNode.CONFIDENCE_THRESHOLD` of 0.7.
+    """
+
+    _RATIO_CONFIDENCE_SLOPE: Final = 0.4
+    """Slope of the linear mapping from ratio test ratio to confidence"""
+
+    _MAX_FEATURES: Final = 2000
+    """Maximum number of ORB features per image"""
+
+    _FLANN_INDEX_LSH: Final = 6
+    """FLANN locality sensitive hashing index for binary descriptors"""
+
+    def __init__(self, detector: Literal["orb", "akaze"], cache_size: int = 0) -> None:
+        """Class initializer
+
+        :param detector: Feature detector and descriptor to use
+        :param cache_size: Maximum number of cached reference image keypoints
+            and trained FLANN indices
+        :raise ValueError: If the detector is not supported
+        """
+        super().__init__(cache_size)
+        if detector == "orb":
+            self._detector = cv2.ORB_create(nfeatures=self._MAX_FEATURES)
+        elif detector == "akaze":
+            if not hasattr(cv2, "AKAZE_create"):
+                # Moved out of the main OpenCV modules in OpenCV 5
+                raise ValueError("AKAZE is not available in this OpenCV build.")
+            self._detector = cv2.AKAZE_create()
+        else:
+            raise ValueError(f"Unsupported feature detector: {detector}.")
+
+    def _encode_reference(
+        self, reference: np.ndarray
+    ) -> Tuple[np.ndarray, Optional[cv2.FlannBasedMatcher]]:
+        """Returns reference image keypoint coordinates and a FLANN matcher
+        trained on the reference image descriptors, or None if there are not
+        enough descriptors
+        """
+        kp1, desc1 = self._detector.detectAndCompute(reference, None)
+        if desc1 is None or len(kp1) < 2:
+            return np.empty((0, 2), dtype=np.float32), None
+
+        matcher = cv2.FlannBasedMatcher(
+            dict(
+                algorithm=self._FLANN_INDEX_LSH,
+                table_number=6,
+                key_size=12,
+                multi_probe_level=1,
+            ),
+            dict(checks=50),
+        )
+        matcher.add([desc1])
+        matcher.train()
+        return np.array([kp.pt for kp in kp1], dtype=np.float32), matcher
+
+    def match(self, query: np.ndarray, reference: np.ndarray) -> Matches:
+        """Returns matching keypoints between the images"""
+        kp0, desc0 = self._detector.detectAndCompute(query, None)
+        kp1, matcher = self._reference_cache.get(
+            reference, lambda: self._encode_reference(reference)
+        )
+
+        empty: Matches = {
+            "keypoints0": np.empty((0, 2), dtype=np.float32),
+            "keypoints1": np.empty((0, 2), dtype=np.float32),
+            "confidence": np.empty((0,), dtype=np.float32),
+        }
+        if desc0 is None or matcher is None or len(kp0) < 2:
+            return empty
+
+        # LSH may return fewer than two neighbors for some descriptors
+        knn_matches = [m for m in matcher.knnMatch(desc0, k=2) if len(m) == 2]
+        if len(knn_matches) == 0:
+            return empty
+
+        ratio = np.array(
+            [m.distance / max(n.distance, 1e-6) for m, n in knn_matches],
+            dtype=np.float32,
+        )
+        return {
+            "keypoints0": np.array(
+                [kp0[m.queryIdx].pt for m, _ in knn_matches], dtype=np.float32
+            ),
+            "keypoints1": kp1[[m.trainIdx for m, _ in knn_matches]],
+            "confidence": np.clip(1.0 - self._RATIO_CONFIDENCE_SLOPE * ratio, 0, 1),
+        }
+
+
+def create_matcher(
+    name: MatcherName,
+    scale: float = 0.5,
+    cache_size: int = 0,
+    engine: MatcherEngine = "eager",
+    threads: int = 0,
+    model_dir: str = "~/.cache/gisnav/models",
+    precision: MatcherPrecision = "fp32",
+) -> Matcher:
+    """Returns a keypoint matcher backend
+
+    :param name: Matcher backend name
+    :param scale: Image scaling factor for the ``loftr_downscaled`` backend
+    :param cache_size: Maximum number of cached reference image features
+    :param engine: Inference engine for the LoFTR backends, ``eager`` runs
+        the model in PyTorch eager mode
+    :param threads: Number of intra-op threads for the exported LoFTR
+        backends, or 0 for the engine default
+    :param model_dir: Directory for exported LoFTR models
+    :param precision: Inference precision for the LoFTR backends
+    :return: Matcher instance
+    :raise ValueError: If the matcher name or engine is not supported
+    """
+    if name in ("loftr", "loftr_downscaled"):
+        loftr_scale = scale if name == "loftr_downscaled" else 1.0
+        if engine == "eager":
+            return LoFTRMatcher(
+                scale=loftr_scale, cache_size=cache_size, precision=precision
+            )
+        return ExportedLoFTRMatcher(engine, model_dir, threads, loftr_scale, precision)
+    elif name in ("orb", "akaze"):
+        return OpenCVMatcher(name, cache_size)
+    else:
+        raise ValueError(f"Unsupported keypoint matcher: {name}.")
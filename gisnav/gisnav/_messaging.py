@@ -1,21 +1,65 @@
 """Helper functions for ROS messaging"""
-from collections import namedtuple
-from typing import Optional
+import array
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Dict, Final, Optional, Tuple
 
 import cv2
 import numpy as np
 import rclpy.time
 import tf2_ros
+from builtin_interfaces.msg import Time
 from geographic_msgs.msg import BoundingBox
 from geometry_msgs.msg import Quaternion, TransformStamped
+from pyproj import Transformer
 from rclpy.node import Node
-from sensor_msgs.msg import TimeReference
+from sensor_msgs.msg import Image, TimeReference
 from std_msgs.msg import Header
 
 from .constants import FrameID
 
 BBox = namedtuple("BBox", "left bottom right top")
 
+_IMAGE_ENCODINGS: Final = {
+    "mono8": (np.uint8, 1),
+    "mono16": (np.uint16, 1),
+    "bgr8": (np.uint8, 3),
+    "rgb8": (np.uint8, 3),
+    "bgra8": (np.uint8, 4),
+    "rgba8": (np.uint8, 4),
+    **{
+        f"{depth}C{channels}": (dtype, channels)
+        for depth, dtype in (
+            ("8U", np.uint8),
+            ("8S", np.int8),
+            ("16U", np.uint16),
+            ("16S", np.int16),
+            ("32S", np.int32),
+            ("32F", np.float32),
+            ("64F", np.float64),
+        )
+        for channels in (1, 2, 3, 4)
+    },
+}
+"""Supported :class:`sensor_msgs.msg.Image` encodings and their NumPy dtypes
+and channel counts"""
+
+_MONO8_CONVERSIONS: Final = {
+    "bgr8": cv2.COLOR_BGR2GRAY,
+    "rgb8": cv2.COLOR_RGB2GRAY,
+    "bgra8": cv2.COLOR_BGRA2GRAY,
+    "rgba8": cv2.COLOR_RGBA2GRAY,
+}
+"""OpenCV color conversion codes for converting color images to ``mono8``"""
+
+_transformers = threading.local()
+"""Thread-local :class:`pyproj.Transformer` cache for :func:`.get_transformer`
+
+Transformers are cached per thread because they must not be shared between
+threads.
+"""
+
 
 def create_header(
     node: Node, frame_id: str = "", time_reference: Optional[TimeReference] = None
@@ -96,6 +140,98 @@ def bounding_box_to_bbox(msg: BoundingBox) -> BBox:
     )
 
 
+def image_to_array(msg: Image, desired_encoding: str = "passthrough") -> np.ndarray:
+    """Returns :class:`sensor_msgs.msg.Image` data as a NumPy array
+
+    Replaces ``CvBridge.imgmsg_to_cv2``. The returned array is a view into the
+    message data buffer (no copy) unless the byte order must be swapped, row
+    padding must be removed, or a color image is converted to ``mono8``.
+
+    :param msg: Image message
+    :param desired_encoding: ``passthrough`` to keep the message encoding, or
+        ``mono8`` to convert color images to grayscale
+    :return: Image array of shape (height, width) for single channel images or
+        (height, width, channels) otherwise
+    :raise ValueError: If the encoding is not supported
+    """
+    if msg.encoding not in _IMAGE_ENCODINGS:
+        raise ValueError(f"Unsupported image encoding: {msg.encoding}.")
+
+    dtype, channels = _IMAGE_ENCODINGS[msg.encoding]
+    dtype = np.dtype(dtype).newbyteorder(">" if msg.is_bigendian else "<")
+
+    # Row stride may include padding so view rows first, then crop to width
+    rows = np.frombuffer(msg.data, dtype=np.uint8).reshape(msg.height, msg.step)
+    row_bytes = msg.width * channels * dtype.itemsize
+    if row_bytes != msg.step:
+        rows = np.ascontiguousarray(rows[:, :row_bytes])
+    img = rows.view(dtype).reshape(msg.height, msg.width, channels)
+
+    if not dtype.isnative:
+        img = img.astype(dtype.newbyteorder("="))
+    if channels == 1:
+        img = img[:, :, 0]
+
+    if desired_encoding == "passthrough" or desired_encoding == msg.encoding:
+        return img
+    elif desired_encoding == "mono8":
+        if msg.encoding in ("8UC1", "mono8"):
+            return img
+        elif msg.encoding in _MONO8_CONVERSIONS:
+            return cv2.cvtColor(img, _MONO8_CONVERSIONS[msg.encoding])
+
+    raise ValueError(
+        f"Cannot convert image encoding {msg.encoding} to {desired_encoding}."
+    )
+
+
+def array_to_image(img: np.ndarray, encoding: Optional[str] = None) -> Image:
+    """Returns a :class:`sensor_msgs.msg.Image` for a NumPy array
+
+    Replaces ``CvBridge.cv2_to_imgmsg``. The array is copied into the message
+    data buffer exactly once (``CvBridge`` copies it twice).
+
+    :param img: Image array of shape (height, width) or (height, width,
+        channels)
+    :param encoding: Image encoding, or None to use a generic OpenCV style
+        encoding (e.g. ``8UC3``) like ``CvBridge`` ``passthrough``
+    :return: Image message with an empty header
+    :raise ValueError: If the array does not match the encoding
+    """
+    channels = 1 if img.ndim == 2 else img.shape[2]
+    if encoding is None:
+        encoding = next(
+            (
+                name
+                for name, (dtype, n) in _IMAGE_ENCODINGS.items()
+                if "C" in name and n == channels and np.dtype(dtype) == img.dtype
+            ),
+            None,
+        )
+    if encoding not in _IMAGE_ENCODINGS or (
+        np.dtype(_IMAGE_ENCODINGS[encoding][0]),
+        _IMAGE_ENCODINGS[encoding][1],
+    ) != (img.dtype, channels):
+        raise ValueError(
+            f"Cannot encode array of dtype {img.dtype} with {channels} channels "
+            f"as {encoding}."
+        )
+
+    img = np.ascontiguousarray(img)
+    msg = Image()
+    msg.height, msg.width = img.shape[0:2]
+    msg.encoding = encoding
+    msg.is_bigendian = img.dtype.byteorder == ">" or (
+        img.dtype.byteorder == "=" and sys.byteorder == "big"
+    )
+    msg.step = msg.width * channels * img.dtype.itemsize
+
+    data = array.array("B")
+    data.frombytes(memoryview(img).cast("B"))
+    msg.data = data
+    return msg
+
+
 def create_transform_msg(
     stamp,
     parent_frame: FrameID,
@@ -163,23 +299,327 @@ def get_transform(
         return None
 
 
-def visualize_transform(transform, image, height, title):
-    """Shows transform translation x and y position on image"""
-    t = np.array(
+def compose_transforms(
+    parent: TransformStamped, child: TransformStamped
+) -> TransformStamped:
+    """Returns the transform from the child frame of ``child`` to the parent
+    frame of ``parent``
+
+    The child frame of ``parent`` must be the parent frame of ``child``.
+
+    :param parent: Transform from an intermediate frame to the target frame
+    :param child: Transform from the source frame to the intermediate frame
+    :return: Transform from the source frame to the target frame, stamped with
+        the ``parent`` timestamp
+    """
+    assert parent.child_frame_id == child.header.frame_id
+
+    def _quaternion(q: Quaternion) -> np.ndarray:
+        return np.array((q.x, q.y, q.z, q.w))
+
+    x1, y1, z1, w1 = _quaternion(parent.transform.rotation)
+    x2, y2, z2, w2 = _quaternion(child.transform.rotation)
+    q = (
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+    )
+
+    # Rotate the child translation into the target frame
+    u = np.array((x1, y1, z1))
+    v = np.array(
         (
-            transform.transform.translation.x,
-            transform.transform.translation.y,
-            transform.transform.translation.z,
+            child.transform.translation.x,
+            child.transform.translation.y,
+            child.transform.translation.z,
         )
     )
-    # current image timestamp does not yet have the transform but this should
-    # get the previous one
-    x, y = int(t[0]), int(
-        height - t[1]
-    )  # move height origin from bottom to top left for cv2
-    image = cv2.circle(np.array(image), (x, y), 5, (0, 255, 0), -1)
-    cv2.imshow(title, image)
-    cv2.waitKey(1)
+    t = 2.0 * np.cross(u, v)
+    rotated = v + w1 * t + np.cross(u, t)
+    translation = rotated + np.array(
+        (
+            parent.transform.translation.x,
+            parent.transform.translation.y,
+            parent.transform.translation.z,
+        )
+    )
+
+    return create_transform_msg(
+        parent.header.stamp,
+        parent.header.frame_id,
+        child.child_frame_id,
+        q,
+        translation,
+    )
+
+
+class GeotransformRegistry:
+    """Bounded registry of :term:`orthoimage` geotransforms indexed by the
+    orthoimage timestamp
+
+    Holds the affine transformations of the last few orthoimages in least
+    recently used order so that a :term:`pose` estimated against an older
+    orthoimage can still be georeferenced with the geotransform of that
+    orthoimage. Lookups are O(1).
+
+    Geotransforms of orthoimages that are older than a time horizon relative to
+    the latest registered orthoimage are expired on registration, so that
+    superseded geotransforms do not linger over a long mission even if the
+    registry never fills up. The latest geotransform is never expired.
+
+    The registry is thread-safe.
+    """
+
+    def __init__(self, max_size: int, horizon: float = 0.0) -> None:
+        """Class initializer
+
+        :param max_size: Maximum number of registered geotransforms
+        :param horizon: Maximum age in seconds of a registered geotransform
+            relative to the latest registered geotransform, or 0 to expire
+            geotransforms by size only
+        :raise ValueError: If max size is not positive or horizon is negative
+        """
+        self._validate(max_size, horizon)
+        self._lock = threading.Lock()
+        self._latest_ns: Optional[int] = None
+        self._geotransforms: "OrderedDict[Tuple[int, int], np.ndarray]" = OrderedDict()
+        self._max_size = max_size
+        self._horizon_ns = int(horizon * 1e9)
+        self._configured = False
+
+    @staticmethod
+    def _validate(max_size: int, horizon: float) -> None:
+        """Raises ValueError if max size is not positive or horizon is
+        negative
+        """
+        if max_size <= 0:
+            raise ValueError(f"Registry size must be positive ({max_size}).")
+        if horizon < 0:
+            raise ValueError(f"Registry horizon must not be negative ({horizon}).")
+
+    def configure(self, max_size: int, horizon: float) -> None:
+        """Changes the registry bounds on the first call, and raises them to
+        at least the given bounds on later calls
+
+        The registry may be shared by several nodes (see
+        :data:`.geotransform_registry`), so after the first call the bounds
+        are only ever increased and the registry holds at least as many
+        geotransforms as every node configured it to. A horizon of 0 is the
+        largest horizon.
+
+        :param max_size: Maximum number of registered geotransforms
+        :param horizon: Maximum age in seconds of a registered geotransform
+            relative to the latest registered geotransform, or 0 to expire
+            geotransforms by size only
+        :raise ValueError: If max size is not positive or horizon is negative
+        """
+        self._validate(max_size, horizon)
+        horizon_ns = int(horizon * 1e9)
+        with self._lock:
+            if not self._configured:
+                self._configured = True
+                self._max_size = max_size
+                self._horizon_ns = horizon_ns
+                self._expire()
+                return None
+
+            self._max_size = max(self._max_size, max_size)
+            if self._horizon_ns > 0:
+                self._horizon_ns = (
+                    max(self._horizon_ns, horizon_ns) if horizon_ns > 0 else 0
+                )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._geotransforms)
+
+    def put(self, stamp: Time, geotransform: np.ndarray) -> None:
+        """Registers a geotransform, expiring geotransforms older than the
+        horizon and evicting the least recently used geotransform if the
+        registry is full
+
+        :param stamp: Orthoimage timestamp
+        :param geotransform: Geotransform affine matrix of shape (4, 4)
+        """
+        key = (stamp.sec, stamp.nanosec)
+        with self._lock:
+            self._geotransforms[key] = geotransform
+            self._geotransforms.move_to_end(key)
+
+            stamp_ns = self._to_nanoseconds(key)
+            if self._latest_ns is None or stamp_ns > self._latest_ns:
+                self._latest_ns = stamp_ns
+            self._expire()
+
+    def _expire(self) -> None:
+        """Expires geotransforms older than the horizon and evicts least
+        recently used geotransforms until the registry is within its size
+
+        Must be called with the lock held.
+        """
+        if self._horizon_ns > 0 and self._latest_ns is not None:
+            oldest_ns = self._latest_ns - self._horizon_ns
+            for expired in [
+                k for k in self._geotransforms if self._to_nanoseconds(k) < oldest_ns
+            ]:
+                del self._geotransforms[expired]
+
+        while len(self._geotransforms) > self._max_size:
+            self._geotransforms.popitem(last=False)
+
+    @staticmethod
+    def _to_nanoseconds(key: Tuple[int, int]) -> int:
+        """Returns a (sec, nanosec) key as integer nanoseconds"""
+        return key[0] * 1_000_000_000 + key[1]
+
+    def get(self, stamp: Time) -> Optional[np.ndarray]:
+        """Returns the geotransform for an orthoimage timestamp
+
+        :param stamp: Orthoimage timestamp
+        :return: Geotransform affine matrix of shape (4, 4), or None if not
+            registered or already evicted
+        """
+        key = (stamp.sec, stamp.nanosec)
+        with self._lock:
+            geotransform = self._geotransforms.get(key)
+            if geotransform is not None:
+                self._geotransforms.move_to_end(key)
+            return geotransform
+
+
+GEOTRANSFORM_REGISTRY_SIZE: Final = 32
+"""Default maximum number of geotransforms in :data:`.geotransform_registry`"""
+
+GEOTRANSFORM_REGISTRY_HORIZON: Final = 60.0
+"""Default maximum age in seconds of a geotransform in
+:data:`.geotransform_registry` relative to the latest registered geotransform
+"""
+
+geotransform_registry: Final = GeotransformRegistry(
+    GEOTRANSFORM_REGISTRY_SIZE, GEOTRANSFORM_REGISTRY_HORIZON
+)
+"""Process-wide :class:`.GeotransformRegistry` shared by all nodes
+
+Nodes in the same process (see :func:`.run_container`) share the entries
+registered by :class:`.GISNode` directly. Nodes in other processes register
+the geotransforms they receive over the :attr:`.GISNode.geotransform` topic.
+
+The nodes that use the registry configure its bounds from their
+``geotransform_registry_size`` and ``geotransform_registry_horizon``
+:term:`ROS` parameters on initialization. :meth:`.GeotransformRegistry.configure`
+only ever increases the bounds, so the registry in a process holds at least as
+many geotransforms as any node in it needs, regardless of the order the nodes
+are initialized in.
+"""
+
+
+def register_geotransform(node: Node, msg: Image) -> None:
+    """Decodes a :attr:`.GISNode.geotransform` message and registers it in
+    the :data:`.geotransform_registry` so that it can be looked up by the
+    :term:`orthoimage` timestamp
+
+    Logs an error and registers nothing if the message cannot be decoded.
+
+    :param node: Node that received the message
+    :param msg: Geotransform message encoded with :func:`.geotransform_to_image`
+    """
+    try:
+        M = image_to_geotransform(msg)
+    except ValueError as e:
+        node.get_logger().error(f"Could not unpack geotransform: {e}")
+        return None
+    geotransform_registry.put(msg.header.stamp, M)
+
+
+def geotransform_to_image(geotransform: np.ndarray, header: Header) -> Image:
+    """Encodes a geotransform as a compact single channel ``64FC1``
+    :class:`sensor_msgs.msg.Image`
+
+    :param geotransform: Geotransform affine matrix of shape (4, 4)
+    :param header: Message header, the stamp must be the orthoimage timestamp
+    :return: Image message
+    """
+    msg = array_to_image(np.asarray(geotransform, dtype=np.float64))
+    msg.header = header
+    return msg
+
+
+def image_to_geotransform(msg: Image) -> np.ndarray:
+    """Decodes a geotransform encoded with :func:`.geotransform_to_image`
+
+    :param msg: Image message
+    :return: Geotransform affine matrix of shape (4, 4)
+    :raise ValueError: If the message is not a 4x4 ``64FC1`` image
+    """
+    if msg.encoding != "64FC1" or (msg.height, msg.width) != (4, 4):
+        raise ValueError(
+            f"Expected 4x4 64FC1 geotransform, got {msg.height}x{msg.width} "
+            f"{msg.encoding}."
+        )
+    return image_to_array(msg)
+
+
+def get_transformer(source_crs: str, target_crs: str) -> Transformer:
+    """Returns a cached :class:`pyproj.Transformer` between two :term:`CRS`
+
+    Building the CRS objects is by far the most expensive part of a coordinate
+    transformation, so transformers are built once per CRS pair and thread
+    and then reused. The cache is unbounded but there are only a few CRS pairs
+    in practice (one per UTM zone and vertical datum).
+
+    :param source_crs: Source CRS in a format accepted by
+        :meth:`pyproj.Transformer.from_crs`, e.g. ``EPSG:4326``
+    :param target_crs: Target CRS
+    :return: Transformer with longitude, latitude (x, y) axis order
+    """
+    cache: Optional[Dict[Tuple[str, str], Transformer]] = getattr(
+        _transformers, "cache", None
+    )
+    if cache is None:
+        cache = _transformers.cache = {}
+
+    key = (source_crs, target_crs)
+    transformer = cache.get(key)
+    if transformer is None:
+        transformer = Transformer.from_crs(source_crs, target_crs, always_xy=True)
+        cache[key] = transformer
+    return transformer
+
+
+def utm_crs(longitude: float, latitude: float) -> str:
+    """Returns the :term:`WGS 84` UTM zone :term:`CRS` for a location
+
+    :param longitude: Longitude in decimal degrees
+    :param latitude: Latitude in decimal degrees
+    :return: EPSG code string of the UTM zone
+    """
+    zone = min(int((longitude + 180) / 6) + 1, 60)
+    return f"EPSG:{32600 if latitude >= 0 else 32700}{zone:02d}"
+
+
+def enu_to_latlon(
+    enu: np.ndarray, longitude: float, latitude: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Converts :term:`ENU` offsets from a :term:`WGS 84` origin to longitude
+    and latitude
+
+    The offsets are added to the origin in its UTM zone, so the
+    conversion is accurate for offsets that are small compared to the zone
+    width.
+
+    :param enu: Array of shape (N, 2) of east and north offsets in meters
+    :param longitude: Origin longitude in decimal degrees
+    :param latitude: Origin latitude in decimal degrees
+    :return: Tuple of longitude and latitude arrays of shape (N,)
+    """
+    utm = utm_crs(longitude, latitude)
+    origin_x, origin_y = get_transformer("EPSG:4326", utm).transform(
+        longitude, latitude
+    )
+    return get_transformer(utm, "EPSG:4326").transform(
+        origin_x + enu[:, 0], origin_y + enu[:, 1]
+    )
 
 
 def extract_yaw(q: Quaternion) -> float:
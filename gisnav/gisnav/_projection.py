@@ -0,0 +1,118 @@
+"""Vectorized projection of :term:`camera` rays onto the ground
+
+Rays are computed once per set of camera intrinsics and projected in a single
+batched ray-plane intersection instead of point by point.
+"""
+from typing import Final, Optional, Tuple
+
+import numpy as np
+from sensor_msgs.msg import CameraInfo
+
+FOV_POINTS: Final = 5
+"""Number of :term:`FOV` rays at the start of :class:`.CameraRays` output:
+top-left, top-right, bottom-right and bottom-left corner, and principal point
+"""
+
+
+def fov_image_points(width: int, height: int) -> np.ndarray:
+    """Returns :term:`FOV` corner and principal point pixel coordinates
+
+    :param width: Image width in pixels
+    :param height: Image height in pixels
+    :return: Array of shape (5, 2) in order top-left, top-right, bottom-right,
+        bottom-left, principal point
+    """
+    return np.array(
+        [
+            [0, 0],
+            [width - 1, 0],
+            [width - 1, height - 1],
+            [0, height - 1],
+            [width / 2, height / 2],
+        ],
+        dtype=np.float64,
+    )
+
+
+def grid_image_points(width: int, height: int, size: int) -> np.ndarray:
+    """Returns pixel coordinates of an evenly spaced grid covering the image
+
+    :param width: Image width in pixels
+    :param height: Image height in pixels
+    :param size: Number of grid points per image side, at least 2
+    :return: Array of shape (size * size, 2) in row-major order, including
+        the image corners
+    """
+    u, v = np.meshgrid(
+        np.linspace(0, width - 1, size), np.linspace(0, height - 1, size)
+    )
+    return np.column_stack((u.ravel(), v.ravel()))
+
+
+class CameraRays:
+    """Camera frame ray directions for :term:`FOV` and grid image points,
+    cached per :class:`sensor_msgs.msg.CameraInfo` intrinsics
+
+    The intrinsics matrix is inverted only when the camera info changes.
+    """
+
+    def __init__(self, grid_size: int = 0) -> None:
+        """Class initializer
+
+        :param grid_size: Number of grid rays per image side appended after the
+            :term:`FOV` rays, or 0 for no grid
+        :raise ValueError: If grid size is 1 or negative
+        """
+        if grid_size < 0 or grid_size == 1:
+            raise ValueError(f"Grid size must be 0 or at least 2 ({grid_size}).")
+        self._grid_size = grid_size
+        self._key: Optional[Tuple] = None
+        self._rays: Optional[np.ndarray] = None
+
+    def __call__(self, camera_info: CameraInfo) -> np.ndarray:
+        """Returns ray directions for the camera
+
+        :param camera_info: Camera info with intrinsics and image size
+        :return: Array of shape (:data:`.FOV_POINTS` + grid size ** 2, 3) of
+            unnormalized ray directions in the camera frame, grid rays in
+            row-major order after the FOV rays
+        :raise numpy.linalg.LinAlgError: If the intrinsics matrix is singular
+        """
+        key = (tuple(camera_info.k), camera_info.width, camera_info.height)
+        if key != self._key or self._rays is None:
+            k_inv = np.linalg.inv(np.asarray(camera_info.k).reshape((3, 3)))
+            points = fov_image_points(camera_info.width, camera_info.height)
+            if self._grid_size > 0:
+                points = np.vstack(
+                    (
+                        points,
+                        grid_image_points(
+                            camera_info.width, camera_info.height, self._grid_size
+                        ),
+                    )
+                )
+            points_h = np.column_stack((points, np.ones(len(points))))
+            self._rays = points_h @ k_inv.T
+            self._key = key
+        return self._rays
+
+
+def intersect_plane(
+    rays: np.ndarray, rotation: np.ndarray, position: np.ndarray, z: float = 0.0
+) -> np.ndarray:
+    """Intersects camera rays with a horizontal plane
+
+    Rays that are parallel to or point away from the plane produce
+    intersections behind the camera or non-finite values.
+
+    :param rays: Array of shape (N, 3) of camera frame ray directions
+    :param rotation: Camera to world frame rotation matrix of shape (3, 3)
+    :param position: Camera position in the world frame of shape (3,)
+    :param z: Plane height in the world frame
+    :return: Array of shape (N, 2) of intersection x and y coordinates in the
+        world frame
+    """
+    directions = rays @ rotation.T
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (z - position[2]) / directions[:, 2]
+    return position[:2] + t[:, None] * directions[:, :2]
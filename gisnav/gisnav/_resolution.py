@@ -0,0 +1,132 @@
+"""Adaptive input resolution for keypoint matching
+
+Matching cost grows with the pixel count of the :term:`query` and
+:term:`reference` images. :class:`.ResolutionController` downsamples both images
+to a pixel budget and adjusts the budget from the measured matching latency so
+that a fixed :term:`pose` rate can be held across :term:`cameras <camera>` of
+different resolutions.
+"""
+import math
+from typing import Final, Tuple
+
+import cv2
+import numpy as np
+
+_SCALE_STEPS_PER_OCTAVE: Final = 4
+"""Number of discrete scaling factors per halving of image side length
+
+Scaling factors are quantized so that the matcher only sees a small set of
+input shapes. The exported LoFTR engines export a model per input shape.
+"""
+
+
+class ResolutionController:
+    """Downsamples image pairs to a pixel budget and adapts the budget to a
+    latency deadline
+
+    The budget is updated after every match assuming that latency is
+    proportional to the number of matched pixels. Updates are exponentially
+    smoothed so that a single slow frame does not collapse the resolution.
+    """
+
+    MIN_PIXEL_BUDGET: Final = 160 * 120
+    """Lower bound for the adapted pixel budget"""
+
+    def __init__(
+        self, pixel_budget: int, deadline: float = 0.0, smoothing: float = 0.3
+    ) -> None:
+        """Class initializer
+
+        :param pixel_budget: Initial maximum number of pixels per image
+        :param deadline: Target matching latency in seconds, or 0 to keep the
+            pixel budget fixed
+        :param smoothing: Weight of the latest latency measurement in the
+            budget update, in range (0, 1]
+        :raise ValueError: If pixel budget or smoothing is out of range, or
+            deadline is negative
+        """
+        if pixel_budget < self.MIN_PIXEL_BUDGET:
+            raise ValueError(
+                f"Pixel budget must be at least {self.MIN_PIXEL_BUDGET} "
+                f"({pixel_budget})."
+            )
+        if deadline < 0:
+            raise ValueError(f"Deadline must not be negative ({deadline}).")
+        if not 0 < smoothing <= 1:
+            raise ValueError(f"Smoothing must be in range (0, 1] ({smoothing}).")
+
+        self._pixel_budget = float(pixel_budget)
+        self._deadline = deadline
+        self._smoothing = smoothing
+        # Largest input image seen so far, the budget is not increased beyond
+        # full resolution
+        self._max_pixels = pixel_budget
+
+    @property
+    def pixel_budget(self) -> int:
+        """Current maximum number of pixels per image"""
+        return int(self._pixel_budget)
+
+    def scale(self, shape: Tuple[int, ...]) -> float:
+        """Returns the quantized scaling factor for an image of given shape
+
+        :param shape: Image shape (height, width, ...)
+        :return: Scaling factor in range (0, 1]
+        """
+        height, width = shape[:2]
+        pixels = height * width
+        self._max_pixels = max(self._max_pixels, pixels)
+        if pixels <= self._pixel_budget:
+            return 1.0
+
+        # Round down to the next quantized step to stay within budget
+        octaves = 0.5 * math.log2(self._pixel_budget / pixels)
+        steps = math.floor(octaves * _SCALE_STEPS_PER_OCTAVE)
+        return 2.0 ** (steps / _SCALE_STEPS_PER_OCTAVE)
+
+    @staticmethod
+    def resized_shape(shape: Tuple[int, ...], scale: float) -> Tuple[int, int]:
+        """Returns the shape (height, width) of an image of given shape resized
+        with :meth:`.resize`
+
+        :param shape: Image shape (height, width, ...)
+        :param scale: Scaling factor from :meth:`.scale`
+        :return: Resized image shape
+        """
+        height, width = shape[:2]
+        return max(1, round(height * scale)), max(1, round(width * scale))
+
+    @staticmethod
+    def resize(img: np.ndarray, scale: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the resized image and the (x, y) factors that map resized
+        pixel coordinates back to the input image
+
+        :param img: Image to resize
+        :param scale: Scaling factor from :meth:`.scale`
+        :return: Tuple of resized image and keypoint scaling factors
+        """
+        if scale == 1.0:
+            return img, np.ones(2, dtype=np.float32)
+
+        height, width = img.shape[:2]
+        size = ResolutionController.resized_shape(img.shape, scale)[::-1]
+        resized = cv2.resize(img, size, interpolation=cv2.INTER_AREA)
+        factors = np.array([width / size[0], height / size[1]], dtype=np.float32)
+        return resized, factors
+
+    def update(self, latency: float, pixels: int) -> None:
+        """Adjusts the pixel budget from a latency measurement
+
+        Does nothing if no deadline was given at initialization.
+
+        :param latency: Measured matching latency in seconds
+        :param pixels: Number of pixels per image that were matched
+        """
+        if self._deadline == 0 or latency <= 0:
+            return None
+
+        target = pixels * self._deadline / latency
+        budget = (1 - self._smoothing) * self._pixel_budget + self._smoothing * target
+        self._pixel_budget = min(
+            max(budget, float(self.MIN_PIXEL_BUDGET)), float(self._max_pixels)
+        )
@@ -0,0 +1,237 @@
+"""Terrain intersection of :term:`camera` rays using a :term:`DEM`
+
+Rays are intersected with the DEM by ray marching through a maximum elevation
+pyramid (quadtree) so that large empty volumes above the terrain are skipped
+one coarse cell at a time instead of pixel by pixel. All rays are marched in
+lockstep with NumPy, one pyramid cell per ray per step.
+"""
+import math
+from typing import Final, List, Optional, Tuple
+
+import numpy as np
+
+from ._messaging import BBox
+
+_METERS_PER_DEGREE_LATITUDE: Final = 110540.0
+"""Approximate length of one degree of latitude in meters"""
+
+_METERS_PER_DEGREE_LONGITUDE: Final = 111320.0
+"""Approximate length of one degree of longitude in meters at the equator"""
+
+_MAX_STEPS: Final = 4096
+"""Maximum number of ray marching steps per ray"""
+
+_EPSILON: Final = 1e-6
+"""Step in pixels past a cell boundary when moving to the next cell"""
+
+
+def _downsample(raster: np.ndarray, reduce) -> np.ndarray:
+    """Reduces 2x2 blocks of the raster with the given ufunc, padding odd
+    dimensions by edge replication
+    """
+    height, width = raster.shape
+    raster = np.pad(raster, ((0, height % 2), (0, width % 2)), mode="edge")
+    blocks = raster.reshape(raster.shape[0] // 2, 2, raster.shape[1] // 2, 2)
+    return reduce.reduce(reduce.reduce(blocks, axis=3), axis=1)
+
+
+class ElevationModel:
+    """:term:`DEM` with a min/max elevation pyramid for fast ray intersection
+
+    Coordinates are handled in a local tangent plane around a :term:`WGS 84`
+    origin using an equirectangular approximation, which is accurate enough for
+    the extent of a single :term:`orthoimage`.
+    """
+
+    def __init__(self, dem: np.ndarray, bbox: BBox) -> None:
+        """Class initializer
+
+        :param dem: Elevation raster in meters of shape (height, width)
+        :param bbox: :term:`WGS 84` :term:`bounding box` of the raster
+        """
+        self._bbox = bbox
+        self._height, self._width = dem.shape
+        self._max: List[np.ndarray] = [dem.astype(np.float32)]
+        self._min: List[np.ndarray] = [self._max[0]]
+        while self._max[-1].shape != (1, 1):
+            self._max.append(_downsample(self._max[-1], np.maximum))
+            self._min.append(_downsample(self._min[-1], np.minimum))
+
+        # Maximum elevation pyramid flattened into a single array so that rays
+        # at different levels can be looked up with a single gather
+        self._max_flat = np.concatenate([level.ravel() for level in self._max])
+        self._level_widths = np.array([level.shape[1] for level in self._max])
+        self._level_offsets = np.cumsum([0] + [level.size for level in self._max[:-1]])
+
+        # Pixel size in degrees
+        self._deg_per_col = (bbox.right - bbox.left) / self._width
+        self._deg_per_row = (bbox.top - bbox.bottom) / self._height
+
+    def _to_pixel(self, longitude: float, latitude: float) -> Tuple[float, float]:
+        """Returns continuous (column, row) raster coordinates for a location"""
+        col = (longitude - self._bbox.left) / self._deg_per_col
+        row = (self._bbox.top - latitude) / self._deg_per_row
+        return col, row
+
+    def elevation(self, longitude: float, latitude: float) -> Optional[float]:
+        """Returns the elevation at a location, or None if the location is
+        outside the raster
+
+        :param longitude: Longitude in decimal degrees
+        :param latitude: Latitude in decimal degrees
+        :return: Elevation in meters
+        """
+        col, row = self._to_pixel(longitude, latitude)
+        if not (0 <= col < self._width and 0 <= row < self._height):
+            return None
+        return float(self._max[0][int(row), int(col)])
+
+    def intersect(
+        self,
+        directions: np.ndarray,
+        longitude: float,
+        latitude: float,
+        altitude: float,
+    ) -> np.ndarray:
+        """Intersects rays from a common origin with the terrain
+
+        :param directions: Array of shape (N, 3) of ray directions in
+            :term:`ENU` (need not be normalized)
+        :param longitude: Ray origin longitude in decimal degrees
+        :param latitude: Ray origin latitude in decimal degrees
+        :param altitude: Ray origin altitude in meters in the same vertical
+            datum as the DEM
+        :return: Array of shape (N, 2) of intersection east and north offsets
+            in meters from the origin. Rows are NaN for rays that do not hit the
+            terrain within the raster.
+        """
+        # Meters per pixel in east and north directions
+        meters_per_col = (
+            self._deg_per_col
+            * _METERS_PER_DEGREE_LONGITUDE
+            * math.cos(math.radians(latitude))
+        )
+        meters_per_row = self._deg_per_row * _METERS_PER_DEGREE_LATITUDE
+
+        col0, row0 = self._to_pixel(longitude, latitude)
+        directions = np.asarray(directions, dtype=np.float64)
+        hits = self._march(
+            (col0, row0, altitude),
+            np.column_stack(
+                (
+                    directions[:, 0] / meters_per_col,
+                    -directions[:, 1] / meters_per_row,
+                    directions[:, 2],
+                )
+            ),
+        )
+        return np.column_stack(
+            ((hits[:, 0] - col0) * meters_per_col, (row0 - hits[:, 1]) * meters_per_row)
+        )
+
+    def _march(
+        self, origin: Tuple[float, float, float], directions: np.ndarray
+    ) -> np.ndarray:
+        """Marches rays from a common origin through the maximum elevation
+        pyramid
+
+        :param origin: Ray origin as (column, row, altitude)
+        :param directions: Array of shape (N, 3) of ray directions as (column,
+            row, altitude) per unit
+        :return: Array of shape (N, 2) of intersection (column, row). Rows are
+            NaN for rays that do not hit the terrain inside the raster.
+        """
+        col0, row0, z0 = origin
+        hits = np.full((len(directions), 2), np.nan)
+
+        # Rays that do not point down never hit the terrain
+        horizontal = np.hypot(directions[:, 0], directions[:, 1])
+        down = directions[:, 2] < 0
+
+        # Vertical rays hit directly below the origin if inside the raster
+        vertical = down & (horizontal < _EPSILON)
+        if 0 <= col0 < self._width and 0 <= row0 < self._height:
+            hits[vertical] = col0, row0
+
+        # Parametrize by horizontal distance in pixels so that epsilon steps
+        # are meaningful
+        (index,) = np.nonzero(down & ~vertical)
+        dcol, drow, dz = (directions[index] / horizontal[index, None]).T
+
+        # Rays parallel to an axis never cross its cell boundaries, a tiny
+        # direction component puts the crossing out of reach
+        dcol[dcol == 0], drow[drow == 0] = _EPSILON**2, _EPSILON**2
+        # Next cell boundary is at the far edge of the cell for positive
+        # directions and at the near edge for negative directions
+        edge_col, edge_row = (dcol > 0).astype(np.int64), (drow > 0).astype(np.int64)
+
+        # The intersection lies between the global maximum and minimum
+        # elevation crossings
+        top = len(self._max) - 1
+        t = np.maximum(0.0, (float(self._max[top][0, 0]) - z0) / dz)
+        t_end = (float(self._min[top][0, 0]) - z0) / dz
+        level = np.full(len(index), top)
+
+        for _ in range(_MAX_STEPS):
+            if len(index) == 0:
+                break
+
+            t = np.minimum(t, t_end)  # numerical safety, ray is below all terrain
+            col, row = col0 + t * dcol, row0 + t * drow
+            inside = (
+                (0 <= col) & (col < self._width) & (0 <= row) & (row < self._height)
+            )
+            if not inside.all():
+                index, dcol, drow, dz, t, t_end, level, col, row = (
+                    array[inside]
+                    for array in (index, dcol, drow, dz, t, t_end, level, col, row)
+                )
+                edge_col, edge_row = edge_col[inside], edge_row[inside]
+
+            size = 1 << level
+            cell_col = col.astype(np.int64) >> level
+            cell_row = row.astype(np.int64) >> level
+            t_exit = t + np.minimum(
+                ((cell_col + edge_col) * size - col) / dcol,
+                ((cell_row + edge_row) * size - row) / drow,
+            )
+            max_elevation = self._max_flat[
+                self._level_offsets[level]
+                + cell_row * self._level_widths[level]
+                + cell_col
+            ]
+
+            # The ray descends, so its lowest point in the cell is at the exit
+            above = z0 + t_exit * dz > max_elevation
+
+            # Terrain is flat within a pixel
+            t = np.where(above, t_exit + _EPSILON, t)
+            level = np.where(above, np.minimum(level + 1, top), level - 1)
+
+            # Terrain is flat within a pixel
+            hit = level < 0
+            if hit.any():
+                t_hit = np.minimum(
+                    np.maximum(t[hit], (max_elevation[hit] - z0) / dz[hit]),
+                    t_exit[hit],
+                )
+                hits[index[hit]] = np.column_stack(
+                    (col0 + t_hit * dcol[hit], row0 + t_hit * drow[hit])
+                )
+                marching = ~hit
+                index, dcol, drow, dz, t, t_end, level, edge_col, edge_row = (
+                    array[marching]
+                    for array in (
+                        index,
+                        dcol,
+                        drow,
+                        dz,
+                        t,
+                        t_end,
+                        level,
+                        edge_col,
+                        edge_row,
+                    )
+                )
+
+        return hits
@@ -0,0 +1,169 @@
+"""Persistent on-disk cache for :term:`GetMap` response :term:`rasters <raster>`
+
+Rasters are stored as decoded raw NumPy arrays (``.npy`` files) so that a cache
+hit skips both the :term:`WMS` round trip and the image decode. Cached arrays
+are memory-mapped when read back and copied out, so that a hit costs roughly
+one read and copy of the raw raster.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ._messaging import BBox
+
+
+class TileCache:
+    """Content-addressed :term:`raster` cache with a byte budget and
+    least-recently-used (LRU) eviction
+
+    The cache index is rebuilt from the cache directory on initialization using
+    file modification times as the LRU order, so the cache survives restarts.
+    Modification times are refreshed on every hit to persist the LRU order.
+
+    The cache is thread-safe.
+    """
+
+    _SUFFIX = ".npy"
+    """Cached raster file suffix"""
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        """Class initializer
+
+        :param path: Cache directory, created if it does not exist
+        :param max_bytes: Cache size budget in bytes
+        :raise ValueError: If the byte budget is not positive
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"Cache byte budget must be positive ({max_bytes}).")
+
+        self._path = os.path.abspath(os.path.expanduser(path))
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+
+        os.makedirs(self._path, exist_ok=True)
+        self._load_index()
+
+    @property
+    def size(self) -> int:
+        """Total size of cached rasters in bytes"""
+        return self._size
+
+    @staticmethod
+    def key(
+        layers: Tuple[str, ...],
+        styles: Tuple[str, ...],
+        srs: str,
+        bbox: BBox,
+        size: Tuple[int, int],
+        format_: str,
+        grayscale: bool,
+    ) -> str:
+        """Returns a content address for a :term:`GetMap` request
+
+        :param layers: WMS request layers
+        :param styles: WMS request styles
+        :param srs: WMS request :term:`SRS`
+        :param bbox: WMS request :term:`bounding box`. Should already be
+            quantized by the caller so that nearby requests map to the same key.
+        :param size: Raster size in pixels
+        :param format_: WMS request image format
+        :param grayscale: True if the raster is decoded as grayscale
+        :return: Hex digest cache key
+        """
+        bbox = tuple(round(float(coord), 9) for coord in bbox)
+        parts = (tuple(layers), tuple(styles), srs, bbox, tuple(size), format_)
+        digest = hashlib.sha256(repr((parts, grayscale)).encode("utf-8"))
+        return digest.hexdigest()[:32]
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Returns the cached raster for given key or None if not cached
+
+        :param key: Cache key from :meth:`.key`
+        :return: Writable copy of the cached raster, or None on cache miss
+        """
+        with self._lock:
+            if key not in self._index:
+                return None
+
+            filename = self._filename(key)
+            try:
+                array = np.load(filename, mmap_mode="r")
+                os.utime(filename)
+            except (OSError, ValueError):
+                # File was removed or corrupted outside of this cache
+                self._remove(key)
+                return None
+
+            self._index.move_to_end(key)
+
+        # Copy outside of the lock so that callers are free to modify the raster
+        # in place without touching the memory-mapped file
+        return np.array(array)
+
+    def put(self, key: str, array: np.ndarray) -> None:
+        """Stores a raster in the cache, evicting least recently used rasters
+        if the byte budget would be exceeded
+
+        Rasters larger than the byte budget are not cached.
+
+        :param key: Cache key from :meth:`.key`
+        :param array: Raster to cache
+        """
+        if array.nbytes > self._max_bytes:
+            return
+
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+                return
+
+            filename = self._filename(key)
+            tmp_filename = f"{filename}.{threading.get_ident()}.tmp"
+            with open(tmp_filename, "wb") as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(tmp_filename, filename)
+
+            nbytes = os.path.getsize(filename)
+            self._index[key] = nbytes
+            self._size += nbytes
+
+            while self._size > self._max_bytes and len(self._index) > 1:
+                oldest_key = next(iter(self._index))
+                self._remove(oldest_key)
+
+    def _filename(self, key: str) -> str:
+        """Returns cached raster file path for given key"""
+        return os.path.join(self._path, f"{key}{self._SUFFIX}")
+
+    def _remove(self, key: str) -> None:
+        """Removes a raster from the index and disk
+
+        Must be called with :attr:`._lock` held.
+        """
+        self._size -= self._index.pop(key)
+        try:
+            os.remove(self._filename(key))
+        except FileNotFoundError:
+            pass
+
+    def _load_index(self) -> None:
+        """Rebuilds the LRU index from the cache directory contents"""
+        entries = []
+        for entry in os.scandir(self._path):
+            if entry.is_file() and entry.name.endswith(self._SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name, stat.st_size))
+
+        with self._lock:
+            for _, name, nbytes in sorted(entries):
+                self._index[name[: -len(self._SUFFIX)]] = nbytes
+                self._size += nbytes
+
+            while self._size > self._max_bytes and self._index:
+                self._remove(next(iter(self._index)))
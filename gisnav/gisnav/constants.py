@@ -54,11 +54,21 @@ ROS_TOPIC_RELATIVE_PNP_IMAGE: Final = "~/image"
 :attr:`.CVNode.pnp_image`.
 """
 
+ROS_TOPIC_RELATIVE_REFERENCE_TIME: Final = "~/reference/time"
+"""Relative :term:`topic` into which :class:`.TransformNode` publishes
+:attr:`.TransformNode.reference_time`.
+"""
+
 ROS_TOPIC_RELATIVE_CAMERA_ESTIMATED_POSE: Final = "~/camera/estimated/pose"
 """Relative :term:`topic` into which :class:`.PnPNode` publishes
 :attr:`.PnPNode.camera_estimated_pose`.
 """
 
+ROS_TOPIC_RELATIVE_DEBUG_IMAGE: Final = "~/debug/image/compressed"
+"""Relative :term:`topic` into which :class:`.PoseNode` publishes
+:attr:`.PoseNode.debug_image`.
+"""
+
 MAVROS_TOPIC_TIME_REFERENCE: Final = "/mavros/time_reference"
 """The :term:`MAVROS` time reference topic that has the difference between
 the local system time and the foreign :term:`FCU` time
@@ -86,7 +96,6 @@ with fast dynamics with higher lags as long as the timestamps are accurate.
 
 FrameID = Literal[
     "reference",
-    "reference_{}_{}",
     "base_link",
     "camera",
     "camera_pinhole",
@@ -106,12 +115,10 @@ The ``base_link`` frame is defined as the vehicle body :term:`FRD` frame.
 
 The ``reference`` frame is the :term:`reference` arrays coordinate frame
 where the origin is the bottom left (ROS convention, not numpy/cv2 top left
-convention). x axis is the width axis, y axis is height. The static
-``reference_{}_{}`` frame (in relation to :term:`WGS 84` coordinates)
-is intended to be suffixed with the :term:`ROS` second and nanosecond
-integer timestamps to allow the tf2 transformation chain to be matched
-to the exact same reference frame that was used to for deriving the
-:term:`orthoimage`. This is needed because the reference frame is
-discontinuous (jumps around) and tf2 default interpolation cannot therefore
-be applied to it.
+convention). x axis is the width axis, y axis is height. The reference frame
+is discontinuous (jumps around whenever a new :term:`orthoimage` arrives) so
+tf2 default interpolation cannot be applied to it. Transformations into the
+reference frame must be looked up at the exact timestamp they were published
+with (see :attr:`.TransformNode.reference_time`), and the orthoimage
+geotransform is looked up from the :data:`.geotransform_registry`.
 """
@@ -21,6 +21,11 @@ The below graph shows :class:`.BBoxNode` in the computational graph.
             camera_info[camera/camera_info]
         end
 
+        subgraph GISNode
+            orthoimage[gisnav/gis_node/orthoimage]
+            geotransform[gisnav/gis_node/geotransform]
+        end
+
         subgraph BBoxNode
             bounding_box[gisnav/bbox_node/fov/bounding_box]
         end
@@ -28,12 +33,16 @@ The below graph shows :class:`.BBoxNode` in the computational graph.
         navsatfix -->|sensor_msgs/NavSatFix| BBoxNode
         vehicle_pose -->|geometry_msgs/PoseStamped| BBoxNode
         camera_info -->|sensor_msgs/CameraInfo| BBoxNode
+        orthoimage -->|sensor_msgs/Image| BBoxNode
+        geotransform -->|sensor_msgs/Image| BBoxNode
         bounding_box -->|geographic_msgs/BoundingBox| GISNode:::hidden.
+
+The :term:`orthoimage` and geotransform are only subscribed to when
+:attr:`.BBoxNode.terrain_footprint` is enabled.
 """
-from typing import Final, Optional
+from typing import Final, Optional, Tuple
 
 import numpy as np
-import pyproj
 import rclpy
 import tf2_ros
 import tf_transformations
@@ -43,15 +52,21 @@ from mavros_msgs.msg import GimbalDeviceAttitudeStatus
 from rcl_interfaces.msg import ParameterDescriptor
 from rclpy.node import Node
 from rclpy.qos import QoSPresetProfiles
-from sensor_msgs.msg import CameraInfo, NavSatFix
+from sensor_msgs.msg import CameraInfo, Image, NavSatFix
 from tf2_ros.transform_broadcaster import TransformBroadcaster
 
 from .. import _messaging as messaging
 from .._decorators import ROS, narrow_types
+from .._projection import FOV_POINTS, CameraRays, intersect_plane
+from .._terrain import ElevationModel
 from ..constants import (
     DELAY_DEFAULT_MS,
+    GIS_NODE_NAME,
+    ROS_NAMESPACE,
     ROS_TOPIC_CAMERA_INFO,
     ROS_TOPIC_RELATIVE_FOV_BOUNDING_BOX,
+    ROS_TOPIC_RELATIVE_GEOTRANSFORM,
+    ROS_TOPIC_RELATIVE_ORTHOIMAGE,
     FrameID,
 )
 
@@ -60,6 +75,25 @@ class BBoxNode(Node):
     """Publishes :class:`.BoundingBox` of the :term:`camera's <camera>`
     ground-projected :term:`field of view <FOV>`"""
 
+    ROS_D_TERRAIN_FOOTPRINT = False
+    """Default for intersecting the :term:`FOV` with the :term:`DEM` instead of
+    a flat ground plane, disabled by default"""
+
+    ROS_D_TERRAIN_ELEVATION_SCALE = 1.0
+    """Default :term:`DEM` elevation in meters per raster value"""
+
+    ROS_D_TERRAIN_GRID_SIZE = 0
+    """Default number of additional :term:`FOV` rays per image side (0 for
+    corners only)"""
+
+    ROS_D_GEOTRANSFORM_REGISTRY_SIZE = messaging.GEOTRANSFORM_REGISTRY_SIZE
+    """Default maximum number of geotransforms in the
+    :data:`.geotransform_registry`"""
+
+    ROS_D_GEOTRANSFORM_REGISTRY_HORIZON = messaging.GEOTRANSFORM_REGISTRY_HORIZON
+    """Default maximum age in seconds of a geotransform in the
+    :data:`.geotransform_registry`"""
+
     _ROS_PARAM_DESCRIPTOR_READ_ONLY: Final = ParameterDescriptor(read_only=True)
     """A read only ROS parameter descriptor"""
 
@@ -71,12 +105,22 @@ class BBoxNode(Node):
         """
         super().__init__(*args, **kwargs)
 
+        registry_size = self.geotransform_registry_size
+        registry_horizon = self.geotransform_registry_horizon
+        assert registry_size is not None and registry_horizon is not None
+        messaging.geotransform_registry.configure(registry_size, registry_horizon)
+
         # Calling these decorated properties the first time will setup
         # subscriptions to the appropriate ROS topics
         self.camera_info
         self.nav_sat_fix
         self.vehicle_pose
         self.gimbal_device_attitude_status
+        if self.terrain_footprint:
+            # Only needed for the terrain elevation model, avoid deserializing
+            # every orthoimage otherwise
+            self.orthoimage
+            self.geotransform
 
         # Needed for updating tf2 with camera to vehicle relative pose
         # and vehicle to wgs84 relative
@@ -84,6 +128,16 @@ class BBoxNode(Node):
         self.tf_buffer = tf2_ros.Buffer()
         self.tf_listener = tf2_ros.TransformListener(self.tf_buffer, self)
 
+        # Camera frame FOV rays, recomputed only when camera intrinsics change
+        grid_size = self.terrain_grid_size
+        assert grid_size is not None
+        self._camera_rays = CameraRays(grid_size)
+
+        # Elevation model built from the latest orthoimage DEM, rebuilt only
+        # when a new orthoimage arrives
+        self._elevation_model: Optional[ElevationModel] = None
+        self._elevation_model_stamp: Optional[Tuple[int, int]] = None
+
     def _nav_sat_fix_cb(self, msg: NavSatFix) -> None:
         """Callback for the :term:`global position` message from the
         :term:`navigation filter`
@@ -136,6 +190,139 @@ class BBoxNode(Node):
     def camera_info(self) -> Optional[CameraInfo]:
         """Camera info for determining appropriate :attr:`.orthoimage` resolution"""
 
+    @property
+    @ROS.parameter(ROS_D_TERRAIN_FOOTPRINT, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def terrain_footprint(self) -> Optional[bool]:
+        """If True, :term:`FOV` rays are intersected with the :term:`DEM` of
+        the latest :term:`orthoimage` instead of a flat ground plane
+
+        Over hilly terrain this gives a tighter :attr:`.fov_bounding_box` and
+        so fewer and smaller :term:`GetMap` requests. Rays that do not hit the
+        DEM fall back to the flat ground plane.
+        """
+
+    @property
+    @ROS.parameter(
+        ROS_D_TERRAIN_ELEVATION_SCALE, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY
+    )
+    def terrain_elevation_scale(self) -> Optional[float]:
+        """:term:`DEM` elevation in meters per :term:`orthoimage` elevation
+        raster value
+        """
+
+    @property
+    @ROS.parameter(ROS_D_TERRAIN_GRID_SIZE, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def terrain_grid_size(self) -> Optional[int]:
+        """Number of additional :term:`FOV` rays per image side projected on
+        the terrain, or 0 to project only the FOV corners
+
+        Over hilly terrain the footprint is not a quadrilateral, so a grid of
+        rays captures its extent better than the corners alone.
+        """
+
+    @property
+    @ROS.parameter(
+        ROS_D_GEOTRANSFORM_REGISTRY_SIZE, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY
+    )
+    def geotransform_registry_size(self) -> Optional[int]:
+        """Minimum capacity in :term:`orthoimage` geotransforms of the
+        process-wide :data:`.geotransform_registry`
+
+        The registry is shared with the other nodes in the process and uses
+        the largest size configured by any of them.
+        """
+
+    @property
+    @ROS.parameter(
+        ROS_D_GEOTRANSFORM_REGISTRY_HORIZON,
+        descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY,
+    )
+    def geotransform_registry_horizon(self) -> Optional[float]:
+        """Minimum age in seconds up to which an :term:`orthoimage`
+        geotransform is kept in the process-wide :data:`.geotransform_registry`
+        relative to the latest orthoimage, or 0 to bound the registry by
+        :attr:`.geotransform_registry_size` only
+
+        The registry uses the longest horizon configured by any node in the
+        process.
+        """
+
+    @property
+    @ROS.subscribe(
+        f"/{ROS_NAMESPACE}"
+        f'/{ROS_TOPIC_RELATIVE_ORTHOIMAGE.replace("~", GIS_NODE_NAME)}',
+        QoSPresetProfiles.SENSOR_DATA.value,
+    )
+    def orthoimage(self) -> Optional[Image]:
+        """Subscribed :term:`orthoimage` and :term:`DEM` :term:`stack`, only
+        subscribed to if :attr:`.terrain_footprint` is enabled
+
+        .. seealso::
+            :attr:`.GISNode.orthoimage`
+        """
+
+    def _geotransform_cb(self, msg: Image) -> None:
+        """Callback for :attr:`.geotransform` message
+
+        Registers the geotransform in the :data:`.geotransform_registry` so
+        that it can be looked up by the :term:`orthoimage` timestamp.
+        """
+        messaging.register_geotransform(self, msg)
+
+    @property
+    @ROS.subscribe(
+        f"/{ROS_NAMESPACE}"
+        f'/{ROS_TOPIC_RELATIVE_GEOTRANSFORM.replace("~", GIS_NODE_NAME)}',
+        QoSPresetProfiles.SENSOR_DATA.value,
+        callback=_geotransform_cb,
+    )
+    def geotransform(self) -> Optional[Image]:
+        """Subscribed :term:`orthoimage` to :term:`WGS 84` affine transformation
+
+        .. seealso::
+            :attr:`.GISNode.geotransform`
+        """
+
+    @property
+    def elevation_model(self) -> Optional[ElevationModel]:
+        """:class:`.ElevationModel` of the latest :term:`orthoimage`, or None
+        if not available or :attr:`.terrain_footprint` is disabled
+
+        The geotransform of the orthoimage is looked up from the
+        :data:`.geotransform_registry` by the orthoimage timestamp.
+        """
+        if not self.terrain_footprint:
+            return None
+        orthoimage = self.orthoimage
+        if orthoimage is None:
+            return None
+
+        stamp = (orthoimage.header.stamp.sec, orthoimage.header.stamp.nanosec)
+        if stamp != self._elevation_model_stamp:
+            M = messaging.geotransform_registry.get(orthoimage.header.stamp)
+            if M is None:
+                return self._elevation_model  # Geotransform not yet received
+
+            stack = messaging.image_to_array(orthoimage)
+            dem = (stack[:, :, 1].astype(np.uint16) << 8) | stack[:, :, 2]
+            scale = self.terrain_elevation_scale
+            assert scale is not None
+
+            # Geotransform maps (row, column) pixel centers to (longitude,
+            # latitude), the bounding box is at the outer pixel edges
+            height, width = dem.shape
+            corners = (
+                M @ np.array([[-0.5, -0.5, 0, 1], [height - 0.5, width - 0.5, 0, 1]]).T
+            )
+            (left, right), (top, bottom) = corners[:2] / corners[3]
+
+            self._elevation_model = ElevationModel(
+                dem * scale, messaging.BBox(left, bottom, right, top)
+            )
+            self._elevation_model_stamp = stamp
+
+        return self._elevation_model
+
     @property
     @ROS.publish(
         ROS_TOPIC_RELATIVE_FOV_BOUNDING_BOX, QoSPresetProfiles.SENSOR_DATA.value
@@ -149,17 +336,23 @@ class BBoxNode(Node):
         def _fov_and_principal_point_on_ground_plane(
             transform: TransformStamped,
             camera_info: CameraInfo,
+            navsatfix: NavSatFix,
+            elevation_model: Optional[ElevationModel],
         ) -> Optional[np.ndarray]:
             """Projects :term:`camera` principal point and :term:`FOV` corners
-             on ground plane
+             on ground
 
-            .. note::
-                Assumes ground is a flat plane, does not take :term:`DEM` into account
+            The rays are intersected with the :term:`DEM` if an elevation model
+            is available, using the DEM elevation below the vehicle as the
+            ground (z==0) reference. Rays that miss the DEM and all rays
+            without an elevation model are intersected with a flat ground
+            plane.
 
             :return: Numpy array of FOV corners and principal point projected onto
                 ground (vehicle :term:`local position` z==0) plane in following
-                order: top-left, top-right, bottom-right, bottom-left, principal point.
-                Shape is (5, 2). Coordinates are meters in
+                order: top-left, top-right, bottom-right, bottom-left, principal point,
+                followed by :attr:`.terrain_grid_size` squared grid points.
+                Shape is (5 + N, 2). Coordinates are meters in
                 :term:`local tangent plane <LTP>` :term:`ENU`.
             """
             R = tf_transformations.quaternion_matrix(
@@ -171,45 +364,34 @@ class BBoxNode(Node):
             # frame z is altitude AGL
             C = np.array((0, 0, transform.transform.translation.z))
 
-            intrinsics = camera_info.k.reshape((3, 3))
-
-            # List of image points: top-left, top-right, bottom-right, bottom-left,
-            # principal point
-            img_points = [
-                [0, 0],
-                [camera_info.width - 1, 0],
-                [camera_info.width - 1, camera_info.height - 1],
-                [0, camera_info.height - 1],
-                [camera_info.width / 2, camera_info.height / 2],
-            ]
-
-            # Project each point to the ground
-            ground_points = []
-            for pt in img_points:
-                u, v = pt
-
-                # Convert to normalized image coordinates
-                d_img = np.array([u, v, 1])
-
-                try:
-                    d_cam = np.linalg.inv(intrinsics) @ d_img
-                except np.linalg.LinAlgError as _:  # noqa: F841
-                    self.get_logger().error(
-                        "Could not invert camera intrinsics matrix. Cannot"
-                        "project FOV on ground."
+            try:
+                rays = self._camera_rays(camera_info)
+            except np.linalg.LinAlgError as _:  # noqa: F841
+                self.get_logger().error(
+                    "Could not invert camera intrinsics matrix. Cannot"
+                    "project FOV on ground."
+                )
+                return None
+
+            # Find intersections with ground plane
+            ground_points = intersect_plane(rays, R, C)
+
+            if elevation_model is not None:
+                ground_elevation = elevation_model.elevation(
+                    navsatfix.longitude, navsatfix.latitude
+                )
+                if ground_elevation is not None:
+                    terrain_points = elevation_model.intersect(
+                        rays @ R.T,
+                        navsatfix.longitude,
+                        navsatfix.latitude,
+                        ground_elevation + C[2],
+                    )
+                    ground_points = np.where(
+                        np.isnan(terrain_points), ground_points, terrain_points
                     )
-                    return None
-
-                # Convert direction to ENU frame
-                d_enu = R @ d_cam
-
-                # Find intersection with ground plane
-                t = -C[2] / d_enu[2]
-                intersection = C + t * d_enu
-
-                ground_points.append(intersection[:2])
 
-            return np.vstack(ground_points)
+            return ground_points
 
         @narrow_types(self)
         def _enu_to_latlon(
@@ -223,28 +405,10 @@ class BBoxNode(Node):
 
             :return: Same bounding box in WGS 84 coordinates
             """
-
-            def _determine_utm_zone(longitude):
-                """Determine the UTM zone for a given longitude."""
-                return int((longitude + 180) / 6) + 1
-
-            # Define the UTM zone and conversion
-            proj_latlon = pyproj.Proj(proj="latlong", datum="WGS84")
-            utm_zone = _determine_utm_zone(navsatfix.longitude)
-            proj_utm = pyproj.Proj(proj="utm", zone=utm_zone, datum="WGS84")
-
-            # Convert origin to UTM
-            origin_x, origin_y = pyproj.transform(
-                proj_latlon, proj_utm, navsatfix.longitude, navsatfix.latitude
+            lon, lat = messaging.enu_to_latlon(
+                bbox_coords, navsatfix.longitude, navsatfix.latitude
             )
 
-            # Add ENU offsets to the UTM origin
-            utm_x = origin_x + bbox_coords[:, 0]
-            utm_y = origin_y + bbox_coords[:, 1]
-
-            # Convert back to lat/lon
-            lon, lat = pyproj.transform(proj_utm, proj_latlon, utm_x, utm_y)
-
             latlon_coords = np.column_stack((lon, lat))
             assert latlon_coords.shape == bbox_coords.shape
 
@@ -262,7 +426,7 @@ class BBoxNode(Node):
 
             :param enu_coords: A numpy array of shape (N, 2) representing ENU
                 coordinates.
-            :return: A numpy array of shape (N, 2) representing the adjusted
+            :return: A numpy array of shape (4, 2) representing the adjusted
                 square bounding box.
             """
             min_e, min_n = np.min(enu_coords, axis=0)
@@ -295,7 +459,7 @@ class BBoxNode(Node):
                 ]
             )
 
-            assert square_box.shape == enu_coords.shape
+            assert square_box.shape == (4, 2)
 
             return square_box
 
@@ -338,10 +502,14 @@ class BBoxNode(Node):
         )
 
         fov_and_c_on_ground_local_enu = _fov_and_principal_point_on_ground_plane(
-            transform, self.camera_info
+            transform, self.camera_info, self.nav_sat_fix, self.elevation_model
         )
         if fov_and_c_on_ground_local_enu is not None:
-            fov_on_ground_local_enu = fov_and_c_on_ground_local_enu[:4]
+            # Footprint is the FOV corners and grid points, principal point
+            # is not needed
+            fov_on_ground_local_enu = np.delete(
+                fov_and_c_on_ground_local_enu, FOV_POINTS - 1, axis=0
+            )
             bbox_local_enu_padded_square = _square_bounding_box(fov_on_ground_local_enu)
             bounding_box = _enu_to_latlon(
                 bbox_local_enu_padded_square, self.nav_sat_fix
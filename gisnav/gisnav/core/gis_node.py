@@ -25,36 +25,37 @@ downloading, storing, and publishing the :term:`orthophoto` and optional
 
         camera_info -->|sensor_msgs/CameraInfo| GISNode
         bounding_box -->|geographic_msgs/BoundingBox| GISNode
-        geotransform -->|sensor_msgs/PointCloud2| MockGPSNode
+        geotransform -->|sensor_msgs/Image| MockGPSNode
         image -->|sensor_msgs/Image| TransformNode:::hidden
 """
+import io
+import threading
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
-from typing import IO, Final, List, Optional, Tuple
+from typing import IO, Dict, Final, List, Optional, Tuple
 
 import cv2
 import numpy as np
+import rclpy.time
 import requests
-from cv_bridge import CvBridge
 from geographic_msgs.msg import BoundingBox, GeoPoint
+from owslib.crs import Crs
 from owslib.util import ServiceException
 from owslib.wms import WebMapService
 from rcl_interfaces.msg import ParameterDescriptor
 from rclpy.node import Node
 from rclpy.qos import QoSPresetProfiles
 from rclpy.timer import Timer
-from sensor_msgs.msg import (
-    CameraInfo,
-    Image,
-    NavSatFix,
-    PointCloud2,
-    PointField,
-    TimeReference,
-)
+from requests.adapters import HTTPAdapter
+from sensor_msgs.msg import CameraInfo, Image, NavSatFix, TimeReference
 from shapely.geometry import box
 from std_msgs.msg import Header
+from urllib3.util.retry import Retry
 
 from .. import _messaging as messaging
 from .._decorators import ROS, cache_if, narrow_types
+from .._tile_cache import TileCache
 from ..constants import (
     BBOX_NODE_NAME,
     DELAY_DEFAULT_MS,
@@ -66,23 +67,31 @@ from ..constants import (
     ROS_TOPIC_RELATIVE_ORTHOIMAGE,
 )
 
+_MapRequest = namedtuple("_MapRequest", "key bounding_box future")
+"""Background :term:`orthoimage` :term:`GetMap` request for a :term:`bounding box`"""
+
 
 class GISNode(Node):
     """Publishes the :term:`orthophoto` and optional :term:`DEM` as a single
     :term:`stacked <stack>` :class:`.Image` message.
 
     .. warning::
-        ``OWSLib``, *as of version 0.25.0*, uses the Python ``requests``
-        library under the hood but does not document the various exceptions it
-        raises that are passed through by ``OWSLib`` as part of its public API.
-        The :meth:`.get_map` method is therefore expected to raise `errors and
-        exceptions
+        :term:`GetMap` requests raise `errors and exceptions
         <https://requests.readthedocs.io/en/latest/user/quickstart/#errors-and-exceptions>`_
-        specific to the ``requests`` library.
+        specific to the ``requests`` library, and ``OWSLib`` *as of version
+        0.25.0* passes them through from the GetCapabilities request without
+        documenting them. Connection errors are expected while the
+        :term:`WMS` endpoint is not available: the GetCapabilities request is
+        retried at :attr:`.wms_poll_rate` and a failed GetMap request is
+        logged and skipped. Timeouts and HTTP errors that remain after the
+        retries (see :attr:`.wms_max_retries`) are logged and skipped as
+        well, and any other exceptions are logged as unexpected errors.
 
-        These errors and exceptions are not handled by the :class:`.GISNode`
-        to avoid a direct dependency on ``requests``. They are therefore handled
-        as unexpected errors.
+    .. note::
+        ``OWSLib`` is only used for the :term:`WMS` GetCapabilities request.
+        :term:`GetMap` requests are sent through a pooled keep-alive
+        ``requests`` session owned by this node because ``OWSLib`` opens a
+        new connection for every request.
     """  # noqa: E501
 
     ROS_D_URL = "http://127.0.0.1:80/wms"
@@ -98,8 +107,23 @@ class GISNode(Node):
     ROS_D_VERSION = "1.3.0"
     """Default WMS version"""
 
+    ROS_D_LOCAL_IMAGERY_PATH = ""
+    """Default local imagery GeoTIFF path (empty string to use WMS instead)"""
+
+    ROS_D_LOCAL_DEM_PATH = ""
+    """Default local :term:`DEM` GeoTIFF path (empty string to use WMS instead)"""
+
     ROS_D_TIMEOUT = 10
-    """Default WMS GetMap request timeout in seconds"""
+    """Default WMS GetMap request read timeout in seconds"""
+
+    ROS_D_POOL_SIZE = 4
+    """Default maximum number of kept-alive connections to the WMS endpoint"""
+
+    ROS_D_MAX_RETRIES = 1
+    """Default maximum number of retries for failed WMS GetMap requests"""
+
+    ROS_D_BACKOFF_FACTOR = 0.3
+    """Default exponential backoff factor in seconds between WMS GetMap retries"""
 
     ROS_D_PUBLISH_RATE = 1.0
     """Default publish rate for :class:`.OrthoImage3D` messages in Hz"""
@@ -182,6 +206,62 @@ class GISNode(Node):
         conditions set in :meth:`._should_request_new_map`.
     """
 
+    ROS_D_TILE_CACHE_PATH = ""
+    """Default directory for the on-disk :term:`GetMap` response cache
+
+    .. note::
+        The cache is disabled by default (empty string). Set to e.g.
+        ``~/.cache/gisnav/tiles`` to enable it.
+    """
+
+    ROS_D_TILE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+    """Default byte budget for the on-disk :term:`GetMap` response cache"""
+
+    ROS_D_TILE_CACHE_BBOX_QUANTUM = 1e-4
+    """Default grid size in :term:`SRS` units (degrees for ``EPSG:4326``) that
+    requested :term:`bounding boxes <bounding box>` are snapped to
+
+    Snapping makes requests for nearby bounding boxes identical so that they
+    can be served from the on-disk cache when the same area is flown again.
+    Set to zero to disable snapping.
+
+    .. note::
+        Bounding boxes are only snapped when the cache is enabled (see
+        :py:attr:`.ROS_D_TILE_CACHE_PATH`).
+    """
+
+    ROS_D_PREFETCH_LOOKAHEAD = 5.0
+    """Default time horizon in seconds for predicting the next
+    :term:`bounding box` to prefetch
+
+    .. note::
+        Set to zero to disable prefetching.
+    """
+
+    ROS_D_GEOTRANSFORM_REGISTRY_SIZE = messaging.GEOTRANSFORM_REGISTRY_SIZE
+    """Default maximum number of geotransforms in the
+    :data:`.geotransform_registry`"""
+
+    ROS_D_GEOTRANSFORM_REGISTRY_HORIZON = messaging.GEOTRANSFORM_REGISTRY_HORIZON
+    """Default maximum age in seconds of a geotransform in the
+    :data:`.geotransform_registry`"""
+
+    _WMS_CONNECT_TIMEOUT: Final = 3.05
+    """WMS :term:`GetMap` request connect timeout in seconds
+
+    Kept short and separate from :attr:`.wms_timeout` so that an unreachable
+    endpoint fails fast instead of holding a worker for the full read timeout
+    on every retry.
+    """
+
+    _WMS_MAX_WORKERS: Final = 2
+    """Number of background worker threads for :term:`orthoimage` requests (one
+    for the current :term:`bounding box` and one for prefetching)
+
+    Each orthoimage request sends its imagery and :term:`DEM` :term:`GetMap`
+    requests concurrently on a separate pool with twice as many workers.
+    """
+
     _ROS_PARAM_DESCRIPTOR_READ_ONLY: Final = ParameterDescriptor(read_only=True)
     """A read only ROS parameter descriptor"""
 
@@ -193,29 +273,87 @@ class GISNode(Node):
         """
         super().__init__(*args, **kwargs)
 
+        registry_size = self.geotransform_registry_size
+        registry_horizon = self.geotransform_registry_horizon
+        assert registry_size is not None and registry_horizon is not None
+        messaging.geotransform_registry.configure(registry_size, registry_horizon)
+
+        # Vehicle velocity in degrees per second (latitude, longitude) derived
+        # from consecutive global position messages, used for prefetching
+        self._previous_nav_sat_fix: Optional[NavSatFix] = None
+        self._velocity: Optional[Tuple[float, float]] = None
+
+        # GetMap requests are sent from background worker threads so that they
+        # do not block the ROS executor. Requests for the same bounding box
+        # share a single in-flight future.
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._WMS_MAX_WORKERS, thread_name_prefix="gisnav_wms"
+        )
+        self._get_map_executor = ThreadPoolExecutor(
+            max_workers=2 * self._WMS_MAX_WORKERS, thread_name_prefix="gisnav_getmap"
+        )
+        self._in_flight: Dict[tuple, Future] = {}
+        self._in_flight_lock = threading.Lock()
+
+        # Last successfully retrieved DEM and its bounding box, used as a
+        # fallback if a DEM GetMap request fails
+        self._last_dem: Optional[Tuple[BoundingBox, np.ndarray]] = None
+
+        # GetMap requests reuse kept-alive connections from this session
+        self._wms_adapter = self._create_wms_adapter(
+            self.wms_pool_size, self.wms_max_retries, self.wms_backoff_factor
+        )
+        assert self._wms_adapter is not None
+        self._wms_session = requests.Session()
+        self._wms_session.mount("http://", self._wms_adapter)
+        self._wms_session.mount("https://", self._wms_adapter)
+
+        # Request for the current bounding box, and request for the predicted
+        # next bounding box which is swapped in when the vehicle arrives at the
+        # predicted location
+        self._pending: Optional[_MapRequest] = None
+        self._prefetch: Optional[_MapRequest] = None
+
+        # Latest orthoimage from a completed request, published while the next
+        # request is still loading
+        self._last_orthoimage: Optional[Image] = None
+
         # Calling these decorated properties the first time will setup
         # subscriptions to the appropriate ROS topics
         self.bounding_box
         self.camera_info
         self.time_reference
+        self.nav_sat_fix
 
         # TODO: use throttling in publish decorator, remove timer
         publish_rate = self.publish_rate
         assert publish_rate is not None
         self._publish_timer = self._create_publish_timer(publish_rate)
 
-        # TODO: refactor out CvBridge and use np.frombuffer instead
-        self._cv_bridge = CvBridge()
+        # Local rasters replace the corresponding WMS layers if provided
+        self._local_imagery = self._open_local_raster(self.local_imagery_path)
+        self._local_dem = self._open_local_raster(self.local_dem_path)
 
         wms_poll_rate = self.wms_poll_rate
         assert wms_poll_rate is not None
         self._wms_client = None  # TODO add type hint if possible
-        self._connect_wms_timer: Optional[Timer] = self._create_connect_wms_timer(
-            wms_poll_rate
+        self._connect_wms_timer: Optional[Timer] = (
+            self._create_connect_wms_timer(wms_poll_rate)
+            if self._local_imagery is None
+            else None
         )
 
         self.old_bounding_box: Optional[BoundingBox] = None
 
+        tile_cache_path = self.tile_cache_path
+        tile_cache_max_bytes = self.tile_cache_max_bytes
+        assert tile_cache_path is not None and tile_cache_max_bytes is not None
+        self._tile_cache: Optional[TileCache] = (
+            TileCache(tile_cache_path, tile_cache_max_bytes)
+            if tile_cache_path
+            else None
+        )
+
     @property
     @ROS.parameter(ROS_D_URL, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
     def wms_url(self) -> Optional[str]:
@@ -226,10 +364,60 @@ class GISNode(Node):
     def wms_version(self) -> Optional[str]:
         """Used WMS protocol version"""
 
+    @property
+    @ROS.parameter(ROS_D_LOCAL_IMAGERY_PATH, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def local_imagery_path(self) -> Optional[str]:
+        """Path to a local imagery GeoTIFF (preferably a Cloud-Optimized
+        GeoTIFF) to read :term:`orthoimagery <orthoimage>` from instead of the
+        :term:`WMS` endpoint, or empty string to use WMS
+
+        The WMS client is not instantiated if this is provided.
+        """
+
+    @property
+    @ROS.parameter(ROS_D_LOCAL_DEM_PATH, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def local_dem_path(self) -> Optional[str]:
+        """Path to a local :term:`DEM` GeoTIFF to read elevation from instead
+        of the :term:`WMS` endpoint, or empty string to use WMS
+
+        A flat (zero) elevation model is assumed if :attr:`.local_imagery_path`
+        is provided but this is not.
+        """
+
     @property
     @ROS.parameter(ROS_D_TIMEOUT, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
     def wms_timeout(self) -> Optional[int]:
-        """WMS request timeout in seconds"""
+        """WMS request timeout in seconds
+
+        For :term:`GetMap` requests this is the read timeout, i.e. the maximum
+        time to wait for the server between bytes, while connecting times out
+        after :attr:`._WMS_CONNECT_TIMEOUT`.
+        """
+
+    @property
+    @ROS.parameter(ROS_D_POOL_SIZE, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def wms_pool_size(self) -> Optional[int]:
+        """Maximum number of kept-alive connections to the WMS endpoint"""
+
+    @property
+    @ROS.parameter(ROS_D_MAX_RETRIES, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def wms_max_retries(self) -> Optional[int]:
+        """Maximum number of retries for failed WMS :term:`GetMap` requests
+
+        .. warning::
+            A GetMap request blocks a background worker and suppresses new
+            requests for the same :term:`bounding box` for roughly up to
+            ``(wms_max_retries + 1) * (3.05 + wms_timeout)`` seconds plus the
+            backoff (see :attr:`.wms_backoff_factor`) against an unresponsive
+            server. With the defaults this is about 27 seconds.
+        """
+
+    @property
+    @ROS.parameter(ROS_D_BACKOFF_FACTOR, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def wms_backoff_factor(self) -> Optional[float]:
+        """Exponential backoff factor in seconds between WMS :term:`GetMap`
+        retries
+        """
 
     @property
     @ROS.parameter(ROS_D_LAYERS)
@@ -287,6 +475,62 @@ class GISNode(Node):
     def publish_rate(self) -> Optional[float]:
         """Publish rate in Hz for the :attr:`.orthoimage` :term:`message`"""
 
+    @property
+    @ROS.parameter(ROS_D_PREFETCH_LOOKAHEAD)
+    def prefetch_lookahead(self) -> Optional[float]:
+        """Time horizon in seconds for predicting the next :term:`bounding box`
+        to prefetch, or zero to disable prefetching
+        """
+
+    @property
+    @ROS.parameter(ROS_D_TILE_CACHE_PATH, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def tile_cache_path(self) -> Optional[str]:
+        """Directory for the on-disk :term:`GetMap` response cache, or empty
+        string to disable the cache
+        """
+
+    @property
+    @ROS.parameter(
+        ROS_D_TILE_CACHE_MAX_BYTES, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY
+    )
+    def tile_cache_max_bytes(self) -> Optional[int]:
+        """Byte budget for the on-disk :term:`GetMap` response cache"""
+
+    @property
+    @ROS.parameter(ROS_D_TILE_CACHE_BBOX_QUANTUM)
+    def tile_cache_bbox_quantum(self) -> Optional[float]:
+        """Grid size in :term:`SRS` units that requested :term:`bounding boxes
+        <bounding box>` are snapped to when the tile cache is enabled (see
+        :attr:`.tile_cache_path`)
+        """
+
+    @property
+    @ROS.parameter(
+        ROS_D_GEOTRANSFORM_REGISTRY_SIZE, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY
+    )
+    def geotransform_registry_size(self) -> Optional[int]:
+        """Minimum capacity in :term:`orthoimage` geotransforms of the
+        process-wide :data:`.geotransform_registry`
+
+        The registry is shared with the other nodes in the process and uses
+        the largest size configured by any of them.
+        """
+
+    @property
+    @ROS.parameter(
+        ROS_D_GEOTRANSFORM_REGISTRY_HORIZON,
+        descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY,
+    )
+    def geotransform_registry_horizon(self) -> Optional[float]:
+        """Minimum age in seconds up to which an :term:`orthoimage`
+        geotransform is kept in the process-wide :data:`.geotransform_registry`
+        relative to the latest orthoimage, or 0 to bound the registry by
+        :attr:`.geotransform_registry_size` only
+
+        The registry uses the longest horizon configured by any node in the
+        process.
+        """
+
     @narrow_types
     def _create_publish_timer(self, publish_rate: float) -> Timer:
         """
@@ -330,6 +574,24 @@ class GISNode(Node):
     def _publish_timer(self, value: Timer) -> None:
         self.__publish_timer = value
 
+    def destroy_node(self) -> bool:
+        """Cancels pending background :term:`GetMap` requests before destroying
+        the node
+        """
+        # Executor.shutdown(cancel_futures=True) requires Python 3.9. Requests
+        # that have not started yet are all in-flight requests, and GetMap
+        # requests are only submitted from running orthoimage requests.
+        with self._in_flight_lock:
+            for future in self._in_flight.values():
+                future.cancel()
+        self._executor.shutdown(wait=False)
+        self._get_map_executor.shutdown(wait=False)
+        self._wms_session.close()
+        for local_raster in (self._local_imagery, self._local_dem):
+            if local_raster is not None:
+                local_raster.close()
+        return super().destroy_node()
+
     def publish(self):
         """
         Publish :attr:`.orthoimage` (:attr:`.ground_track_elevation` and
@@ -339,6 +601,93 @@ class GISNode(Node):
         """
         self.orthoimage
 
+    @narrow_types
+    def _create_wms_adapter(
+        self, pool_size: int, max_retries: int, backoff_factor: float
+    ) -> HTTPAdapter:
+        """Returns a pooled HTTP adapter with retries for WMS :term:`GetMap`
+        requests
+
+        :param pool_size: Maximum number of kept-alive connections
+        :param max_retries: Maximum number of retries for failed requests
+        :param backoff_factor: Exponential backoff factor in seconds
+        :return: HTTP adapter to mount on the WMS session
+        :raise ValueError: If pool size is not positive
+        """
+        if pool_size <= 0:
+            error_msg = f"WMS pool size must be positive ({pool_size} provided)."
+            self.get_logger().error(error_msg)
+            raise ValueError(error_msg)
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        return HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, max_retries=retry
+        )
+
+    @property
+    def wms_connection_pool_stats(self) -> Optional[Tuple[int, int]]:
+        """Number of WMS connection pool hits (requests that reused a kept-alive
+        connection) and misses (requests that opened a new connection), or
+        None if the WMS client is not yet instantiated
+
+        Computed from the connection pool counters only when read, so that
+        individual requests do not pay for it.
+        """
+        if self._wms_client is None:
+            return None
+
+        pool = self._wms_adapter.poolmanager.connection_from_url(
+            self._get_map_url(self._wms_client)
+        )
+        misses = pool.num_connections
+        return pool.num_requests - misses, misses
+
+    @staticmethod
+    def _get_map_url(wms_client) -> str:
+        """Returns the :term:`GetMap` HTTP GET endpoint advertised by the WMS
+        capabilities, or the WMS client URL if none is advertised
+        """
+        try:
+            return next(
+                method.get("url")
+                for method in wms_client.getOperationByName("GetMap").methods
+                if method.get("type").lower() == "get"
+            )
+        except (KeyError, StopIteration):
+            return wms_client.url
+
+    def _open_local_raster(self, path: Optional[str]):
+        """Returns a reader for a local GeoTIFF :term:`raster`, or None if no
+        path is provided
+
+        :param path: Path to the GeoTIFF file, or empty string
+        :return: :class:`.LocalRaster` instance or None
+        :raise ImportError: If ``rasterio`` is not installed
+        """
+        if not path:
+            return None
+
+        try:
+            # Optional dependency, only needed if local rasters are used
+            from .._local_raster import LocalRaster
+        except ImportError as e:
+            self.get_logger().error(
+                f"Could not import local raster backend, install the optional "
+                f"rasterio dependency to read {path}: {e}"
+            )
+            raise
+
+        srs = self.wms_srs
+        assert srs is not None
+        self.get_logger().info(f"Reading rasters from local file {path}.")
+        return LocalRaster(path, srs)
+
     def _try_wms_client_instantiation(self) -> None:
         """Attempts to instantiate :attr:`._wms_client`
 
@@ -400,11 +749,68 @@ class GISNode(Node):
 
         return bounding_box
 
+    @narrow_types
+    def _quantize_bounding_box(
+        self, bounding_box: BoundingBox, quantum: float
+    ) -> BoundingBox:
+        """Snaps :term:`bounding box` outwards to a grid of given size
+
+        The snapped bounding box always contains the input bounding box. Snapping
+        only serves the tile cache, so the input bounding box is returned
+        unchanged when the cache is disabled.
+
+        :param bounding_box: Bounding box to snap
+        :param quantum: Grid size in :term:`SRS` units, zero or negative to
+            return the input bounding box unchanged
+        :return: Snapped bounding box
+        """
+        if quantum <= 0 or self._tile_cache is None:
+            return bounding_box
+
+        quantized = BoundingBox()
+        quantized.min_pt.latitude = (
+            np.floor(bounding_box.min_pt.latitude / quantum) * quantum
+        )
+        quantized.min_pt.longitude = (
+            np.floor(bounding_box.min_pt.longitude / quantum) * quantum
+        )
+        quantized.max_pt.latitude = (
+            np.ceil(bounding_box.max_pt.latitude / quantum) * quantum
+        )
+        quantized.max_pt.longitude = (
+            np.ceil(bounding_box.max_pt.longitude / quantum) * quantum
+        )
+        return quantized
+
+    def _nav_sat_fix_cb(self, msg: NavSatFix) -> None:
+        """Callback for the :term:`global position` message from the
+        :term:`navigation filter`
+
+        Updates the :term:`vehicle` velocity estimate used for prefetching.
+        """
+        previous = self._previous_nav_sat_fix
+        self._previous_nav_sat_fix = msg
+        if previous is None:
+            return None
+
+        dt = (
+            rclpy.time.Time.from_msg(msg.header.stamp)
+            - rclpy.time.Time.from_msg(previous.header.stamp)
+        ).nanoseconds / 1e9
+        if dt <= 0:
+            return None
+
+        self._velocity = (
+            (msg.latitude - previous.latitude) / dt,
+            (msg.longitude - previous.longitude) / dt,
+        )
+
     @property
     @ROS.max_delay_ms(DELAY_DEFAULT_MS)
     @ROS.subscribe(
         "/mavros/global_position/global",
         QoSPresetProfiles.SENSOR_DATA.value,
+        callback=_nav_sat_fix_cb,
     )
     def nav_sat_fix(self) -> Optional[NavSatFix]:
         """Vehicle GPS fix, or None if unknown or too old"""
@@ -417,12 +823,20 @@ class GISNode(Node):
     def time_reference(self) -> Optional[TimeReference]:
         """:term:`FCU` time reference via :term:`MAVROS`"""
 
+    def _bounding_box_cb(self, msg: BoundingBox) -> None:
+        """Callback for the :term:`camera` :term:`FOV` :term:`bounding box`
+
+        Prefetches the :term:`orthoimage` for the predicted bounding box.
+        """
+        self._prefetch_orthoimage(msg)
+
     @property
     # @ROS.max_delay_ms(messaging.DELAY_DEFAULT_MS)
     @ROS.subscribe(
         f"/{ROS_NAMESPACE}"
         f'/{ROS_TOPIC_RELATIVE_FOV_BOUNDING_BOX.replace("~", BBOX_NODE_NAME)}',
         QoSPresetProfiles.SENSOR_DATA.value,
+        callback=_bounding_box_cb,
     )
     def bounding_box(self) -> Optional[BoundingBox]:
         """:term:`Bounding box` of approximate :term:`vehicle` :term:`camera`
@@ -482,7 +896,12 @@ class GISNode(Node):
         Sends GetMap request to GIS WMS for image and DEM layers and returns
         :attr:`.orthoimage` attribute.
 
-        Assumes zero raster as DEM if no DEM layer is available.
+        The image and DEM requests are sent concurrently and the result is
+        assembled when both have completed.
+
+        Assumes zero raster as DEM if no DEM layer is available. If the DEM
+        request fails, the last successfully retrieved DEM is resampled to the
+        bounding box instead (see :meth:`._fallback_dem`).
 
         TODO: Currently no support for separate arguments for imagery and height
         layers. Assumes height layer is available at same CRS as imagery layer.
@@ -497,17 +916,24 @@ class GISNode(Node):
         bbox = messaging.bounding_box_to_bbox(bounding_box)
 
         self.get_logger().info("Requesting new orthoimage")
-        img: np.ndarray = self._get_map(
-            layers, styles, srs, bbox, size, format_, transparency
-        )
-        if img is None:
-            self.get_logger().error("Could not get orthoimage from GIS server")
-            return None
+        if self._local_imagery is not None:
+            img_future = self._get_map_executor.submit(
+                self._read_local_raster, self._local_imagery, bbox, size
+            )
+        else:
+            img_future = self._get_map_executor.submit(
+                self._get_map, layers, styles, srs, bbox, size, format_, transparency
+            )
 
-        dem: Optional[np.ndarray] = None
-        if len(dem_layers) > 0 and dem_layers[0]:
+        dem_future: Optional[Future] = None
+        if self._local_dem is not None:
+            dem_future = self._get_map_executor.submit(
+                self._read_local_raster, self._local_dem, bbox, size, grayscale=True
+            )
+        elif self._local_imagery is None and len(dem_layers) > 0 and dem_layers[0]:
             self.get_logger().info("Requesting new DEM")
-            dem = self._get_map(
+            dem_future = self._get_map_executor.submit(
+                self._get_map,
                 dem_layers,
                 dem_styles,
                 srs,
@@ -517,20 +943,90 @@ class GISNode(Node):
                 transparency,
                 grayscale=True,
             )
-            if dem is not None and dem.ndim == 2:
-                dem = np.expand_dims(dem, axis=2)
-        else:
+
+        img: Optional[np.ndarray] = img_future.result()
+        dem: Optional[np.ndarray] = (
+            dem_future.result() if dem_future is not None else None
+        )
+        if img is None:
+            self.get_logger().error("Could not get orthoimage from GIS server")
+            return None
+
+        if dem_future is None:
             # Assume flat (:=zero) terrain if no DEM layer provided
             self.get_logger().debug(
                 "No DEM layer provided, assuming flat (=zero) elevation model."
             )
-            dem = np.zeros_like(img)
+            dem = np.zeros((*img.shape[0:2], 1), dtype=np.uint8)
+        elif dem is None:
+            self.get_logger().warning(
+                "Could not get DEM from GIS server, falling back to last good DEM"
+            )
+            dem = self._fallback_dem(bounding_box, img.shape[0:2])
+        else:
+            if dem.ndim == 2:
+                dem = np.expand_dims(dem, axis=2)
+            self._last_dem = bounding_box, dem
 
-        # TODO: handle dem is None from _get_map call
         assert img is not None and dem is not None
         assert img.ndim == dem.ndim == 3
         return img, dem
 
+    def _fallback_dem(
+        self, bounding_box: BoundingBox, shape: Tuple[int, int]
+    ) -> np.ndarray:
+        """Returns the last successfully retrieved :term:`DEM` resampled to
+        the given :term:`bounding box`
+
+        Areas outside of the last DEM are filled by replicating its border
+        values. If no DEM has been retrieved yet, a flat (zero) DEM is returned.
+
+        :param bounding_box: Bounding box to resample the DEM to
+        :param shape: Output DEM shape (height, width)
+        :return: DEM of shape (height, width, 1)
+        """
+        last_dem = self._last_dem
+        if last_dem is None:
+            self.get_logger().warning(
+                "No previous DEM available, assuming flat (=zero) elevation model."
+            )
+            return np.zeros((*shape, 1), dtype=np.uint8)
+
+        src_bbox = messaging.bounding_box_to_bbox(last_dem[0])
+        dst_bbox = messaging.bounding_box_to_bbox(bounding_box)
+        src_dem = last_dem[1]
+        src_height, src_width = src_dem.shape[0:2]
+        height, width = shape
+
+        # Affine transformation from output pixel coordinates to last DEM
+        # pixel coordinates (origin at top left, north up)
+        src_lon_per_px = (src_bbox.right - src_bbox.left) / src_width
+        src_lat_per_px = (src_bbox.top - src_bbox.bottom) / src_height
+        dst_lon_per_px = (dst_bbox.right - dst_bbox.left) / width
+        dst_lat_per_px = (dst_bbox.top - dst_bbox.bottom) / height
+        M = np.float64(
+            [
+                [
+                    dst_lon_per_px / src_lon_per_px,
+                    0,
+                    (dst_bbox.left - src_bbox.left) / src_lon_per_px,
+                ],
+                [
+                    0,
+                    dst_lat_per_px / src_lat_per_px,
+                    (src_bbox.top - dst_bbox.top) / src_lat_per_px,
+                ],
+            ]
+        )
+        dem = cv2.warpAffine(
+            np.ascontiguousarray(src_dem),
+            M,
+            (width, height),
+            flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
+            borderMode=cv2.BORDER_REPLICATE,
+        )
+        return dem.reshape(height, width, 1)
+
     def _should_request_orthoimage(self) -> bool:
         """Returns True if a new orthoimage (including DEM) should be requested
         from onboard GIS
@@ -546,29 +1042,187 @@ class GISNode(Node):
         :return: True if new orthoimage should be requested from onboard GIS
         """
 
-        @narrow_types(self)
-        def _orthoimage_overlap_is_too_low(
-            new_bounding_box: BoundingBox,
-            old_bounding_box: BoundingBox,
-            min_map_overlap_update_threshold: float,
-        ) -> bool:
-            bbox = messaging.bounding_box_to_bbox(new_bounding_box)
-            bbox_previous = messaging.bounding_box_to_bbox(old_bounding_box)
-            bbox1, bbox2 = box(*bbox), box(*bbox_previous)
-            ratio1 = bbox1.intersection(bbox2).area / bbox1.area
-            ratio2 = bbox2.intersection(bbox1).area / bbox2.area
-            ratio = min(ratio1, ratio2)
-            if ratio > min_map_overlap_update_threshold:
-                return False
-
-            return True
-
-        return self.old_bounding_box is None or _orthoimage_overlap_is_too_low(
+        return self.old_bounding_box is None or self._overlap_is_too_low(
             self.bounding_box,
             self.old_bounding_box,
             self.min_map_overlap_update_threshold,
         )
 
+    @narrow_types
+    def _overlap_is_too_low(
+        self,
+        new_bounding_box: BoundingBox,
+        old_bounding_box: BoundingBox,
+        min_map_overlap_update_threshold: float,
+    ) -> bool:
+        """Returns True if the overlap ratio between the two :term:`bounding
+        boxes <bounding box>` is at or below the given threshold
+
+        :param new_bounding_box: Candidate new bounding box
+        :param old_bounding_box: Current bounding box
+        :param min_map_overlap_update_threshold: Overlap ratio threshold
+        :return: True if overlap is too low
+        """
+        bbox = messaging.bounding_box_to_bbox(new_bounding_box)
+        bbox_previous = messaging.bounding_box_to_bbox(old_bounding_box)
+        bbox1, bbox2 = box(*bbox), box(*bbox_previous)
+        ratio1 = bbox1.intersection(bbox2).area / bbox1.area
+        ratio2 = bbox2.intersection(bbox1).area / bbox2.area
+        ratio = min(ratio1, ratio2)
+        if ratio > min_map_overlap_update_threshold:
+            return False
+
+        return True
+
+    def _prefetch_orthoimage(self, bounding_box: BoundingBox) -> None:
+        """Requests the :term:`orthoimage` for the predicted next :term:`bounding
+        box` in the background
+
+        The next bounding box is predicted by shifting the current bounding box
+        by the :term:`vehicle` velocity over :attr:`.prefetch_lookahead`
+        seconds. A request is only made if the predicted bounding box would
+        trigger a new map update and is not already covered by a previous
+        prefetch.
+
+        :param bounding_box: Current :term:`camera` :term:`FOV` bounding box
+        """
+
+        @narrow_types(self)
+        def _predicted_bounding_box(
+            bounding_box: BoundingBox,
+            velocity: tuple,
+            lookahead: float,
+            quantum: float,
+        ) -> Optional[BoundingBox]:
+            if lookahead <= 0:
+                return None
+
+            delta_lat, delta_lon = (lookahead * v for v in velocity)
+            predicted = BoundingBox()
+            predicted.min_pt.latitude = bounding_box.min_pt.latitude + delta_lat
+            predicted.min_pt.longitude = bounding_box.min_pt.longitude + delta_lon
+            predicted.max_pt.latitude = bounding_box.max_pt.latitude + delta_lat
+            predicted.max_pt.longitude = bounding_box.max_pt.longitude + delta_lon
+            return self._quantize_bounding_box(predicted, quantum)
+
+        if self.old_bounding_box is None:
+            # Initial orthoimage has not been retrieved yet
+            return None
+
+        predicted = _predicted_bounding_box(
+            bounding_box,
+            self._velocity,
+            self.prefetch_lookahead,
+            self.tile_cache_bbox_quantum,
+        )
+        if predicted is None:
+            return None
+
+        threshold = self.min_map_overlap_update_threshold
+        if not self._overlap_is_too_low(predicted, self.old_bounding_box, threshold):
+            # Current orthoimage will still be good at the predicted location
+            return None
+
+        prefetch = self._prefetch
+        if prefetch is not None:
+            if not self._overlap_is_too_low(
+                predicted, prefetch.bounding_box, threshold
+            ):
+                # Already prefetched or prefetching for roughly the same location
+                return None
+
+            # Prediction has changed, previous prefetch is no longer needed
+            self._cancel_orthoimage_request(prefetch)
+
+        self.get_logger().info("Prefetching orthoimage for predicted bounding box")
+        self._prefetch = self._submit_orthoimage_request(predicted)
+
+    def _submit_orthoimage_request(
+        self, bounding_box: BoundingBox
+    ) -> Optional[_MapRequest]:
+        """Submits :term:`orthoimage` :term:`GetMap` requests for given
+        :term:`bounding box` to a background worker
+
+        If a request for the same bounding box is already in flight, its
+        future is shared instead of sending a duplicate request.
+
+        :param bounding_box: Bounding box to request the orthoimage for
+        :return: Submitted request, or None if the orthoimage size is not yet
+            known
+        """
+        size = self._orthoimage_size
+        if size is None:
+            return None
+
+        bbox = messaging.bounding_box_to_bbox(bounding_box)
+        key = (tuple(round(coord, 9) for coord in bbox), size)
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            if future is None:
+                future = self._executor.submit(
+                    self._request_orthoimage_for_bounding_box,
+                    bounding_box,
+                    size,
+                    self.wms_srs,
+                    self.wms_format,
+                    self.wms_transparency,
+                    self.wms_layers,
+                    self.wms_dem_layers,
+                    self.wms_styles,
+                    self.wms_dem_styles,
+                )
+                self._in_flight[key] = future
+            else:
+                self.get_logger().debug(
+                    "Request for same bounding box already in flight."
+                )
+
+        # Add callback outside of the lock - it is called immediately if the
+        # future is already done
+        future.add_done_callback(
+            lambda f: self._remove_in_flight_orthoimage_request(key, f)
+        )
+        return _MapRequest(key, bounding_box, future)
+
+    def _remove_in_flight_orthoimage_request(self, key: tuple, future: Future) -> None:
+        """Removes a completed request from the in-flight requests
+
+        Called from a background worker thread.
+        """
+        with self._in_flight_lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def _cancel_orthoimage_request(self, request: _MapRequest) -> None:
+        """Cancels a superseded :term:`orthoimage` request
+
+        Requests that have not yet started are cancelled. Requests that are
+        already running cannot be interrupted but their result will be ignored.
+        """
+        if request.future.cancel():
+            self.get_logger().debug(
+                f"Cancelled superseded GetMap request for {request.key}."
+            )
+
+    def _orthoimage_request_result(
+        self, request: _MapRequest
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Returns the orthophoto and DEM tuple of a completed request, or None
+        if the request was cancelled or failed
+        """
+        assert request.future.done()
+        if request.future.cancelled():
+            return None
+
+        exception = request.future.exception()
+        if exception is not None:
+            self.get_logger().error(
+                f"GetMap request ran into an unexpected exception: {exception}"
+            )
+            return None
+
+        return request.future.result()
+
     @property
     @ROS.publish(
         ROS_TOPIC_RELATIVE_ORTHOIMAGE,
@@ -585,17 +1239,44 @@ class GISNode(Node):
         # and the WMS server will choke? Should get a BoundingBox for center
         # of this BoundingBox instead, with limited width and height (in meters)
         bounding_box = deepcopy(self.bounding_box)  # TODO copy necessary here?
-        map = self._request_orthoimage_for_bounding_box(
-            bounding_box,
-            self._orthoimage_size,
-            self.wms_srs,
-            self.wms_format,
-            self.wms_transparency,
-            self.wms_layers,
-            self.wms_dem_layers,
-            self.wms_styles,
-            self.wms_dem_styles,
+        if bounding_box is None:
+            return None
+
+        # Snap to grid so that repeated flights over the same area hit the
+        # tile cache
+        bounding_box = self._quantize_bounding_box(
+            bounding_box, self.tile_cache_bbox_quantum
         )
+
+        threshold = self.min_map_overlap_update_threshold
+        request = self._pending
+        if request is None or self._overlap_is_too_low(
+            bounding_box, request.bounding_box, threshold
+        ):
+            if request is not None:
+                self._cancel_orthoimage_request(request)
+
+            prefetch = self._prefetch
+            if prefetch is not None and not self._overlap_is_too_low(
+                bounding_box, prefetch.bounding_box, threshold
+            ):
+                # Swap in the prefetched orthoimage (possibly still loading)
+                self.get_logger().info("Using prefetched orthoimage")
+                request, self._prefetch = prefetch, None
+            else:
+                request = self._submit_orthoimage_request(bounding_box)
+            self._pending = request
+
+        if request is None:
+            return None
+
+        if not request.future.done():
+            # Keep publishing the previous orthoimage until the new one arrives
+            return self._last_orthoimage
+
+        self._pending = None
+        bounding_box = request.bounding_box
+        map = self._orthoimage_request_result(request)
         if map is not None:
             img, dem = map
 
@@ -605,16 +1286,21 @@ class GISNode(Node):
             assert (
                 img.shape[2] == 3
             ), f"Image shape was {img.shape}, expected 3 channels."
-            assert dem.dtype == np.uint8  # todo get 16 bit dems?
+            assert dem.dtype in (np.uint8, np.uint16), f"DEM dtype was {dem.dtype}."
 
             # Convert image to grayscale (color not needed)
             # TODO: check BGR or RGB
             img = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            # add 8-bit zero array of padding for future support of 16 bit dems
-            orthoimage_stack = np.dstack((img, np.zeros_like(dem), dem))
-            image_msg = self._cv_bridge.cv2_to_imgmsg(
-                orthoimage_stack, encoding="passthrough"
-            )
+            # Split DEM into high and low byte channels. 8-bit DEMs (GetMap
+            # responses) have a zero high byte, 16-bit DEMs come from a local
+            # raster (see LocalRaster.read).
+            if dem.dtype == np.uint16:
+                dem_high = (dem >> 8).astype(np.uint8)
+                dem_low = (dem & 0xFF).astype(np.uint8)
+            else:
+                dem_high, dem_low = np.zeros_like(dem), dem
+            orthoimage_stack = np.dstack((img, dem_high, dem_low))
+            image_msg = messaging.array_to_image(orthoimage_stack)
 
             # new orthoimage stack, set old bounding box
             # TODO: this is brittle (old bounding box needs to always be set
@@ -640,6 +1326,7 @@ class GISNode(Node):
                 bounding_box,
                 image_msg.header,  # use same header as for orthoimage message
             )
+            self._last_orthoimage = image_msg
             return image_msg
         else:
             return None
@@ -650,23 +1337,21 @@ class GISNode(Node):
     )
     def geotransform(
         self, height: int, width: int, bbox: BoundingBox, header: Header
-    ) -> Optional[PointCloud2]:
+    ) -> Optional[Image]:
         """3x3 Affine transformation that transforms orthoimage frame pixel
         coordinates to WGS84 lon, lat coordinates
 
-        A :class:`sensor_msgs.msg.PointCloud2` message is repurposed to carry
-        the 3-by-3 affine transformation matrix since it has a header and is
-        flexible enough to carry this kind of data in a byte array. The data
-        is stored in a PointField called `affine_matrix`.
+        The 4-by-4 (3D) affine matrix is carried in a compact single channel
+        ``64FC1`` :class:`sensor_msgs.msg.Image` (see
+        :func:`.geotransform_to_image`) since it has a header and is flexible
+        enough to carry this kind of data in a byte array.
 
         .. note::
-            The reference frame is discontinous so we use timestamps in the
-            frame_id to couple it with the correct tf2 transformation chain.
-            This is to prevent significant interpolation errors whenever the
-            reference frame is updated and "jumps". The geotransform must be
-            published with the exact same timestamp as the orthoimage because
-            the orthoimage timestamp will be used as a proxy for the geotransform
-            timestamp downstream in the processing chain.
+            The reference frame is discontinous so downstream nodes must use
+            the geotransform of the exact orthoimage a :term:`pose` was
+            estimated against. The geotransform is published with the exact
+            same timestamp as the orthoimage and registered in the
+            :data:`.geotransform_registry` by that timestamp.
 
         :param height: Height in pixels of the :term:`reference` image
         :param width: Width in pixels of the :term:`reference` image (most
@@ -675,8 +1360,8 @@ class GISNode(Node):
         :param header: :term:`ROS` header for the outgoing message. Must be same
             as used for orthoimage message (with same timestamp) in order to
             enable matching tf2 transformations to correct geotransforms.
-        :return: :class:`sensor_msgs.msg.PointCloud2` message representing a
-            3D affine transformation
+        :return: :class:`sensor_msgs.msg.Image` message representing a 3D
+            affine transformation
         """
 
         def _boundingbox_to_geo_coords(
@@ -754,30 +1439,29 @@ class GISNode(Node):
         bounding_box_perimeter_meters = _bounding_box_perimeter_meters(bbox)
         M[2, 2] = bounding_box_perimeter_meters / bounding_box_perimeter_native
 
-        # Flatten the matrix and repurpose a PointCloud2 message to transport it
-        array_len = 16
-        byte_array = M.tobytes()
-        matrix_msg = PointCloud2()
-        matrix_msg.header = header
-        matrix_msg.height = 1
-        matrix_msg.width = array_len
-        matrix_msg.is_dense = False
-        matrix_msg.fields = [
-            PointField(
-                name="affine_matrix",
-                offset=0,
-                datatype=PointField.FLOAT64,
-                count=array_len,
-            )
-        ]
-        matrix_msg.data = byte_array
-
-        return matrix_msg
+        messaging.geotransform_registry.put(header.stamp, M)
+        return messaging.geotransform_to_image(M, header)
 
     def _get_map(
         self, layers, styles, srs, bbox, size, format_, transparency, grayscale=False
     ) -> Optional[np.ndarray]:
-        """Sends WMS :term:`GetMap` request and returns response :term:`raster`"""
+        """Sends WMS :term:`GetMap` request and returns response :term:`raster`
+
+        Response rasters are read from and stored to the on-disk tile cache if
+        it is enabled (see :attr:`.tile_cache_path`).
+        """
+        cache_key: Optional[str] = None
+        if self._tile_cache is not None:
+            cache_key = TileCache.key(
+                layers, styles, srs, bbox, size, format_, grayscale
+            )
+            cached = self._tile_cache.get(cache_key)
+            if cached is not None:
+                self.get_logger().debug(
+                    f"Tile cache hit for bbox: {bbox}, layers: {layers}."
+                )
+                return cached
+
         if self._wms_client is None:
             self.get_logger().warning(
                 "WMS client not instantiated. Skipping sending GetMap request."
@@ -788,17 +1472,9 @@ class GISNode(Node):
             f"Sending GetMap request for bbox: {bbox}, layers: {layers}."
         )
         try:
-            # Do not handle possible requests library related exceptions here
-            # (see class docstring)
             assert self._wms_client is not None
-            img: IO = self._wms_client.getmap(
-                layers=layers,
-                styles=styles,
-                srs=srs,
-                bbox=bbox,
-                size=size,
-                format=format_,
-                transparent=transparency,
+            img: IO = self._send_get_map_request(
+                self._wms_client, layers, styles, srs, bbox, size, format_, transparency
             )
         except ServiceException as se:
             self.get_logger().error(
@@ -811,6 +1487,10 @@ class GISNode(Node):
                 f"GetMap request failed because of a connection error: {ce}"
             )
             return None
+        except requests.exceptions.RequestException as e:
+            # Timeouts and HTTP errors that remain after retries
+            self.get_logger().error(f"GetMap request failed: {e}")
+            return None
         except Exception as e:
             # TODO: handle other exception types
             self.get_logger().error(
@@ -835,7 +1515,89 @@ class GISNode(Node):
             )
             return img
 
-        return _read_img(img, grayscale)
+        raster = _read_img(img, grayscale)
+        if raster is not None and cache_key is not None:
+            assert self._tile_cache is not None
+            try:
+                self._tile_cache.put(cache_key, raster)
+            except OSError as e:
+                self.get_logger().warning(f"Could not write to tile cache: {e}")
+
+        return raster
+
+    def _read_local_raster(
+        self, local_raster, bbox, size, grayscale=False
+    ) -> Optional[np.ndarray]:
+        """Reads :term:`raster` window from a local GeoTIFF
+
+        Returns the same array a :meth:`._get_map` request for the same
+        bounding box would, without the HTTP round trip and image decode.
+        """
+        try:
+            return local_raster.read(bbox, size, grayscale)
+        except Exception as e:
+            self.get_logger().error(
+                f"Reading local raster for bbox {bbox} ran into an unexpected "
+                f"exception: {e}"
+            )
+            return None
+
+    def _send_get_map_request(
+        self, wms_client, layers, styles, srs, bbox, size, format_, transparency
+    ) -> IO:
+        """Sends :term:`GetMap` request through the pooled WMS session and
+        returns the response body
+
+        The request parameters and service exception handling follow
+        ``OWSLib`` ``WebMapService.getmap`` so that the request is identical to
+        what ``OWSLib`` would send.
+
+        :param size: Raster size in pixels (height, width)
+        :raise ServiceException: If the WMS responds with a service exception
+        :raise requests.exceptions.RequestException: If the request fails
+        """
+        version = wms_client.version
+        params = {
+            "service": "WMS",
+            "version": version,
+            "request": "GetMap",
+            "layers": ",".join(layers),
+            "styles": ",".join(styles) if styles else "",
+            "width": str(size[1]),
+            "height": str(size[0]),
+        }
+        if version == "1.3.0":
+            if Crs(srs).axisorder == "yx":
+                bbox = (bbox[1], bbox[0], bbox[3], bbox[2])
+            params["crs"] = str(srs)
+            exceptions = "XML"
+        else:
+            params["srs"] = str(srs)
+            exceptions = "application/vnd.ogc.se_xml"
+        params["bbox"] = ",".join(repr(float(coord)) for coord in bbox)
+        params["format"] = str(format_)
+        params["transparent"] = str(transparency).upper()
+        params["exceptions"] = exceptions
+        params["bgcolor"] = "0xFFFFFF"
+
+        response = self._wms_session.get(
+            self._get_map_url(wms_client),
+            params=params,
+            timeout=(self._WMS_CONNECT_TIMEOUT, self.wms_timeout),
+        )
+        if response.status_code in (400, 401):
+            raise ServiceException(response.text)
+        response.raise_for_status()
+
+        content_type = response.headers.get("Content-Type", "").split(";")[0]
+        if content_type in (
+            "text/xml",
+            "application/xml",
+            "application/vnd.ogc.se_xml",
+        ):
+            raise ServiceException(response.text)
+
+        return io.BytesIO(response.content)
 
     @staticmethod
     def _create_src_corners(h: int, w: int) -> np.ndarray:
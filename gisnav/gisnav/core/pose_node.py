@@ -10,6 +10,7 @@ reference images and then solving the resulting :term:`PnP` problem.
     graph LR
         subgraph PoseNode
             pose[gisnav/pose_node/pose]
+            debug_image[gisnav/pose_node/debug/image/compressed]
         end
 
         subgraph TransformNode
@@ -24,30 +25,33 @@ reference images and then solving the resulting :term:`PnP` problem.
         image -->|sensor_msgs/Image| PoseNode
         pose -->|geometry_msgs/PoseStamped| MockGPSNode:::hidden
 """
-from copy import deepcopy
-from typing import Optional, Tuple
+import threading
+import time
+from typing import Final, List, Optional, Tuple
 
 import cv2
 import numpy as np
 import rclpy
 import tf2_ros
 import tf_transformations
-import torch
-from cv_bridge import CvBridge
-from kornia.feature import LoFTR
+from rcl_interfaces.msg import ParameterDescriptor
 from rclpy.node import Node
 from rclpy.qos import QoSPresetProfiles
-from sensor_msgs.msg import CameraInfo, Image, TimeReference
+from rclpy.timer import Timer
+from sensor_msgs.msg import CameraInfo, CompressedImage, Image, TimeReference
 from tf2_ros.static_transform_broadcaster import StaticTransformBroadcaster
 from tf2_ros.transform_broadcaster import TransformBroadcaster
 
 from .. import _messaging as messaging
 from .._decorators import ROS, narrow_types
+from .._matchers import MatcherEngine, MatcherName, MatcherPrecision, create_matcher
+from .._resolution import ResolutionController
 from ..constants import (
     DELAY_DEFAULT_MS,
     MAVROS_TOPIC_TIME_REFERENCE,
     ROS_NAMESPACE,
     ROS_TOPIC_CAMERA_INFO,
+    ROS_TOPIC_RELATIVE_DEBUG_IMAGE,
     ROS_TOPIC_RELATIVE_PNP_IMAGE,
     TRANSFORM_NODE_NAME,
 )
@@ -64,6 +68,58 @@ class PoseNode(Node):
     MIN_MATCHES = 20
     """Minimum number of keypoint matches before attempting pose estimation"""
 
+    ROS_D_MATCHER: MatcherName = "loftr"
+    """Default keypoint matcher backend"""
+
+    ROS_D_MATCHER_SCALE = 0.5
+    """Default image scaling factor for the downscaled LoFTR matcher backend"""
+
+    ROS_D_MATCHER_ENGINE: MatcherEngine = "eager"
+    """Default LoFTR matcher inference engine"""
+
+    ROS_D_MATCHER_PRECISION: MatcherPrecision = "fp32"
+    """Default LoFTR matcher inference precision"""
+
+    ROS_D_MATCHER_THREADS = 0
+    """Default number of LoFTR matcher inference threads (0 for engine
+    default)"""
+
+    ROS_D_MATCHER_MODEL_DIR = "~/.cache/gisnav/models"
+    """Default directory for exported LoFTR matcher models"""
+
+    ROS_D_MATCHER_PIXEL_BUDGET = 0
+    """Default maximum number of pixels per matched image (0 to match at full
+    resolution)"""
+
+    ROS_D_MATCHER_DEADLINE = 0.0
+    """Default target matching latency in seconds for adapting
+    :attr:`.matcher_pixel_budget` (0 to keep the budget fixed)"""
+
+    ROS_D_REFERENCE_CACHE_SIZE = 0
+    """Default maximum number of cached :term:`reference` image features,
+    disabled by default like :attr:`.TransformNode.ROS_D_ROTATION_BIN`"""
+
+    ROS_D_BATCH_SIZE = 1
+    """Default maximum number of :attr:`.image` messages matched in a single
+    forward pass"""
+
+    ROS_D_BATCH_LATENCY_BUDGET = 0.1
+    """Default maximum time in seconds an :attr:`.image` message waits for its
+    batch to fill up"""
+
+    ROS_D_DROP_STALE_FRAMES = False
+    """Default for matching only the newest :attr:`.image` message"""
+
+    ROS_D_DEBUG_IMAGE_RATE = 0.0
+    """Default maximum :attr:`.debug_image` publish rate in Hz (0 to disable)"""
+
+    _FRAME_STATS_LOG_PERIOD: Final = 5.0
+    """Minimum period in seconds for logging dropped frame and frame age
+    statistics"""
+
+    _ROS_PARAM_DESCRIPTOR_READ_ONLY: Final = ParameterDescriptor(read_only=True)
+    """A read only ROS parameter descriptor"""
+
     def __init__(self, *args, **kwargs):
         """Class initializer
 
@@ -71,12 +127,58 @@ class PoseNode(Node):
         :param kwargs: Keyword arguments to parent :class:`.Node` constructor
         """
         super().__init__(*args, **kwargs)
-        self._device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
-        self._model = LoFTR(pretrained="outdoor")
-        self._model.to(self._device)
+        matcher, matcher_scale = self.matcher, self.matcher_scale
+        reference_cache_size = self.reference_cache_size
+        matcher_engine, matcher_threads = self.matcher_engine, self.matcher_threads
+        matcher_model_dir = self.matcher_model_dir
+        matcher_precision = self.matcher_precision
+        assert matcher_precision is not None
+        assert matcher is not None and matcher_scale is not None
+        assert reference_cache_size is not None
+        assert matcher_engine is not None and matcher_threads is not None
+        assert matcher_model_dir is not None
+        self._matcher = create_matcher(
+            matcher,
+            matcher_scale,
+            reference_cache_size,
+            matcher_engine,
+            matcher_threads,
+            matcher_model_dir,
+            matcher_precision,
+        )
+
+        pixel_budget, deadline = self.matcher_pixel_budget, self.matcher_deadline
+        assert pixel_budget is not None and deadline is not None
+        self._resolution: Optional[ResolutionController] = (
+            ResolutionController(pixel_budget, deadline) if pixel_budget > 0 else None
+        )
 
-        self._cv_bridge = CvBridge()
+        # Image messages waiting for a batched forward pass, the timer flushes
+        # an incomplete batch when the latency budget runs out
+        self._batch: List[Image] = []
+        self._batch_timer: Optional[Timer] = None
+
+        # Single-slot mailbox holding the newest image message for the
+        # inference worker thread when stale frames are dropped
+        self._mailbox: Optional[Image] = None
+        self._mailbox_condition = threading.Condition()
+        self._dropped_frames = 0
+        self._published_frames = 0
+        self._frame_age: Optional[float] = None
+        self._stopped = False
+        self._worker: Optional[threading.Thread] = None
+
+        # Single-slot mailbox holding the latest matches for the debug image
+        # worker thread, submissions are throttled to the debug image rate
+        self._debug_mailbox: Optional[tuple] = None
+        self._debug_matches: Optional[tuple] = None
+        self._debug_condition = threading.Condition()
+        self._debug_next = 0.0
+        self._debug_worker: Optional[threading.Thread] = None
+
+        # Camera resolution the matcher was last prepared for
+        self._matcher_shape: Optional[Tuple[int, int]] = None
 
         # initialize subscription
         self.camera_info
@@ -105,6 +207,38 @@ class PoseNode(Node):
         )
         self.static_broadcaster.sendTransform([transform_camera])
 
+        if self.drop_stale_frames:
+            self._worker = threading.Thread(
+                target=self._inference_worker,
+                name="gisnav_pose_inference",
+                daemon=True,
+            )
+            self._worker.start()
+
+        debug_image_rate = self.debug_image_rate
+        assert debug_image_rate is not None
+        if debug_image_rate > 0:
+            self._debug_period = 1.0 / debug_image_rate
+            self._debug_worker = threading.Thread(
+                target=self._debug_image_worker,
+                name="gisnav_pose_debug",
+                daemon=True,
+            )
+            self._debug_worker.start()
+
+    def destroy_node(self) -> bool:
+        """Stops the inference and debug image worker threads before destroying
+        the node
+        """
+        for condition in (self._mailbox_condition, self._debug_condition):
+            with condition:
+                self._stopped = True
+                condition.notify()
+        for worker in (self._worker, self._debug_worker):
+            if worker is not None:
+                worker.join()
+        return super().destroy_node()
+
     @property
     @ROS.subscribe(
         MAVROS_TOPIC_TIME_REFERENCE,
@@ -113,19 +247,291 @@ class PoseNode(Node):
     def time_reference(self) -> Optional[TimeReference]:
         """:term:`FCU` time reference via :term:`MAVROS`"""
 
+    def _camera_info_cb(self, msg: CameraInfo) -> None:
+        """Callback for :attr:`.camera_info` message
+
+        Prepares the :attr:`.matcher` for the :term:`camera` resolution when it
+        changes, so that the exported LoFTR :attr:`.matcher_engine` starts
+        exporting and loading the model for the input shape before the first
+        :attr:`.image` message arrives. The export runs in the background and
+        images are matched in eager mode until it is done, so this does not
+        block the executor.
+        """
+        shape = (msg.height, msg.width)
+        if shape == self._matcher_shape:
+            return None
+        self._matcher_shape = shape
+
+        if self._resolution is not None:
+            shape = self._resolution.resized_shape(shape, self._resolution.scale(shape))
+        self.get_logger().info(
+            f"Preparing keypoint matcher for {shape[1]}x{shape[0]} images."
+        )
+        self._matcher.prepare(shape)
+
     @property
     # @ROS.max_delay_ms(messaging.DELAY_SLOW_MS) - gst plugin does not enable timestamp?
     @ROS.subscribe(
         ROS_TOPIC_CAMERA_INFO,
         QoSPresetProfiles.SENSOR_DATA.value,
+        callback=_camera_info_cb,
     )
     def camera_info(self) -> Optional[CameraInfo]:
         """Camera info for determining appropriate :attr:`.orthoimage` resolution"""
 
+    @property
+    @ROS.parameter(ROS_D_MATCHER, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def matcher(self) -> Optional[str]:
+        """Keypoint matcher backend
+
+        One of ``loftr``, ``loftr_downscaled``, ``orb`` or ``akaze`` (see
+        :mod:`._matchers`). The ORB and AKAZE backends are intended for
+        CPU-only hardware where LoFTR is too slow.
+        """
+
+    @property
+    @ROS.parameter(ROS_D_MATCHER_SCALE, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def matcher_scale(self) -> Optional[float]:
+        """Image scaling factor for the ``loftr_downscaled`` :attr:`.matcher`"""
+
+    @property
+    @ROS.parameter(ROS_D_MATCHER_ENGINE, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def matcher_engine(self) -> Optional[str]:
+        """Inference engine for the LoFTR :attr:`.matcher` backends
+
+        One of ``eager`` (PyTorch eager mode), ``torchscript`` or ``onnx`` (ONNX
+        Runtime CPU execution provider). The exported engines export the model
+        with fixed input shapes when :attr:`.camera_info` for a new
+        :term:`camera` resolution is received and store it in
+        :attr:`.matcher_model_dir`. Input shapes that change at run time, e.g.
+        with :attr:`.matcher_deadline`, are exported on their first frame.
+        Models are exported in a background thread and frames are matched in
+        eager mode until the model for their input shape is ready.
+        """
+
+    @property
+    @ROS.parameter(ROS_D_MATCHER_PRECISION, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def matcher_precision(self) -> Optional[str]:
+        """Inference precision for the LoFTR :attr:`.matcher` backends
+
+        One of ``fp32``, ``int8`` (dynamically quantized transformer layers,
+        CPU only) or ``fp16`` (CUDA and ``eager`` :attr:`.matcher_engine`
+        only). The node fails to start if the precision is not supported on
+        the available device, there is no silent fallback to ``fp32``.
+
+        Quantization trades some keypoint accuracy for lower CPU time and
+        memory use. Check the :term:`pose` accuracy on recorded :term:`stacks
+        <stack>` with ``test/benchmark/pose_regression.py`` before deploying a
+        quantized precision. The ``onnx`` engine ``int8`` model can be
+        statically calibrated with ``test/benchmark/calibrate_int8.py``.
+        """
+
+    @property
+    @ROS.parameter(ROS_D_MATCHER_THREADS, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def matcher_threads(self) -> Optional[int]:
+        """Number of intra-op threads for the exported LoFTR
+        :attr:`.matcher_engine`, or 0 for the engine default
+        """
+
+    @property
+    @ROS.parameter(ROS_D_MATCHER_MODEL_DIR, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def matcher_model_dir(self) -> Optional[str]:
+        """Directory for exported LoFTR models"""
+
+    @property
+    @ROS.parameter(
+        ROS_D_MATCHER_PIXEL_BUDGET, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY
+    )
+    def matcher_pixel_budget(self) -> Optional[int]:
+        """Maximum number of pixels per :term:`query` and :term:`reference`
+        image passed to the :attr:`.matcher`, or 0 to match at full resolution
+
+        Larger images are downsampled and the matched keypoints are scaled back
+        to full resolution before solving :term:`PnP`. The budget is adapted
+        at run time if :attr:`.matcher_deadline` is set.
+        """
+
+    @property
+    @ROS.parameter(ROS_D_MATCHER_DEADLINE, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def matcher_deadline(self) -> Optional[float]:
+        """Target latency in seconds for matching an :attr:`.image` message, or
+        0 to keep :attr:`.matcher_pixel_budget` fixed
+
+        The pixel budget is decreased when matching takes longer than the
+        deadline and increased up to the input resolution when it is faster.
+        Use this to hold a fixed :term:`pose` rate across :term:`cameras
+        <camera>` of different resolutions.
+        """
+
+    @property
+    @ROS.parameter(
+        ROS_D_REFERENCE_CACHE_SIZE, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY
+    )
+    def reference_cache_size(self) -> Optional[int]:
+        """Maximum number of cached :term:`reference` image features, or 0 to
+        encode the reference image for every frame
+
+        The reference image only changes when a new :term:`orthoimage` arrives
+        or the :attr:`.TransformNode.rotation_bin` changes, so usually only the
+        query image needs to be encoded.
+
+        .. note::
+            This cache is coupled to :attr:`.TransformNode.rotation_bin`.
+            Without rotation binning every reference image is rotated by the
+            exact heading and is unique, so the cache never hits but still
+            hashes every reference image and holds the features of up to this
+            many references, tens of MB each for LoFTR and possibly in GPU
+            memory. Enable the cache only together with rotation binning.
+        """
+
+    @property
+    @ROS.parameter(ROS_D_BATCH_SIZE, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def batch_size(self) -> Optional[int]:
+        """Maximum number of :attr:`.image` messages matched in a single
+        forward pass
+
+        Batching improves throughput on multi-core CPUs at the cost of
+        latency. Use 1 to match each message as soon as it arrives.
+        """
+
+    @property
+    @ROS.parameter(
+        ROS_D_BATCH_LATENCY_BUDGET, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY
+    )
+    def batch_latency_budget(self) -> Optional[float]:
+        """Maximum time in seconds an :attr:`.image` message waits for its
+        batch to fill up before an incomplete batch is matched
+        """
+
+    @property
+    @ROS.parameter(ROS_D_DROP_STALE_FRAMES, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def drop_stale_frames(self) -> Optional[bool]:
+        """If True, only the newest :attr:`.image` message is matched
+
+        Matching runs on a dedicated worker thread that always takes the newest
+        message, and messages that arrive while the worker is busy replace any
+        message still waiting. Pose latency then stays bounded even if
+        matching is slower than the camera frame rate. :attr:`.batch_size` is
+        ignored in this mode.
+        """
+
+    @property
+    @ROS.parameter(ROS_D_DEBUG_IMAGE_RATE, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def debug_image_rate(self) -> Optional[float]:
+        """Maximum :attr:`.debug_image` publish rate in Hz, or 0 to disable the
+        debug image
+
+        The debug image is rendered and compressed on a dedicated worker thread
+        so that it does not slow down :term:`pose` estimation. When disabled,
+        no debug data is copied or rendered.
+        """
+
+    @property
+    def frame_stats(self) -> Tuple[int, int, Optional[float]]:
+        """Number of published and dropped :attr:`.image` messages, and the
+        age in seconds of the latest published message at publish time
+        """
+        return self._published_frames, self._dropped_frames, self._frame_age
+
     def _image_cb(self, msg: Image) -> None:
-        """Callback for :attr:`.image` message"""
-        preprocessed = self.preprocess(msg)
-        inferred = self.inference(preprocessed)
+        """Callback for :attr:`.image` message
+
+        Matches the message immediately, adds it to the pending batch if
+        batching is enabled (see :attr:`.batch_size`), or hands it over to the
+        inference worker thread if stale frames are dropped (see
+        :attr:`.drop_stale_frames`).
+        """
+        if self._worker is not None:
+            with self._mailbox_condition:
+                if self._mailbox is not None:
+                    self._dropped_frames += 1
+                self._mailbox = msg
+                self._mailbox_condition.notify()
+            return None
+
+        batch_size = self.batch_size
+        assert batch_size is not None
+        self._batch.append(msg)
+
+        if len(self._batch) >= batch_size:
+            self._flush_batch()
+        elif self._batch_timer is None:
+            latency_budget = self.batch_latency_budget
+            assert latency_budget is not None
+            self._batch_timer = self.create_timer(latency_budget, self._flush_batch)
+
+    def _flush_batch(self) -> None:
+        """Matches all pending :attr:`.image` messages in a single forward pass
+        and publishes a :term:`pose` for each of them
+        """
+        if self._batch_timer is not None:
+            self.destroy_timer(self._batch_timer)
+            self._batch_timer = None
+
+        batch, self._batch = self._batch, []
+        if len(batch) == 0:
+            return None
+
+        self._match(batch)
+
+    def _inference_worker(self) -> None:
+        """Matches the newest :attr:`.image` message from the mailbox until the
+        node is destroyed
+        """
+        while True:
+            with self._mailbox_condition:
+                while self._mailbox is None and not self._stopped:
+                    self._mailbox_condition.wait()
+                if self._stopped:
+                    return None
+                msg, self._mailbox = self._mailbox, None
+
+            try:
+                self._match([msg])
+            except Exception as e:
+                self.get_logger().error(
+                    f"Inference worker ran into an unexpected exception: {e}"
+                )
+
+    def _match(self, batch: List[Image]) -> None:
+        """Matches :attr:`.image` messages and publishes a :term:`pose` for
+        each of them
+        """
+        start = time.perf_counter()
+        preprocessed = [self.preprocess(msg) for msg in batch]
+        if len(batch) == 1:
+            inferred = [self.inference(preprocessed[0])]
+        else:
+            inferred = self.inference_batch(preprocessed)
+        latency = time.perf_counter() - start
+        self.get_logger().debug(
+            f"Matched batch of {len(batch)} images in {latency:.3f} seconds."
+        )
+
+        if self._resolution is not None:
+            # Budget has not changed since downsampling so the scale is the same.
+            # The budget is adapted to the per-frame latency so that it does not
+            # depend on the batch size.
+            shape = preprocessed[0][0].shape
+            scale = self._resolution.scale(shape)
+            pixels = round(shape[0] * shape[1] * scale**2)
+            self._resolution.update(latency / len(batch), pixels)
+            self.get_logger().debug(
+                f"Matcher pixel budget: {self._resolution.pixel_budget}."
+            )
+
+        hits, misses = self._matcher.cache_stats
+        self.get_logger().debug(
+            f"Reference feature cache hits: {hits}, misses: {misses}."
+        )
+
+        for msg, inferred_data in zip(batch, inferred):
+            self._publish_pose(msg, inferred_data)
+
+    def _publish_pose(self, msg: Image, inferred) -> None:
+        """Solves :term:`PnP` for the matched :attr:`.image` message and
+        publishes the resulting transform
+        """
         pose_stamped = self.postprocess(inferred)
 
         if pose_stamped is None:
@@ -169,26 +575,23 @@ class PoseNode(Node):
             stamp, "world", "camera_pinhole", q, camera_pos
         )
         self.broadcaster.sendTransform([transform_camera])
+        self._update_frame_stats(msg)
 
-        debug_msg = messaging.get_transform(
-            self, "world", "camera_pinhole", rclpy.time.Time()
-        )
-
-        debug_ref_image = self._cv_bridge.imgmsg_to_cv2(
-            deepcopy(msg), desired_encoding="passthrough"
+    def _update_frame_stats(self, msg: Image) -> None:
+        """Updates :attr:`.frame_stats` for a published :attr:`.image` message
+        and logs them periodically
+        """
+        self._published_frames += 1
+        self._frame_age = (
+            self.get_clock().now() - rclpy.time.Time.from_msg(msg.header.stamp)
+        ).nanoseconds / 1e9
+        self.get_logger().info(
+            f"Published {self._published_frames} poses, dropped "
+            f"{self._dropped_frames} stale frames, latest frame age "
+            f"{self._frame_age:.3f} seconds.",
+            throttle_duration_sec=self._FRAME_STATS_LOG_PERIOD,
         )
 
-        # The child frame is the 'camera' frame of the PnP problem as
-        # defined here: https://docs.opencv.org/4.x/d5/d1f/calib3d_solvePnP.html
-        if debug_msg is not None and self.camera_info is not None:
-            debug_ref_image = debug_ref_image[:, :, 1]  # second channel is world
-            messaging.visualize_transform(
-                debug_msg,
-                debug_ref_image,
-                self.camera_info.height,
-                "Camera position in world frame",
-            )
-
     @property
     @ROS.max_delay_ms(DELAY_DEFAULT_MS)
     @ROS.subscribe(
@@ -216,8 +619,9 @@ class PoseNode(Node):
     @narrow_types
     def preprocess(
         self, image_quad: Image
-    ) -> Tuple[dict, np.ndarray, np.ndarray, np.ndarray]:
-        """Converts incoming 4-channel image to torch tensors
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Splits incoming 4-channel image into query, reference and elevation
+        arrays
 
         :param image_quad: A 4-channel image where the first channel is the
             :term:`query`, the second channel is the 8-bit
@@ -225,9 +629,7 @@ class PoseNode(Node):
             represent the 16-bit :term:`elevation reference`.
         """
         # Convert the ROS Image message to an OpenCV image
-        full_image_cv = self._cv_bridge.imgmsg_to_cv2(
-            image_quad, desired_encoding="passthrough"
-        )
+        full_image_cv = messaging.image_to_array(image_quad)
 
         # Check that the image has 4 channels
         channels = full_image_cv.shape[2]
@@ -244,35 +646,67 @@ class PoseNode(Node):
             elevation_16bit_high.astype(np.uint16) << 8
         ) | elevation_16bit_low.astype(np.uint16)
 
-        # Optionally display images
-        # self._display_images("Query", query_img, "Reference", reference_img)
+        return query_img, reference_img, reference_elevation
 
-        if torch.cuda.is_available():
-            qry_tensor = torch.Tensor(query_img[None, None]).cuda() / 255.0
-            ref_tensor = torch.Tensor(reference_img[None, None]).cuda() / 255.0
-        else:
-            qry_tensor = torch.Tensor(query_img[None, None]) / 255.0
-            ref_tensor = torch.Tensor(reference_img[None, None]) / 255.0
-
-        return (
-            {"image0": qry_tensor, "image1": ref_tensor},
-            query_img,
-            reference_img,
-            reference_elevation,
-        )
+    def _downsample(
+        self, query_img: np.ndarray, reference_img: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Downsamples the :term:`query` and :term:`reference` images to the
+        :attr:`.matcher_pixel_budget`
+
+        Both images have the same shape because they arrive in the same
+        :attr:`.image` stack.
+
+        :return: Tuple of downsampled query and reference images and the
+            (x, y) factors that scale matched keypoints back to full resolution
+        """
+        if self._resolution is None:
+            return query_img, reference_img, np.ones(2, dtype=np.float32)
+
+        scale = self._resolution.scale(query_img.shape)
+        query_img, factors = self._resolution.resize(query_img, scale)
+        reference_img, _ = self._resolution.resize(reference_img, scale)
+        return query_img, reference_img, factors
 
     @staticmethod
-    def _display_images(*args):
-        """Displays images using OpenCV"""
-        for i in range(0, len(args), 2):
-            cv2.imshow(args[i], args[i + 1])
-        cv2.waitKey(1)
+    def _upsample(results: dict, factors: np.ndarray) -> dict:
+        """Scales matched keypoints back to full resolution"""
+        if np.all(factors == 1.0):
+            return results
+        return {
+            **results,
+            "keypoints0": results["keypoints0"] * factors,
+            "keypoints1": results["keypoints1"] * factors,
+        }
 
     def inference(self, preprocessed_data):
         """Do keypoint matching."""
-        with torch.no_grad():
-            results = self._model(preprocessed_data[0])
-        return results, *preprocessed_data[1:]
+        query_img, reference_img, factors = self._downsample(*preprocessed_data[0:2])
+        results = self._matcher.match(query_img, reference_img)
+        return self._upsample(results, factors), *preprocessed_data
+
+    def inference_batch(self, preprocessed_batch: list) -> list:
+        """Do keypoint matching for multiple image pairs
+
+        Matcher backends that support batching (LoFTR) match all pairs in a
+        single forward pass.
+
+        :param preprocessed_batch: List of :meth:`.preprocess` outputs
+        :return: List of :meth:`.inference` outputs in the same order
+        """
+        downsampled = [
+            self._downsample(*preprocessed_data[0:2])
+            for preprocessed_data in preprocessed_batch
+        ]
+        matches = self._matcher.match_batch(
+            [(query_img, reference_img) for query_img, reference_img, _ in downsampled]
+        )
+        return [
+            (self._upsample(results, factors), *preprocessed_data)
+            for results, (*_, factors), preprocessed_data in zip(
+                matches, downsampled, preprocessed_batch
+            )
+        ]
 
     def postprocess(self, inferred_data) -> Optional[Tuple[np.ndarray, np.ndarray]]:
         """Filters matches based on confidence threshold and calculates :term:`pose`"""
@@ -283,10 +717,10 @@ class PoseNode(Node):
         ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
             results, query_img, reference_img, elevation = inferred_data
 
-            conf = results["confidence"].cpu().numpy()
+            conf = results["confidence"]
             valid = conf > self.CONFIDENCE_THRESHOLD
-            mkp_qry = results["keypoints0"].cpu().numpy()[valid, :]
-            mkp_ref = results["keypoints1"].cpu().numpy()[valid, :]
+            mkp_qry = results["keypoints0"][valid, :]
+            mkp_ref = results["keypoints1"][valid, :]
 
             if mkp_qry is None or len(mkp_qry) < self.MIN_MATCHES:
                 return None
@@ -300,8 +734,8 @@ class PoseNode(Node):
             mkp_qry[:, 1] = camera_info.height - mkp_qry[:, 1]
             r, t = self._compute_pose(mkp2_3d, mkp_qry, k_matrix)
 
-            self._visualize_matches_and_pose(
-                query_img.copy(), reference_img.copy(), mkp_qry, mkp_ref, k_matrix, r, t
+            self._submit_debug_image(
+                query_img, reference_img, mkp_qry, mkp_ref, k_matrix, r, t
             )
 
             return r, t
@@ -333,46 +767,91 @@ class PoseNode(Node):
         r_matrix, _ = cv2.Rodrigues(r)
         return r_matrix, t
 
-    def _visualize_matches_and_pose(self, qry, ref, mkp_qry, mkp_ref, k, r, t):
-        """Visualizes matches and projected :term:`FOV`"""
+    def _submit_debug_image(self, *matches) -> None:
+        """Hands matches over to the debug image worker thread if a
+        :attr:`.debug_image` is due
 
-        # We modify these from ROS to cv2 axes convention so we create copies
-        mkp_qry = mkp_qry.copy()
-        mkp_ref = mkp_ref.copy()
+        Returns immediately if the debug image is disabled or was published
+        less than one :attr:`.debug_image_rate` period ago. The arrays are not
+        copied: they are not modified after :meth:`.postprocess`.
 
-        h_matrix = k @ np.delete(np.hstack((r, t)), 2, 1)
-        projected_fov = self._project_fov(qry, h_matrix)
+        :param matches: Query and reference images, matched keypoints in
+            :term:`ROS` and OpenCV conventions respectively, camera intrinsics
+            matrix, and :term:`PnP` rotation and translation
+        """
+        if self._debug_worker is None:
+            return None
 
-        # Invert the y-coordinate, considering the image height (input r and t
-        # are in ROS convention where origin is at bottom left of image, we
-        # want origin to be at top left for cv2
-        h = self.camera_info.height
-        mkp_ref[:, 1] = mkp_ref[:, 1]
-        mkp_qry[:, 1] = h - mkp_qry[:, 1]
+        now = time.monotonic()
+        if now < self._debug_next:
+            return None
+        self._debug_next = now + self._debug_period
 
-        projected_fov[:, :, 1] = h - projected_fov[:, :, 1]
-        img_with_fov = cv2.polylines(
-            ref, [np.int32(projected_fov)], True, 255, 3, cv2.LINE_AA
-        )
+        header = messaging.create_header(self, "", self.time_reference)
+        with self._debug_condition:
+            self._debug_mailbox = (header, *matches)
+            self._debug_condition.notify()
 
-        mkp_qry = [cv2.KeyPoint(x[0], x[1], 1) for x in mkp_qry]
-        mkp_ref = [cv2.KeyPoint(x[0], x[1], 1) for x in mkp_ref]
+    def _debug_image_worker(self) -> None:
+        """Publishes :attr:`.debug_image` for matches from the debug mailbox
+        until the node is destroyed
+        """
+        while True:
+            with self._debug_condition:
+                while self._debug_mailbox is None and not self._stopped:
+                    self._debug_condition.wait()
+                if self._stopped:
+                    return None
+                self._debug_matches, self._debug_mailbox = self._debug_mailbox, None
+
+            try:
+                self.debug_image
+            except Exception as e:
+                self.get_logger().error(
+                    f"Debug image worker ran into an unexpected exception: {e}"
+                )
 
-        matches = [cv2.DMatch(i, i, 0) for i in range(len(mkp_qry))]
+    @property
+    @ROS.publish(ROS_TOPIC_RELATIVE_DEBUG_IMAGE, QoSPresetProfiles.SENSOR_DATA.value)
+    def debug_image(self) -> Optional[CompressedImage]:
+        """JPEG compressed :term:`reference` and :term:`query` image side by
+        side with keypoint matches, the projected :term:`FOV` and the camera
+        position drawn on top
 
-        match_img = cv2.drawMatches(
-            img_with_fov,
-            mkp_ref,
-            qry,
-            mkp_qry,
-            matches,
-            None,
-            matchColor=(0, 255, 0),
-            flags=2,
+        Published at most at :attr:`.debug_image_rate`.
+        """
+        if self._debug_matches is None:
+            return None
+
+        header, qry, ref, mkp_qry, mkp_ref, k, r, t = self._debug_matches
+        h, w = qry.shape[0:2]
+
+        # Input keypoints and r and t are in ROS convention where origin is at
+        # bottom left of image, cv2 origin is at top left
+        mkp_qry = np.column_stack((mkp_qry[:, 0], h - mkp_qry[:, 1]))
+
+        h_matrix = k @ np.delete(np.hstack((r, t)), 2, 1)
+        projected_fov = self._project_fov(qry, h_matrix)
+        projected_fov[:, :, 1] = h - projected_fov[:, :, 1]
+
+        camera_pos = (-r.T @ t).squeeze()
+
+        canvas = cv2.cvtColor(np.hstack((ref, qry)), cv2.COLOR_GRAY2BGR)
+        cv2.polylines(
+            canvas, [np.int32(projected_fov)], True, (255, 255, 255), 3, cv2.LINE_AA
+        )
+        cv2.circle(
+            canvas, (int(camera_pos[0]), int(h - camera_pos[1])), 5, (0, 0, 255), -1
         )
+        lines = np.stack((mkp_ref, mkp_qry + (ref.shape[1], 0)), axis=1)
+        cv2.polylines(canvas, np.int32(lines), False, (0, 255, 0), 1, cv2.LINE_AA)
+
+        ok, buffer = cv2.imencode(".jpg", canvas)
+        if not ok:
+            self.get_logger().warning("Could not encode debug image.")
+            return None
 
-        cv2.imshow("Matches and field of view", match_img)
-        cv2.waitKey(1)
+        return CompressedImage(header=header, format="jpeg", data=buffer.tobytes())
 
     @staticmethod
     def _project_fov(img, h_matrix):
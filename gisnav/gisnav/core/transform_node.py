@@ -9,6 +9,7 @@ image based on :term:`vehicle` heading, and then cropping it based on the
     graph LR
         subgraph TransformNode
             pnp_image[gisnav/transform_node/image]
+            reference_time[gisnav/transform_node/reference/time]
         end
 
         subgraph gscam
@@ -29,21 +30,22 @@ image based on :term:`vehicle` heading, and then cropping it based on the
         orthoimage -->|sensor_msgs/Image| TransformNode
         camera_pose -->|geometry_msgs/PoseStamped| TransformNode
         pnp_image -->|sensor_msgs/Image| PnPNode:::hidden
+        reference_time -->|sensor_msgs/TimeReference| MockGPSNode:::hidden
 """
-from copy import deepcopy
-from typing import Final, Optional, Tuple
+import threading
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Final, Literal, Optional, Tuple, Union
 
 import cv2
 import numpy as np
 import rclpy
 import tf2_ros
 import tf_transformations
-from cv_bridge import CvBridge
 from geometry_msgs.msg import TransformStamped
 from rcl_interfaces.msg import ParameterDescriptor
 from rclpy.node import Node
 from rclpy.qos import QoSPresetProfiles
-from sensor_msgs.msg import CameraInfo, Image
+from sensor_msgs.msg import CameraInfo, Image, TimeReference
 from tf2_ros.transform_broadcaster import TransformBroadcaster
 
 from .. import _messaging as messaging
@@ -55,9 +57,13 @@ from ..constants import (
     ROS_TOPIC_IMAGE,
     ROS_TOPIC_RELATIVE_ORTHOIMAGE,
     ROS_TOPIC_RELATIVE_PNP_IMAGE,
+    ROS_TOPIC_RELATIVE_REFERENCE_TIME,
     FrameID,
 )
 
+_SyncDropReason = Literal["orthoimage", "transform", "queue"]
+"""Reasons for dropping an :attr:`.TransformNode.image` message"""
+
 
 class TransformNode(Node):
     """Publishes :term:`query` and :term:`reference` image pair
@@ -74,6 +80,32 @@ class TransformNode(Node):
     """Magnitude of allowed attitude deviation of estimate from expectation in
     degrees"""
 
+    ROS_D_ROTATION_BIN = 0.0
+    """Default :term:`reference` image rotation bin width in degrees, disabled
+    by default"""
+
+    ROS_D_ROTATION_CACHE_MAX_BYTES = 64 * 1024**2
+    """Default memory budget in bytes for cached rotated :term:`reference`
+    image stacks"""
+
+    ROS_D_SYNC_SLOP = 0.05
+    """Default maximum time difference in seconds between an :attr:`.image`
+    and the transform it is paired with"""
+
+    ROS_D_SYNC_QUEUE_SIZE = 10
+    """Default maximum number of :attr:`.image` messages waiting for a
+    transform"""
+
+    _ORTHOIMAGE_HISTORY_SIZE: Final = 4
+    """Number of recently received distinct :attr:`.orthoimage` messages that
+    queued :attr:`.image` messages can be paired with"""
+
+    _SYNC_DROP_STATS_LOG_PERIOD: Final = 10.0
+    """Minimum period in seconds for logging dropped frame statistics"""
+
+    _ROTATION_CACHE_STATS_LOG_PERIOD: Final = 10.0
+    """Minimum period in seconds for logging rotation cache statistics"""
+
     _ROS_PARAM_DESCRIPTOR_READ_ONLY: Final = ParameterDescriptor(read_only=True)
     """A read only ROS parameter descriptor"""
 
@@ -85,8 +117,40 @@ class TransformNode(Node):
         """
         super().__init__(*args, **kwargs)
 
-        # Converts image_raw to cv2 compatible image
-        self._cv_bridge = CvBridge()
+        # Preallocated arrays reused across frames (see _get_buffer)
+        self._buffers: Dict[str, np.ndarray] = {}
+
+        # Rotated and cropped reference stacks of the current orthoimage keyed
+        # by rotation angle and crop shape, in least recently used order
+        self._rotation_cache: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+        self._rotation_cache_stamp: Optional[Tuple[int, int]] = None
+        self._rotation_cache_bytes = 0
+        self._rotation_cache_hits = 0
+        self._rotation_cache_misses = 0
+
+        # Images waiting for the map to gimbal transform at their timestamp,
+        # and recent distinct orthoimages with their timestamps for pairing
+        # them.
+        # The queue is drained from the image, orthoimage and tf listener
+        # callbacks, which may run in different threads.
+        sync_queue_size = self.sync_queue_size
+        assert sync_queue_size is not None
+        if sync_queue_size < 1:
+            raise ValueError(
+                f"sync_queue_size must be at least 1, got {sync_queue_size}."
+            )
+        self._sync_queue: Deque[Image] = deque(maxlen=sync_queue_size)
+        self._sync_lock = threading.RLock()
+        self._sync_waiting: Optional[Image] = None
+        self._orthoimages: Deque[Tuple[rclpy.time.Time, Image]] = deque(
+            maxlen=self._ORTHOIMAGE_HISTORY_SIZE
+        )
+        self._synchronized: Optional[Tuple[Image, Image, TransformStamped]] = None
+        self._sync_drops: Dict[_SyncDropReason, int] = {
+            "orthoimage": 0,
+            "transform": 0,
+            "queue": 0,
+        }
 
         # Calling these decorated properties the first time will setup
         # subscriptions to the appropriate ROS topics
@@ -103,11 +167,101 @@ class TransformNode(Node):
         self.tf_buffer = tf2_ros.Buffer()
         self.tf_listener = tf2_ros.TransformListener(self.tf_buffer, self)
 
+    @property
+    @ROS.parameter(ROS_D_ROTATION_BIN, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def rotation_bin(self) -> Optional[float]:
+        """:term:`Reference` image rotation bin width in degrees, or 0 to
+        rotate the reference image by the exact :term:`camera` heading
+
+        Snapping the rotation to bins makes consecutive reference images
+        identical while the heading stays within a bin, so that
+        :class:`.PoseNode` can reuse cached reference image features (see
+        :attr:`.PoseNode.reference_cache_size`, which should be enabled
+        together with this parameter). The published transform uses the same
+        snapped rotation so the :term:`pose` estimate is not affected beyond
+        matching accuracy.
+
+        The bin width is also the tolerance of the rotation cache (see
+        :attr:`.rotation_cache_max_bytes`): wider bins give more cache hits
+        at the cost of a less accurately aligned reference image.
+        """
+
+    @property
+    @ROS.parameter(
+        ROS_D_ROTATION_CACHE_MAX_BYTES, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY
+    )
+    def rotation_cache_max_bytes(self) -> Optional[int]:
+        """Memory budget in bytes for cached rotated and cropped
+        :term:`reference` image stacks, or 0 to disable the cache
+
+        The same :term:`orthoimage` is used for many consecutive query frames
+        and the heading changes slowly, so frames whose :attr:`.rotation_bin`
+        was already computed for the current orthoimage skip the warp
+        entirely. The cache is cleared when a new orthoimage arrives.
+
+        The cache is not used when :attr:`.rotation_bin` is disabled because
+        exact rotations practically never repeat.
+        """
+
+    @property
+    @ROS.parameter(ROS_D_SYNC_SLOP, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def sync_slop(self) -> Optional[float]:
+        """Maximum time difference in seconds between an :attr:`.image` and
+        the latest map to gimbal transform if the transform cannot be
+        interpolated at the image timestamp
+        """
+
+    @property
+    @ROS.parameter(ROS_D_SYNC_QUEUE_SIZE, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
+    def sync_queue_size(self) -> Optional[int]:
+        """Maximum number of :attr:`.image` messages waiting for the map to
+        gimbal transform at their timestamp, at least 1
+
+        The oldest waiting image is dropped when the queue is full.
+
+        :raises ValueError: If the parameter value is less than 1 on node
+            initialization
+        """
+
+    @property
+    def sync_drop_stats(self) -> Dict[_SyncDropReason, int]:
+        """Number of dropped :attr:`.image` messages per reason
+
+        * ``orthoimage``: No :attr:`.orthoimage` stamped at or before the
+          image timestamp had been received
+        * ``transform``: The map to gimbal transform at the image timestamp
+          is not available and will not become available
+        * ``queue``: The image waited for its transform in a full queue
+        """
+        return dict(self._sync_drops)
+
+    @property
+    def rotation_cache_stats(self) -> Tuple[int, int]:
+        """Number of rotation cache hits and misses"""
+        return self._rotation_cache_hits, self._rotation_cache_misses
+
+    def _orthoimage_cb(self, msg: Image) -> None:
+        """Callback for :attr:`.orthoimage` message
+
+        Records the orthoimage for pairing it with :attr:`.image` messages by
+        its header timestamp and publishes any queued images that are now
+        synchronized. :class:`.GISNode` republishes the same orthoimage until
+        it has a new one, so orthoimages with the same timestamp as the
+        latest recorded one are skipped.
+        """
+        stamp = rclpy.time.Time.from_msg(msg.header.stamp)
+        with self._sync_lock:
+            if self._orthoimages and self._orthoimages[-1][0] == stamp:
+                return None
+            self._orthoimages.append((stamp, msg))
+            self._drain_sync_queue()
+
     @property
     @ROS.subscribe(
         f"/{ROS_NAMESPACE}"
         f'/{ROS_TOPIC_RELATIVE_ORTHOIMAGE.replace("~", GIS_NODE_NAME)}',
         QoSPresetProfiles.SENSOR_DATA.value,
+        callback=_orthoimage_cb,
     )
     def orthoimage(self) -> Optional[Image]:
         """Subscribed :term:`orthoimage` for :term:`pose` estimation"""
@@ -122,8 +276,124 @@ class TransformNode(Node):
         """Camera info for determining appropriate :attr:`.orthoimage` resolution"""
 
     def _image_cb(self, msg: Image) -> None:
-        """Callback for :attr:`.image` message"""
-        self.pnp_image
+        """Callback for :attr:`.image` message
+
+        Queues the image and publishes :attr:`.pnp_image` and
+        :attr:`.reference_time` for every queued image whose transform is
+        available.
+        """
+        with self._sync_lock:
+            if len(self._sync_queue) == self._sync_queue.maxlen:
+                self._drop_frame("queue")  # Oldest image is evicted on append
+            self._sync_queue.append(msg)
+            self._drain_sync_queue()
+
+    def _drain_sync_queue(self) -> None:
+        """Publishes :attr:`.pnp_image` and :attr:`.reference_time` for queued
+        :attr:`.image` messages in order until an image must wait for its
+        transform
+
+        If the image at the head of the queue must wait, the queue is drained
+        again when the transform at its timestamp becomes available in the tf
+        buffer.
+        """
+        with self._sync_lock:
+            while self._sync_queue:
+                image = self._sync_queue[0]
+                transform = self._lookup_synchronized_transform(image)
+                if transform is False:
+                    # Wait for transform, later images are waiting too
+                    self._wait_for_transform(image)
+                    break
+                self._sync_queue.popleft()
+                if transform is None:
+                    self._drop_frame("transform")
+                    continue
+
+                orthoimage = self._synchronized_orthoimage(image)
+                if orthoimage is None:
+                    self._drop_frame("orthoimage")
+                    continue
+
+                self._synchronized = image, orthoimage, transform
+                if self.pnp_image is not None:
+                    self.reference_time
+                self._synchronized = None
+
+    def _wait_for_transform(self, image: Image) -> None:
+        """Drains the sync queue when the map to gimbal transform at the image
+        timestamp becomes available
+
+        :param image: Image message at the head of the sync queue
+        """
+        if image is self._sync_waiting:
+            return  # Already waiting for this image
+        self._sync_waiting = image
+        future = self.tf_buffer.wait_for_transform_async(
+            "map", "gimbal", rclpy.time.Time.from_msg(image.header.stamp)
+        )
+        future.add_done_callback(lambda _: self._drain_sync_queue())
+
+    def _synchronized_orthoimage(self, image: Image) -> Optional[Image]:
+        """Returns the latest :attr:`.orthoimage` stamped at or before the
+        image timestamp
+
+        :param image: Image message
+        :return: Orthoimage message, or None if there is no orthoimage stamped
+            at or before the image timestamp
+        """
+        stamp = rclpy.time.Time.from_msg(image.header.stamp)
+        for orthoimage_stamp, orthoimage in reversed(self._orthoimages):
+            if orthoimage_stamp <= stamp:
+                return orthoimage
+        return None
+
+    def _lookup_synchronized_transform(
+        self, image: Image
+    ) -> Union[TransformStamped, Literal[False], None]:
+        """Returns the map to gimbal transform at the image timestamp
+
+        The transform is interpolated at the image timestamp if possible. If
+        not, the latest transform is used if it is within :attr:`.sync_slop`
+        of the image timestamp.
+
+        :param image: Image message
+        :return: Transform, None if it will never become available, or False
+            if a newer transform may still arrive
+        """
+        stamp = rclpy.time.Time.from_msg(image.header.stamp)
+        try:
+            return self.tf_buffer.lookup_transform("map", "gimbal", stamp)
+        except tf2_ros.ExtrapolationException:
+            pass
+        except (tf2_ros.LookupException, tf2_ros.ConnectivityException):
+            return None
+
+        try:
+            latest = self.tf_buffer.lookup_transform("map", "gimbal", rclpy.time.Time())
+        except tf2_ros.TransformException:
+            return None
+
+        slop = self.sync_slop
+        assert slop is not None
+        difference = (
+            rclpy.time.Time.from_msg(latest.header.stamp) - stamp
+        ).nanoseconds / 1e9
+        if abs(difference) <= slop:
+            return latest
+        if difference < 0:
+            return False  # Transform for image timestamp has not arrived yet
+        return None  # Image is older than the transform buffer
+
+    def _drop_frame(self, reason: _SyncDropReason) -> None:
+        """Counts a dropped :attr:`.image` message and logs
+        :attr:`.sync_drop_stats` periodically
+        """
+        self._sync_drops[reason] += 1
+        self.get_logger().warning(
+            f"Dropped unsynchronized image frames: {self._sync_drops}.",
+            throttle_duration_sec=self._SYNC_DROP_STATS_LOG_PERIOD,
+        )
 
     @property
     # @ROS.max_delay_ms(messaging.DELAY_FAST_MS) - gst plugin does not enable timestamp?
@@ -135,11 +405,6 @@ class TransformNode(Node):
     def image(self) -> Optional[Image]:
         """Raw image data from vehicle camera for pose estimation"""
 
-    @staticmethod
-    def _determine_utm_zone(longitude):
-        """Determine the UTM zone for a given longitude."""
-        return int((longitude + 180) / 6) + 1
-
     @property
     @ROS.publish(
         ROS_TOPIC_RELATIVE_PNP_IMAGE,
@@ -154,6 +419,9 @@ class TransformNode(Node):
             images and one 16-bit "image-like" elevation reference, stored in a
             compact way in an existing message type so to avoid having to also
             publish custom :term:`ROS` message definitions.
+
+        Only published for :attr:`.image` messages that have been paired with
+        an :attr:`.orthoimage` and a transform by :meth:`._drain_sync_queue`.
         """
 
         @narrow_types(self)
@@ -168,11 +436,8 @@ class TransformNode(Node):
             parent_frame_id: FrameID = orthoimage.header.frame_id
             assert parent_frame_id == "reference"
 
-            query_img = self._cv_bridge.imgmsg_to_cv2(image, desired_encoding="mono8")
-
-            orthoimage_stack = self._cv_bridge.imgmsg_to_cv2(
-                orthoimage, desired_encoding="passthrough"
-            )
+            query_img = messaging.image_to_array(image, desired_encoding="mono8")
+            orthoimage_stack = messaging.image_to_array(orthoimage)
 
             assert orthoimage_stack.shape[2] == 3, (
                 f"Orthoimage stack channel count was {orthoimage_stack.shape[2]} "
@@ -185,17 +450,25 @@ class TransformNode(Node):
             camera_yaw_degrees = messaging.extract_yaw(transform.rotation)
             camera_roll_degrees = messaging.extract_roll(transform.rotation)
             rotation = camera_yaw_degrees + camera_roll_degrees
+            rotation_bin = self.rotation_bin
+            if rotation_bin:
+                rotation = round(rotation / rotation_bin) * rotation_bin
             crop_shape: Tuple[int, int] = query_img.shape[0:2]
-            orthoimage_rotated_stack = self._rotate_and_crop_center(
-                orthoimage_stack, rotation, crop_shape
+            orthoimage_rotated_stack = self._rotated_reference(
+                orthoimage, orthoimage_stack, rotation, crop_shape
             )
 
-            # Add query image on top to complete full image stack
-            pnp_image_stack = np.dstack((query_img, orthoimage_rotated_stack))
-
-            pnp_image_msg = self._cv_bridge.cv2_to_imgmsg(
-                pnp_image_stack, encoding="passthrough"
+            # Add query image on top to complete full image stack. The message
+            # copies the stack so the buffer can be reused for the next frame.
+            pnp_image_stack = self._get_buffer(
+                "pnp_image_stack",
+                (*crop_shape, 1 + orthoimage_stack.shape[2]),
+                orthoimage_stack.dtype,
             )
+            pnp_image_stack[:, :, 0] = query_img
+            pnp_image_stack[:, :, 1:] = orthoimage_rotated_stack
+
+            pnp_image_msg = messaging.array_to_image(pnp_image_stack)
 
             # The child frame is the 'world' frame of the PnP problem as
             # defined here: https://docs.opencv.org/4.x/d5/d1f/calib3d_solvePnP.html
@@ -256,69 +529,149 @@ class TransformNode(Node):
                 q,
                 translation,
             )
-            # We also publish a reference_{timestamp} frame so that we will be able
-            # to trace the transform chain back to the exact timestamp (to match
-            # with the geotransform message). This is needed because interpolation will
-            # often produce very inaccurate results with the discontinous reference
-            # frame. The orthoimage timestamp which we use here is used as a proxy
-            # for the geotransform timestamp (i.e. they must be published with
-            # the same timestamps).
-            # TODO: remove this assumption or make the design less brittle in some
-            #  other way
-            transform_camera_stamped = deepcopy(transform_camera)
-            transform_camera_stamped.child_frame_id = (
-                f"{transform_camera.child_frame_id}"
-                f"_{orthoimage.header.stamp.sec}"
-                f"_{orthoimage.header.stamp.nanosec}"
-            )
-            self.broadcaster.sendTransform([transform_camera, transform_camera_stamped])
-
-            # if orthoimage is not None:
-            #    ref = deepcopy(orthoimage_stack[:, :, 0])
-            #    camera_pose_transform = messaging.get_transform(
-            #        self,
-            #        "reference",
-            #        "camera_pinhole",
-            #        image.header.stamp
-            #    )
-            #    if camera_pose_transform is not None:
-            #        h = orthoimage_stack.shape[0]
-            #        messaging.visualize_transform(
-            #            camera_pose_transform,
-            #            ref,
-            #            h,
-            #            "Camera position in ref frame"
-            #        )
+            # The reference frame is discontinuous so this transform must be
+            # looked up at the exact image timestamp downstream. The orthoimage
+            # (geotransform) timestamp is published in reference_time.
+            self.broadcaster.sendTransform(transform_camera)
 
             return pnp_image_msg
 
-        query_image, orthoimage = self.image, self.orthoimage
-
-        transform = (
-            messaging.get_transform(
-                self, "map", "gimbal", rclpy.time.Time()
-            )  # query_image.header.stamp)
-            if self.image is not None
-            else None
-        )
+        if self._synchronized is None:
+            return None
 
+        query_image, orthoimage, transform = self._synchronized
         return _pnp_image(
             query_image,
             orthoimage,
             transform,
         )
 
+    @property
+    @ROS.publish(
+        ROS_TOPIC_RELATIVE_REFERENCE_TIME,
+        QoSPresetProfiles.SENSOR_DATA.value,
+    )
+    def reference_time(self) -> Optional[TimeReference]:
+        """Published :term:`orthoimage` timestamp of the latest
+        :attr:`.pnp_image`
+
+        The header timestamp is the :attr:`.pnp_image` (:term:`query` image)
+        timestamp and the time reference is the timestamp of the orthoimage the
+        :term:`reference` image was cropped from. Downstream nodes use it to
+        look up the geotransform of the exact orthoimage in the
+        :data:`.geotransform_registry`.
+        """
+        if self._synchronized is None:
+            return None
+
+        image, orthoimage, _ = self._synchronized
+        msg = TimeReference()
+        msg.header.stamp = image.header.stamp
+        msg.header.frame_id = "world"
+        msg.time_ref = orthoimage.header.stamp
+        msg.source = "orthoimage"
+        return msg
+
+    def _rotated_reference(
+        self,
+        orthoimage: Image,
+        orthoimage_stack: np.ndarray,
+        rotation: float,
+        crop_shape: Tuple[int, int],
+    ) -> np.ndarray:
+        """Returns the rotated and cropped :term:`reference` stack from the
+        rotation cache, or warps it on a cache miss
+
+        :param orthoimage: Orthoimage message, the header timestamp identifies
+            the orthoimage
+        :param orthoimage_stack: Orthoimage stack decoded from the message
+        :param rotation: Rotation angle in degrees
+        :param crop_shape: Output shape (height, width)
+        :return: Rotated and cropped stack, must not be modified
+        """
+        max_bytes = self.rotation_cache_max_bytes
+        assert max_bytes is not None
+        if max_bytes <= 0 or not self.rotation_bin:
+            return self._rotate_and_crop_center(
+                orthoimage_stack,
+                rotation,
+                crop_shape,
+                dst=self._get_buffer(
+                    "rotated_stack",
+                    (*crop_shape, orthoimage_stack.shape[2]),
+                    orthoimage_stack.dtype,
+                ),
+            )
+
+        stamp = (orthoimage.header.stamp.sec, orthoimage.header.stamp.nanosec)
+        if stamp != self._rotation_cache_stamp:
+            # Rotations of the previous orthoimage will not be needed again
+            self._rotation_cache.clear()
+            self._rotation_cache_bytes = 0
+            self._rotation_cache_stamp = stamp
+
+        key = (rotation, crop_shape)
+        rotated = self._rotation_cache.get(key)
+        if rotated is not None:
+            self._rotation_cache.move_to_end(key)
+            self._rotation_cache_hits += 1
+        else:
+            self._rotation_cache_misses += 1
+            rotated = self._rotate_and_crop_center(
+                orthoimage_stack, rotation, crop_shape
+            )
+            if rotated.nbytes <= max_bytes:
+                self._rotation_cache[key] = rotated
+                self._rotation_cache_bytes += rotated.nbytes
+                while self._rotation_cache_bytes > max_bytes:
+                    _, evicted = self._rotation_cache.popitem(last=False)
+                    self._rotation_cache_bytes -= evicted.nbytes
+
+        hits, misses = self.rotation_cache_stats
+        self.get_logger().debug(
+            f"Rotation cache hit rate {hits / (hits + misses):.2f} ({hits} hits, "
+            f"{misses} misses, {len(self._rotation_cache)} entries, "
+            f"{self._rotation_cache_bytes} bytes).",
+            throttle_duration_sec=self._ROTATION_CACHE_STATS_LOG_PERIOD,
+        )
+        return rotated
+
+    def _get_buffer(self, name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """Returns a preallocated array that is reused across frames
+
+        The array is reallocated only if the requested shape or dtype changes.
+        Contents are not initialized.
+
+        :param name: Buffer name
+        :param shape: Array shape
+        :param dtype: Array dtype
+        :return: Reusable array
+        """
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buffer
+        return buffer
+
     @staticmethod
     def _rotate_and_crop_center(
-        image: np.ndarray, angle_degrees: float, shape: Tuple[int, int]
+        image: np.ndarray,
+        angle_degrees: float,
+        shape: Tuple[int, int],
+        dst: Optional[np.ndarray] = None,
     ):
         """Rotates an image around its center axis and then crops it to the
         specified shape.
 
+        The crop is folded into the affine matrix so that only the pixels
+        inside the crop are warped.
+
         :param image: Numpy array representing the image.
         :param angle: Rotation angle in degrees.
         :param shape: Tuple (height, width) representing the desired shape
             after cropping.
+        :param dst: Optional preallocated output array of the cropped shape
+            and same channel count and dtype as the input image
         :return: Cropped and rotated image.
         """
         # Image dimensions
@@ -330,14 +683,11 @@ class TransformNode(Node):
         # Calculate the rotation matrix
         rotation_matrix = cv2.getRotationMatrix2D(center, angle_degrees, 1.0)
 
-        # Perform the rotation
-        rotated_image = cv2.warpAffine(image, rotation_matrix, (w, h))
-
-        # Calculate the cropping coordinates
+        # Calculate the cropping coordinates and shift the output origin to
+        # the top left corner of the crop
         x = center[0] - shape[1] // 2
         y = center[1] - shape[0] // 2
+        rotation_matrix[:, 2] -= (x, y)
 
-        # Perform the cropping
-        cropped_image = rotated_image[y : y + shape[0], x : x + shape[1]]
-
-        return cropped_image
+        # Perform the rotation and cropping
+        return cv2.warpAffine(image, rotation_matrix, (shape[1], shape[0]), dst=dst)
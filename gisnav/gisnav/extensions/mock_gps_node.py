@@ -2,7 +2,7 @@
 import json
 import socket
 from datetime import datetime
-from typing import Final, Optional, Tuple, cast
+from typing import Final, Optional, Tuple
 
 import numpy as np
 import rclpy
@@ -10,12 +10,11 @@ import tf2_ros
 from geometry_msgs.msg import TransformStamped
 from gps_time import GPSTime
 from px4_msgs.msg import SensorGps
-from pyproj import Transformer
 from rcl_interfaces.msg import ParameterDescriptor
 from rclpy.node import Node
 from rclpy.qos import QoSPresetProfiles
 from rclpy.timer import Timer
-from sensor_msgs.msg import PointCloud2
+from sensor_msgs.msg import Image, TimeReference
 
 from .. import _messaging as messaging
 from .._decorators import ROS, narrow_types
@@ -23,8 +22,9 @@ from ..constants import (
     GIS_NODE_NAME,
     ROS_NAMESPACE,
     ROS_TOPIC_RELATIVE_GEOTRANSFORM,
+    ROS_TOPIC_RELATIVE_REFERENCE_TIME,
     ROS_TOPIC_SENSOR_GPS,
-    FrameID,
+    TRANSFORM_NODE_NAME,
 )
 
 _ROS_PARAM_DESCRIPTOR_READ_ONLY: Final = ParameterDescriptor(read_only=True)
@@ -47,13 +47,18 @@ class MockGPSNode(Node):
                 geotransform[gisnav/gis_node/geotransform]
             end
 
+            subgraph TransformNode
+                reference_time[gisnav/transform_node/reference/time]
+            end
+
             subgraph MockGPSNode
                 sensor_gps[fmu/in/sensor_gps]
                 gps_input
             end
 
             tf -->|'geometry_msgs/TransformStamped camera->wgs84_unscaled'| MockGPSNode
-            geotransform -->|sensor_msgs/PointCloud2| MockGPSNode
+            geotransform -->|sensor_msgs/Image| MockGPSNode
+            reference_time -->|sensor_msgs/TimeReference| MockGPSNode
             sensor_gps -->|px4_msgs.msg.SensorGps| micro-ros-agent:::hidden
             gps_input -->|GPSINPUT over UDP| MAVLink:::hidden
 
@@ -84,6 +89,14 @@ class MockGPSNode(Node):
     ROS_D_DEM_VERTICAL_DATUM = 5703
     """Default :term:`DEM` vertical datum"""
 
+    ROS_D_GEOTRANSFORM_REGISTRY_SIZE = messaging.GEOTRANSFORM_REGISTRY_SIZE
+    """Default maximum number of geotransforms in the
+    :data:`.geotransform_registry`"""
+
+    ROS_D_GEOTRANSFORM_REGISTRY_HORIZON = messaging.GEOTRANSFORM_REGISTRY_HORIZON
+    """Default maximum age in seconds of a geotransform in the
+    :data:`.geotransform_registry`"""
+
     ROS_TOPIC_SENSOR_GPS: Final = "/fmu/in/sensor_gps"
     """Absolute :term:`topic` into which this :term:`node` publishes
     :attr:`.sensor_gps`
@@ -97,6 +110,11 @@ class MockGPSNode(Node):
         """
         super().__init__(*args, **kwargs)
 
+        registry_size = self.geotransform_registry_size
+        registry_horizon = self.geotransform_registry_horizon
+        assert registry_size is not None and registry_horizon is not None
+        messaging.geotransform_registry.configure(registry_size, registry_horizon)
+
         if self.use_sensor_gps:
             self._mock_gps_pub = self.create_publisher(
                 SensorGps,
@@ -115,8 +133,9 @@ class MockGPSNode(Node):
         assert publish_rate is not None
         self._publish_timer: Optional[Timer] = self._create_publish_timer(publish_rate)
 
-        # Subscribe to geotransform
+        # Subscribe to geotransform and reference time
         self.geotransform
+        self.reference_time
 
     @property
     @ROS.parameter(ROS_D_USE_SENSOR_GPS, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY)
@@ -148,6 +167,33 @@ class MockGPSNode(Node):
         :attr:`.GISNode.orthoimage`)
         """
 
+    @property
+    @ROS.parameter(
+        ROS_D_GEOTRANSFORM_REGISTRY_SIZE, descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY
+    )
+    def geotransform_registry_size(self) -> Optional[int]:
+        """Minimum capacity in :term:`orthoimage` geotransforms of the
+        process-wide :data:`.geotransform_registry`
+
+        The registry is shared with the other nodes in the process and uses
+        the largest size configured by any of them.
+        """
+
+    @property
+    @ROS.parameter(
+        ROS_D_GEOTRANSFORM_REGISTRY_HORIZON,
+        descriptor=_ROS_PARAM_DESCRIPTOR_READ_ONLY,
+    )
+    def geotransform_registry_horizon(self) -> Optional[float]:
+        """Minimum age in seconds up to which an :term:`orthoimage`
+        geotransform is kept in the process-wide :data:`.geotransform_registry`
+        relative to the latest orthoimage, or 0 to bound the registry by
+        :attr:`.geotransform_registry_size` only
+
+        The registry uses the longest horizon configured by any node in the
+        process.
+        """
+
     @narrow_types
     def _create_publish_timer(self, publish_rate: float) -> Timer:
         """Returns a timer that publishes the output mock :term:`GPS`
@@ -166,33 +212,53 @@ class MockGPSNode(Node):
         timer = self.create_timer(1 / publish_rate, self._publish)
         return timer
 
+    def _geotransform_cb(self, msg: Image) -> None:
+        """Callback for :attr:`.geotransform` message
+
+        Registers the geotransform in the :data:`.geotransform_registry` so
+        that it can be looked up by the :term:`orthoimage` timestamp.
+        """
+        messaging.register_geotransform(self, msg)
+
     @property
     @ROS.subscribe(
         f"/{ROS_NAMESPACE}"
         f'/{ROS_TOPIC_RELATIVE_GEOTRANSFORM.replace("~", GIS_NODE_NAME)}',
         QoSPresetProfiles.SENSOR_DATA.value,
+        callback=_geotransform_cb,
     )
-    def geotransform(self) -> Optional[PointCloud2]:
+    def geotransform(self) -> Optional[Image]:
         """Subscribed :term:`reference` frame to :term:`WGS 84` frame
-        affine transformation matrix (3, 3), or None if not available
+        affine transformation matrix (4, 4), or None if not available
 
         .. seealso::
             :attr:`.GISNode.geotransform`
         """
 
+    @property
+    @ROS.subscribe(
+        f"/{ROS_NAMESPACE}"
+        f'/{ROS_TOPIC_RELATIVE_REFERENCE_TIME.replace("~", TRANSFORM_NODE_NAME)}',
+        QoSPresetProfiles.SENSOR_DATA.value,
+    )
+    def reference_time(self) -> Optional[TimeReference]:
+        """Subscribed :term:`orthoimage` timestamp of the latest :term:`query`
+        image, or None if not available
+
+        .. seealso::
+            :attr:`.TransformNode.reference_time`
+        """
+
     def _publish(self) -> None:
         @narrow_types(self)
         def _publish_inner(
-            camera_to_reference: TransformStamped, geotransform: PointCloud2
+            camera_to_reference: TransformStamped, M: np.ndarray
         ) -> None:
             translation, rotation = (
                 camera_to_reference.transform.translation,
                 camera_to_reference.transform.rotation,
             )
 
-            # Unpack the geotransformation affine matrix
-            M = np.frombuffer(geotransform.data, dtype=np.float64).reshape(4, 4)
-
             # Geotransform uses numpy convention: origin is top left corner and
             # first axis is height -> need to swap x and y axis here and invert
             # the first axis
@@ -253,30 +319,50 @@ class MockGPSNode(Node):
                     satellites_visible,
                 )
 
-        # Must match transformation chain to correct reference frame using
-        # geotransform timestamp. The geotransform timestamp is a proxy for the
-        # orthoimage timestamp, which is also added to the frame_id of the
-        # reference frame. The reference frame is discontinous so it is not and
-        # should not be interpolated using tf2 to prevent jumps in estimation
-        # error whenever the reference frame is updated.
-        geotransform = self.geotransform
-        if self.geotransform is not None:
-            ref_frame: FrameID = cast(
-                FrameID,
-                "reference_{}_{}".format(
-                    geotransform.header.stamp.sec, geotransform.header.stamp.nanosec
-                ),
-            )
-            camera_to_reference = messaging.get_transform(
-                self,
-                ref_frame,
-                "camera",
-                rclpy.time.Time(),
-            )
+        # Must match the transformation chain and the geotransform to the same
+        # orthoimage. The geotransform is looked up by the orthoimage timestamp.
+        reference_time = self.reference_time
+        if reference_time is not None:
+            M = messaging.geotransform_registry.get(reference_time.time_ref)
+            camera_to_reference = self._camera_to_reference(reference_time)
         else:
-            camera_to_reference = None
-
-        _publish_inner(camera_to_reference, geotransform)
+            M, camera_to_reference = None, None
+
+        _publish_inner(camera_to_reference, M)
+
+    def _camera_to_reference(
+        self, reference_time: TimeReference
+    ) -> Optional[TransformStamped]:
+        """Returns the camera to :term:`reference` frame transform of the
+        latest :term:`query` image
+
+        The reference to world transform is published by
+        :class:`.TransformNode` at the query image timestamp. The reference
+        frame is discontinous so it is not and should not be interpolated
+        using tf2 to prevent jumps in estimation error whenever the reference
+        frame is updated, and it is looked up at the exact query image
+        timestamp.
+
+        The world to camera transform is published asynchronously by
+        :class:`.PoseNode` and stamped in :term:`FCU` time when a time
+        reference is available, so it cannot be looked up at the query image
+        timestamp. The latest transform is used instead.
+
+        :param reference_time: Query image and orthoimage timestamps
+        :return: Camera to reference transform, or None if not available
+        """
+        reference_to_world = messaging.get_transform(
+            self,
+            "reference",
+            "world",
+            rclpy.time.Time.from_msg(reference_time.header.stamp),
+        )
+        world_to_camera = messaging.get_transform(
+            self, "world", "camera", rclpy.time.Time()
+        )
+        if reference_to_world is None or world_to_camera is None:
+            return None
+        return messaging.compose_transforms(reference_to_world, world_to_camera)
 
     @narrow_types
     @ROS.publish(
@@ -428,12 +514,12 @@ class MockGPSNode(Node):
         epsg_wgs84 = 4326
         epsg_msl = 5773  # Example: EGM96
 
-        # Create transformers
-        transformer_to_wgs84 = Transformer.from_crs(
-            f"EPSG:{epsg_code}", f"EPSG:{epsg_wgs84}", always_xy=True
+        # Transformers are cached, only the first conversion builds them
+        transformer_to_wgs84 = messaging.get_transformer(
+            f"EPSG:{epsg_code}", f"EPSG:{epsg_wgs84}"
         )
-        transformer_to_msl = Transformer.from_crs(
-            f"EPSG:{epsg_code}", f"EPSG:{epsg_msl}", always_xy=True
+        transformer_to_msl = messaging.get_transformer(
+            f"EPSG:{epsg_code}", f"EPSG:{epsg_msl}"
         )
 
         # Perform the transformations
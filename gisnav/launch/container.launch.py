@@ -0,0 +1,50 @@
+"""Launches GISNav :term:`core` nodes and :class:`.MockGPSNode` in a single process
+
+Use the ``autopilot`` launch argument (``px4`` or ``ardupilot``) to select the
+:class:`.MockGPSNode` launch parameters.
+"""
+import os
+from typing import Final
+
+from ament_index_python.packages import get_package_share_directory
+from launch import LaunchDescription  # type: ignore
+from launch.actions import DeclareLaunchArgument
+from launch.substitutions import LaunchConfiguration
+from launch_ros.actions import Node
+
+_PACKAGE_NAME: Final = "gisnav"
+
+
+def generate_launch_description():
+    """Generates single process launch description"""
+    package_share_dir = get_package_share_directory(_PACKAGE_NAME)
+    params_dir = os.path.join(package_share_dir, "launch/params")
+
+    ld = LaunchDescription(
+        [
+            DeclareLaunchArgument(
+                "autopilot", default_value="px4", choices=["px4", "ardupilot"]
+            ),
+        ]
+    )
+    # Node name must not be remapped here because the remap would apply to all
+    # nodes in the process. Parameter files are matched by fully qualified node
+    # name instead.
+    ld.add_action(
+        Node(
+            package=_PACKAGE_NAME,
+            executable="container",
+            parameters=[
+                os.path.join(params_dir, "gis_node.yaml"),
+                os.path.join(params_dir, "transform_node.yaml"),
+                os.path.join(params_dir, "bbox_node.yaml"),
+                os.path.join(params_dir, "pose_node.yaml"),
+                [
+                    os.path.join(params_dir, "mock_gps_node_"),
+                    LaunchConfiguration("autopilot"),
+                    ".yaml",
+                ],
+            ],
+        )
+    )
+    return ld
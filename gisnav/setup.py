@@ -74,6 +74,7 @@ packages_ = [
     "test.unit",
     "test.launch",
     "test.sitl",
+    "test.benchmark",
 ]
 
 setup(
@@ -115,11 +116,14 @@ setup(
         # "shapely>=1.8.2",
         "OWSLib>=0.25.0",
         "torch>=2.1.0",
+        # Keep in sync with gisnav._matchers._LOFTR_FORWARD_KORNIA_VERSION
         "kornia==0.6.10",
     ],
     tests_require=["pytest"],
     extras_require={
         "mock_gps_node": ["gps-time"],
+        "local_raster": ["rasterio"],
+        "onnx": ["onnx", "onnxruntime"],
         "qgis_node": ["psycopg2"],
         "dev": [
             "aiohttp",
@@ -156,6 +160,7 @@ setup(
             "bbox_node = gisnav:run_bbox_node",
             "rviz_node = gisnav:run_rviz_node",
             "qgis_node = gisnav:run_qgis_node",
+            "container = gisnav:run_container",
         ],
     },
 )
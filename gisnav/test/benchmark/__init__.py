@@ -0,0 +1,10 @@
+"""Performance benchmarks
+
+Benchmarks are standalone scripts that print their results, for example:
+
+.. code-block:: bash
+
+    python3 -m test.benchmark.benchmark_image_codec
+
+They are not run as part of the unit tests.
+"""
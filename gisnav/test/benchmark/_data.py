@@ -0,0 +1,43 @@
+"""Synthetic and recorded :term:`query` and :term:`reference` image pairs
+shared by the benchmarks
+"""
+import glob
+import os
+from typing import List, Tuple
+
+import cv2
+import numpy as np
+
+
+def synthetic_pair(
+    shape: Tuple[int, int], rng: np.random.Generator, rotation: float = 5.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns a textured 8-bit grayscale reference image and a query image
+    that is the reference rotated around its center
+
+    :param shape: Image shape (height, width)
+    :param rng: Random number generator for the texture
+    :param rotation: Query image rotation in degrees
+    :return: Tuple of query and reference images
+    """
+    height, width = shape
+    noise = rng.integers(0, 255, size=(height // 8, width // 8), dtype=np.uint8)
+    reference = cv2.resize(noise, (width, height), interpolation=cv2.INTER_CUBIC)
+    reference = cv2.GaussianBlur(reference, (0, 0), 1.5)
+    matrix = cv2.getRotationMatrix2D((width / 2, height / 2), rotation, 1.0)
+    query = cv2.warpAffine(reference, matrix, (width, height))
+    return query, reference
+
+
+def load_pnp_stacks(path: str) -> List[np.ndarray]:
+    """Returns recorded :attr:`.TransformNode.pnp_image` stacks
+
+    Stacks are stored as ``.npy`` files of shape (height, width, 4) as decoded
+    by :func:`.image_to_array`.
+
+    :param path: Directory containing the recorded stacks
+    :return: List of stacks sorted by file name
+    """
+    return [
+        np.load(filename) for filename in sorted(glob.glob(os.path.join(path, "*.npy")))
+    ]
@@ -0,0 +1,33 @@
+"""Timing helpers shared by the benchmarks"""
+import time
+from typing import Callable
+
+import numpy as np
+
+
+def measure(func: Callable[[], object], repeat: int, warmup: int = 3) -> np.ndarray:
+    """Returns wall clock durations of repeated calls
+
+    :param func: Function to call without arguments
+    :param repeat: Number of measured calls
+    :param warmup: Number of unmeasured calls before the measured calls
+    :return: Array of call durations in seconds
+    """
+    for _ in range(warmup):
+        func()
+    samples = np.empty(repeat)
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples[i] = time.perf_counter() - start
+    return samples
+
+
+def report(name: str, samples: np.ndarray) -> None:
+    """Prints median and 99th percentile of call durations
+
+    :param name: Benchmark case name
+    :param samples: Call durations in seconds from :func:`.measure`
+    """
+    p50, p99 = np.percentile(samples, [50, 99])
+    print(f"{name:<48} p50 {p50 * 1e3:9.3f} ms   p99 {p99 * 1e3:9.3f} ms")
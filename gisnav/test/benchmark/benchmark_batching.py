@@ -0,0 +1,47 @@
+"""Benchmarks batched LoFTR inference on CPU
+
+Reports throughput and p50/p99 latency per frame as a function of batch size
+for :meth:`.LoFTRMatcher.match_batch`. Frame latency is the time from the
+start of the batch until its matches are available, which includes waiting
+for the other frames of the batch.
+"""
+import argparse
+
+import numpy as np
+
+from gisnav._matchers import LoFTRMatcher
+
+from ._data import synthetic_pair
+from ._timing import measure
+
+
+def main(batch_sizes: list, repeat: int, height: int, width: int) -> None:
+    """Runs the benchmark
+
+    :param batch_sizes: Batch sizes to benchmark
+    :param repeat: Number of measured batches per batch size
+    :param height: Image height
+    :param width: Image width
+    """
+    matcher = LoFTRMatcher(device="cpu")
+    rng = np.random.default_rng(0)
+    pairs = [synthetic_pair((height, width), rng) for _ in range(max(batch_sizes))]
+
+    for batch_size in batch_sizes:
+        batch = pairs[:batch_size]
+        samples = measure(lambda: matcher.match_batch(batch), repeat, warmup=1)
+        p50, p99 = np.percentile(samples, [50, 99])
+        print(
+            f"batch size {batch_size:>2}: {batch_size / np.mean(samples):6.2f} "
+            f"frames/s, latency p50 {p50 * 1e3:8.1f} ms p99 {p99 * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--width", type=int, default=640)
+    args = parser.parse_args()
+    main(args.batch_sizes, args.repeat, args.height, args.width)
@@ -0,0 +1,139 @@
+"""Soak benchmark for the per-:term:`orthoimage` state of long missions
+
+Replays a mission of synthetic orthoimage updates and :term:`query` frames in
+simulated time. Every orthoimage registers a geotransform in a
+:class:`.GeotransformRegistry` like :class:`.GISNode` does, and every query
+frame broadcasts the reference to world transform into a
+:class:`tf2_ros.Buffer` like :class:`.TransformNode` does. Each query frame
+then looks up both again like :class:`.MockGPSNode` does.
+
+Reports registry size, lookup latency and resident set size (RSS) for every
+reporting period of simulated time. All of them should stay flat over the
+mission.
+"""
+import argparse
+import os
+
+import numpy as np
+import rclpy.time
+import tf2_ros
+from builtin_interfaces.msg import Time
+
+from gisnav import _messaging as messaging
+
+from ._timing import measure
+
+
+def _rss_mib() -> float:
+    """Returns the current resident set size of this process in MiB"""
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024**2
+
+
+def _stamp(seconds: float) -> Time:
+    """Returns a timestamp message for simulated time in seconds"""
+    sec = int(seconds)
+    return Time(sec=sec, nanosec=int(round((seconds - sec) * 1e9)))
+
+
+def _percentiles(samples: list) -> str:
+    """Returns median and 99th percentile of durations in microseconds"""
+    p50, p99 = np.percentile(samples, [50, 99]) * 1e6
+    return f"p50 {p50:7.2f} us p99 {p99:7.2f} us"
+
+
+def main(
+    duration: float,
+    orthoimage_rate: float,
+    query_rate: float,
+    report_period: float,
+    registry_size: int,
+    registry_horizon: float,
+) -> None:
+    """Runs the benchmark
+
+    :param duration: Simulated mission duration in seconds
+    :param orthoimage_rate: Orthoimage update rate in Hz
+    :param query_rate: Query frame rate in Hz
+    :param report_period: Simulated time in seconds per reported row
+    :param registry_size: Maximum number of registered geotransforms
+    :param registry_horizon: Geotransform registry horizon in seconds
+    """
+    registry = messaging.GeotransformRegistry(registry_size, registry_horizon)
+    tf_buffer = tf2_ros.Buffer()
+    rng = np.random.default_rng(0)
+
+    queries_per_orthoimage = max(int(round(query_rate / orthoimage_rate)), 1)
+    frame_period = 1.0 / (orthoimage_rate * queries_per_orthoimage)
+    frames = int(duration / frame_period)
+    frames_per_report = max(int(report_period / frame_period), 1)
+
+    print(
+        f"{'time (s)':>9} {'registry':>9}   {'registry get':<30} "
+        f"{'tf lookup':<30} {'RSS (MiB)':>9}"
+    )
+    orthoimage_stamp = None
+    get_samples: list = []
+    lookup_samples: list = []
+    for frame in range(frames):
+        now = frame * frame_period
+        if frame % queries_per_orthoimage == 0:
+            orthoimage_stamp = _stamp(now)
+            registry.put(orthoimage_stamp, rng.normal(size=(4, 4)))
+
+        image_stamp = _stamp(now)
+        q = rng.normal(size=4)
+        tf_buffer.set_transform(
+            messaging.create_transform_msg(
+                image_stamp,
+                "reference",
+                "world",
+                tuple(q / np.linalg.norm(q)),
+                rng.normal(size=3),
+            ),
+            "soak",
+        )
+
+        get_samples.extend(measure(lambda: registry.get(orthoimage_stamp), 1, 0))
+        lookup_time = rclpy.time.Time.from_msg(image_stamp)
+        lookup_samples.extend(
+            measure(
+                lambda: tf_buffer.lookup_transform("reference", "world", lookup_time),
+                1,
+                0,
+            )
+        )
+
+        if (frame + 1) % frames_per_report == 0:
+            print(
+                f"{now:9.0f} {len(registry):9d}   {_percentiles(get_samples):<30} "
+                f"{_percentiles(lookup_samples):<30} {_rss_mib():9.1f}"
+            )
+            get_samples.clear()
+            lookup_samples.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=3600.0)
+    parser.add_argument("--orthoimage-rate", type=float, default=1.0)
+    parser.add_argument("--query-rate", type=float, default=10.0)
+    parser.add_argument("--report-period", type=float, default=300.0)
+    parser.add_argument(
+        "--registry-size", type=int, default=messaging.GEOTRANSFORM_REGISTRY_SIZE
+    )
+    parser.add_argument(
+        "--registry-horizon",
+        type=float,
+        default=messaging.GEOTRANSFORM_REGISTRY_HORIZON,
+    )
+    args = parser.parse_args()
+    main(
+        args.duration,
+        args.orthoimage_rate,
+        args.query_rate,
+        args.report_period,
+        args.registry_size,
+        args.registry_horizon,
+    )
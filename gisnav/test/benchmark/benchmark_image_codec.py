@@ -0,0 +1,63 @@
+"""Benchmarks :func:`.image_to_array` and :func:`.array_to_image` against
+``CvBridge`` for the orthoimage and pnp_image stacks
+
+``CvBridge`` is skipped if ``cv_bridge`` is not installed.
+"""
+import argparse
+
+import numpy as np
+
+from gisnav import _messaging as messaging
+
+from ._timing import measure, report
+
+SHAPES = {
+    "720p orthoimage": (720, 1280, 3),
+    "720p pnp_image": (720, 1280, 4),
+    "1080p orthoimage": (1080, 1920, 3),
+    "1080p pnp_image": (1080, 1920, 4),
+}
+"""Benchmarked image stack shapes"""
+
+
+def main(repeat: int) -> None:
+    """Runs the benchmark
+
+    :param repeat: Number of measured calls per case
+    """
+    try:
+        from cv_bridge import CvBridge
+
+        bridge = CvBridge()
+    except ModuleNotFoundError:
+        print("cv_bridge not installed, skipping CvBridge cases")
+        bridge = None
+
+    rng = np.random.default_rng(0)
+    for name, shape in SHAPES.items():
+        img = rng.integers(0, 255, size=shape, dtype=np.uint8)
+        msg = messaging.array_to_image(img)
+
+        report(
+            f"{name} encode (_messaging)",
+            measure(lambda: messaging.array_to_image(img), repeat),
+        )
+        report(
+            f"{name} decode (_messaging)",
+            measure(lambda: messaging.image_to_array(msg), repeat),
+        )
+        if bridge is not None:
+            report(
+                f"{name} encode (CvBridge)",
+                measure(lambda: bridge.cv2_to_imgmsg(img), repeat),
+            )
+            report(
+                f"{name} decode (CvBridge)",
+                measure(lambda: bridge.imgmsg_to_cv2(msg), repeat),
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=100)
+    main(parser.parse_args().repeat)
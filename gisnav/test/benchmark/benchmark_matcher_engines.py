@@ -0,0 +1,113 @@
+"""Benchmarks the LoFTR inference engines on CPU
+
+Reports cold start time, steady-state latency and resident set size (RSS) for
+the ``eager``, ``torchscript`` and ``onnx`` engines of :func:`.create_matcher`.
+Each engine is measured in a fresh Python process so that the cold start
+includes importing the engine, and RSS is not inflated by the other engines.
+
+Cold start is measured twice per exported engine: with an empty model
+directory (export and load) and with the model already exported (load only).
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from ._data import synthetic_pair
+from ._timing import measure
+
+ENGINES = ("eager", "torchscript", "onnx")
+"""Benchmarked inference engines"""
+
+
+def _rss_mib() -> float:
+    """Returns the current resident set size of this process in MiB"""
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024**2
+
+
+def _run_engine(
+    engine: str, model_dir: str, repeat: int, shape: tuple, threads: int
+) -> None:
+    """Measures a single engine in this process and prints the results"""
+    rng = np.random.default_rng(0)
+    query, reference = synthetic_pair(shape, rng)
+
+    start = time.perf_counter()
+    from gisnav._matchers import create_matcher
+
+    matcher = create_matcher(
+        "loftr", engine=engine, threads=threads, model_dir=model_dir
+    )
+    matcher.prepare(shape, wait=True)
+    matcher.match(query, reference)
+    cold_start = time.perf_counter() - start
+
+    samples = measure(lambda: matcher.match(query, reference), repeat, warmup=1)
+    p50, p99 = np.percentile(samples, [50, 99])
+    print(
+        f"{engine:<12} cold start {cold_start:7.2f} s   latency p50 "
+        f"{p50 * 1e3:8.1f} ms p99 {p99 * 1e3:8.1f} ms   RSS {_rss_mib():7.1f} MiB"
+    )
+
+
+def main(repeat: int, height: int, width: int, threads: int) -> None:
+    """Runs the benchmark
+
+    :param repeat: Number of measured matches per engine
+    :param height: Image height
+    :param width: Image width
+    :param threads: Number of intra-op threads for the exported engines, or 0
+        for the engine default
+    """
+    with tempfile.TemporaryDirectory() as model_dir:
+        for engine in ENGINES:
+            runs = ("cold",) if engine == "eager" else ("export", "cached")
+            for run in runs:
+                print(f"[{run}] ", end="", flush=True)
+                subprocess.run(
+                    [
+                        sys.executable,
+                        "-m",
+                        __spec__.name,
+                        "--engine",
+                        engine,
+                        "--model-dir",
+                        model_dir,
+                        "--repeat",
+                        str(repeat),
+                        "--height",
+                        str(height),
+                        "--width",
+                        str(width),
+                        "--threads",
+                        str(threads),
+                    ],
+                    check=True,
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--engine", choices=ENGINES, help=argparse.SUPPRESS)
+    parser.add_argument("--model-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.engine is None:
+        main(args.repeat, args.height, args.width, args.threads)
+    else:
+        _run_engine(
+            args.engine,
+            args.model_dir,
+            args.repeat,
+            (args.height, args.width),
+            args.threads,
+        )
@@ -0,0 +1,77 @@
+"""Benchmarks per-call overhead of :func:`.narrow_types` argument checking
+
+Compares the checker compiled once per decorated function, with and without
+fast mode, against resolving type hints and binding the signature on every
+call as :func:`.narrow_types` used to do.
+"""
+import argparse
+import inspect
+from typing import Optional, Tuple, get_args, get_origin, get_type_hints
+
+import numpy as np
+
+from gisnav._decorators import _compile_checker, _is_generic_instance
+
+from ._timing import measure, report
+
+
+def _hot_path(
+    image: np.ndarray,
+    orthoimage: np.ndarray,
+    shape: Tuple[int, int],
+    rotation: float,
+    scale: Optional[float] = None,
+) -> None:
+    """Example hot path function with a signature similar to the inner
+    functions wrapped by :func:`.narrow_types`
+    """
+
+
+def _legacy_check(method, args: tuple, kwargs: dict) -> list:
+    """Argument checker equivalent to the previous per-call implementation"""
+    type_hints = get_type_hints(method)
+    signature = inspect.signature(method)
+    bound_arguments = signature.bind(*args, **kwargs)
+    bound_arguments.apply_defaults()
+
+    mismatches = []
+    for name, value in bound_arguments.arguments.items():
+        if name in type_hints:
+            expected_type = type_hints[name]
+            origin_type = get_origin(expected_type)
+            if origin_type is None:
+                check = isinstance(value, expected_type)
+            else:
+                check = _is_generic_instance(
+                    value, origin_type, get_args(expected_type)
+                )
+            if not check:
+                mismatches.append((name, expected_type, type(value)))
+    return mismatches
+
+
+def main(repeat: int) -> None:
+    """Runs the benchmark
+
+    :param repeat: Number of measured calls per case
+    """
+    img = np.zeros((8, 8), dtype=np.uint8)
+    args = (img, img, (8, 8), 1.0)
+
+    compiled = _compile_checker(_hot_path, fast_mode=False)
+    fast = _compile_checker(_hot_path, fast_mode=True)
+    assert not _legacy_check(_hot_path, args, {})
+    assert not compiled(args, {}) and not fast(args, {})
+
+    report(
+        "per-call hints and signature.bind",
+        measure(lambda: _legacy_check(_hot_path, args, {}), repeat),
+    )
+    report("compiled checker", measure(lambda: compiled(args, {}), repeat))
+    report("compiled checker (fast mode)", measure(lambda: fast(args, {}), repeat))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10000)
+    main(parser.parse_args().repeat)
@@ -0,0 +1,79 @@
+"""Benchmarks ground projection of the :term:`camera` :term:`FOV`
+
+Compares :class:`.CameraRays` with :func:`.intersect_plane` against the point
+by point projection ``BBoxNode`` used before, which inverted the intrinsics
+matrix for every point of every callback. Also reports the cost of projecting
+the terrain footprint grid rays.
+"""
+import argparse
+from types import SimpleNamespace
+
+import numpy as np
+
+from gisnav._projection import FOV_POINTS, CameraRays, intersect_plane
+
+from ._timing import measure, report
+
+
+def _legacy_projection(camera_info, R: np.ndarray, C: np.ndarray) -> np.ndarray:
+    """Point by point projection as done by ``BBoxNode`` before
+    :mod:`._projection`
+    """
+    intrinsics = camera_info.k.reshape((3, 3))
+    img_points = [
+        [0, 0],
+        [camera_info.width - 1, 0],
+        [camera_info.width - 1, camera_info.height - 1],
+        [0, camera_info.height - 1],
+        [camera_info.width / 2, camera_info.height / 2],
+    ]
+    ground_points = []
+    for u, v in img_points:
+        d_cam = np.linalg.inv(intrinsics) @ np.array([u, v, 1])
+        d_enu = R @ d_cam
+        t = -C[2] / d_enu[2]
+        ground_points.append((C + t * d_enu)[:2])
+    return np.vstack(ground_points)
+
+
+def main(repeat: int) -> None:
+    """Runs the benchmark
+
+    :param repeat: Number of measured calls per case
+    """
+    camera_info = SimpleNamespace(
+        k=np.array([500.0, 0, 320, 0, 500, 240, 0, 0, 1]), width=640, height=480
+    )
+    # Camera looking straight down from 100 meters
+    R = np.diag((1.0, -1.0, -1.0))
+    C = np.array((0.0, 0.0, 100.0))
+
+    camera_rays = CameraRays()
+    np.testing.assert_allclose(
+        intersect_plane(camera_rays(camera_info)[:FOV_POINTS], R, C),
+        _legacy_projection(camera_info, R, C),
+    )
+
+    report(
+        "FOV point by point (legacy)",
+        measure(lambda: _legacy_projection(camera_info, R, C), repeat),
+    )
+    report(
+        "FOV CameraRays + intersect_plane",
+        measure(
+            lambda: intersect_plane(camera_rays(camera_info)[:FOV_POINTS], R, C),
+            repeat,
+        ),
+    )
+    for grid_size in (4, 8, 16):
+        grid_rays = CameraRays(grid_size)
+        report(
+            f"FOV + {grid_size}x{grid_size} grid CameraRays + intersect_plane",
+            measure(lambda: intersect_plane(grid_rays(camera_info), R, C), repeat),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20000)
+    main(parser.parse_args().repeat)
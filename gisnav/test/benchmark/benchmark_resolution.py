@@ -0,0 +1,66 @@
+"""Benchmarks :class:`.ResolutionController` holding a matching deadline
+across camera resolutions
+
+Matches synthetic image pairs from 640x480 up to 4K with a deadline and
+reports the converged pixel budget, scaling factor and matching latency per
+resolution. Uses the ORB matcher by default so that the benchmark runs without
+``torch``.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from gisnav._matchers import create_matcher
+from gisnav._resolution import ResolutionController
+
+from ._data import synthetic_pair
+
+SHAPES = {
+    "VGA": (480, 640),
+    "720p": (720, 1280),
+    "1080p": (1080, 1920),
+    "4K": (2160, 3840),
+}
+"""Benchmarked camera resolutions"""
+
+
+def main(matcher_name: str, deadline: float, frames: int) -> None:
+    """Runs the benchmark
+
+    :param matcher_name: Keypoint matcher backend
+    :param deadline: Matching deadline in seconds
+    :param frames: Number of matched frames per resolution, the latency is
+        reported over the last half
+    """
+    matcher = create_matcher(matcher_name)
+    rng = np.random.default_rng(0)
+    for name, shape in SHAPES.items():
+        query, reference = synthetic_pair(shape, rng)
+        controller = ResolutionController(shape[0] * shape[1], deadline)
+        latencies = np.empty(frames)
+        for i in range(frames):
+            start = time.perf_counter()
+            scale = controller.scale(shape)
+            query_img, factors = controller.resize(query, scale)
+            reference_img, _ = controller.resize(reference, scale)
+            matcher.match(query_img, reference_img)
+            latencies[i] = time.perf_counter() - start
+            controller.update(latencies[i], query_img.shape[0] * query_img.shape[1])
+
+        p50, p99 = np.percentile(latencies[frames // 2 :], [50, 99])
+        print(
+            f"{name:<6} budget {controller.pixel_budget:>8} px  scale {scale:5.3f}  "
+            f"latency p50 {p50 * 1e3:7.1f} ms p99 {p99 * 1e3:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--matcher", choices=("loftr", "loftr_downscaled", "orb"), default="orb"
+    )
+    parser.add_argument("--deadline", type=float, default=0.05)
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+    main(args.matcher, args.deadline, args.frames)
@@ -0,0 +1,77 @@
+"""Benchmarks :meth:`.TransformNode._rotate_and_crop_center`
+
+Compares warping only the :term:`reference` crop, with and without a
+preallocated output array, against rotating the whole :term:`orthoimage`
+stack and cropping it afterwards as the method used to do.
+"""
+import argparse
+
+import cv2
+import numpy as np
+
+from gisnav.core.transform_node import TransformNode
+
+from ._timing import measure, report
+
+CASES = {
+    "1024x1024 -> 480x640": ((1024, 1024, 3), (480, 640)),
+    "1536x1536 -> 720x1280": ((1536, 1536, 3), (720, 1280)),
+}
+"""Benchmarked orthoimage stack and crop shapes"""
+
+
+def _legacy_rotate_and_crop_center(
+    image: np.ndarray, angle_degrees: float, shape: tuple
+) -> np.ndarray:
+    """Rotates the whole image and then slices out the crop"""
+    h, w = image.shape[:2]
+    center = (w // 2, h // 2)
+    rotation_matrix = cv2.getRotationMatrix2D(center, angle_degrees, 1.0)
+    rotated_image = cv2.warpAffine(image, rotation_matrix, (w, h))
+    x = center[0] - shape[1] // 2
+    y = center[1] - shape[0] // 2
+    return rotated_image[y : y + shape[0], x : x + shape[1]]
+
+
+def main(repeat: int, angle: float) -> None:
+    """Runs the benchmark
+
+    :param repeat: Number of measured calls per case
+    :param angle: Rotation angle in degrees
+    """
+    rng = np.random.default_rng(0)
+    for name, (stack_shape, crop_shape) in CASES.items():
+        stack = rng.integers(0, 255, size=stack_shape, dtype=np.uint8)
+        dst = np.empty((*crop_shape, stack_shape[2]), dtype=np.uint8)
+
+        report(
+            f"{name} rotate then crop",
+            measure(
+                lambda: _legacy_rotate_and_crop_center(stack, angle, crop_shape),
+                repeat,
+            ),
+        )
+        report(
+            f"{name} warp crop",
+            measure(
+                lambda: TransformNode._rotate_and_crop_center(stack, angle, crop_shape),
+                repeat,
+            ),
+        )
+        report(
+            f"{name} warp crop into dst",
+            measure(
+                lambda: TransformNode._rotate_and_crop_center(
+                    stack, angle, crop_shape, dst
+                ),
+                repeat,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--angle", type=float, default=33.0)
+    args = parser.parse_args()
+    main(args.repeat, args.angle)
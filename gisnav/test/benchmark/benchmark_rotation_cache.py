@@ -0,0 +1,91 @@
+"""Benchmarks the :class:`.TransformNode` rotated :term:`reference` cache
+
+Replays a simulated heading trace through
+:meth:`.TransformNode._rotated_reference` and reports the cache hit rate and
+per-frame latency for different :attr:`.TransformNode.rotation_bin` widths,
+with and without the cache. A new :term:`orthoimage` arrives every
+``--orthoimage-period`` frames, which clears the cache.
+"""
+import argparse
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+
+from gisnav.core.transform_node import TransformNode
+
+from ._timing import report
+
+
+class _Node(TransformNode):
+    """:class:`.TransformNode` with the rotation cache state only, without
+    initializing ROS
+    """
+
+    rotation_cache_max_bytes = None  # type: ignore[assignment]
+    rotation_bin = None  # type: ignore[assignment]
+
+    def __init__(self, max_bytes: int, rotation_bin: float) -> None:
+        """Class initializer
+
+        :param max_bytes: Rotation cache memory budget in bytes
+        :param rotation_bin: Rotation bin width in degrees
+        """
+        self._buffers = {}
+        self._rotation_cache = OrderedDict()
+        self._rotation_cache_stamp = None
+        self._rotation_cache_bytes = 0
+        self._rotation_cache_hits = 0
+        self._rotation_cache_misses = 0
+        self.get_logger = mock.Mock()
+        self.rotation_cache_max_bytes = max_bytes
+        self.rotation_bin = rotation_bin
+
+
+def main(frames: int, orthoimage_period: int, max_bytes: int) -> None:
+    """Runs the benchmark
+
+    :param frames: Number of simulated frames
+    :param orthoimage_period: Number of frames per orthoimage
+    :param max_bytes: Rotation cache memory budget in bytes
+    """
+    rng = np.random.default_rng(0)
+    stack = rng.integers(0, 255, size=(1024, 1024, 3), dtype=np.uint8)
+    crop_shape = (480, 640)
+    # Slowly wandering heading with some frame-to-frame jitter
+    headings = 90.0 + np.cumsum(rng.normal(0.0, 0.3, frames))
+
+    for rotation_bin in (0.0, 0.5, 1.0, 2.0):
+        for budget in (0, max_bytes):
+            node = _Node(budget, rotation_bin)
+            samples = np.empty(frames)
+            for i, heading in enumerate(headings):
+                if rotation_bin:
+                    heading = round(heading / rotation_bin) * rotation_bin
+                orthoimage = SimpleNamespace(
+                    header=SimpleNamespace(
+                        stamp=SimpleNamespace(sec=i // orthoimage_period, nanosec=0)
+                    )
+                )
+                start = time.perf_counter()
+                node._rotated_reference(orthoimage, stack, heading, crop_shape)
+                samples[i] = time.perf_counter() - start
+
+            hits, misses = node.rotation_cache_stats
+            hit_rate = hits / (hits + misses) if hits + misses > 0 else 0.0
+            report(
+                f"bin {rotation_bin:3.1f} deg, cache {budget // 1024**2:3d} MiB, "
+                f"hit rate {hit_rate:4.2f}",
+                samples,
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--orthoimage-period", type=int, default=100)
+    parser.add_argument("--max-bytes", type=int, default=64 * 1024**2)
+    args = parser.parse_args()
+    main(args.frames, args.orthoimage_period, args.max_bytes)
@@ -0,0 +1,56 @@
+"""Benchmarks :meth:`.ElevationModel.intersect` for :term:`FOV` footprints
+
+Intersects the FOV corner and principal point rays, and optionally grids of
+rays (see :attr:`.BBoxNode.terrain_grid_size`), with a synthetic hilly
+:term:`DEM`.
+"""
+import argparse
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from gisnav._messaging import BBox
+from gisnav._projection import CameraRays
+from gisnav._terrain import ElevationModel
+
+from ._timing import measure, report
+
+
+def main(repeat: int) -> None:
+    """Runs the benchmark
+
+    :param repeat: Number of measured calls per case
+    """
+    rng = np.random.default_rng(0)
+    dem = cv2.resize(
+        rng.uniform(0, 300, (20, 30)).astype(np.float32),
+        (1024, 768),
+        interpolation=cv2.INTER_CUBIC,
+    )
+    model = ElevationModel(dem, BBox(24.0, 60.0, 24.03, 60.02))
+    camera_info = SimpleNamespace(
+        k=np.array([500.0, 0, 320, 0, 500, 240, 0, 0, 1]), width=640, height=480
+    )
+    # Camera looking down tilted forward by 20 degrees
+    pitch = np.radians(20)
+    R = np.array(
+        [
+            [1, 0, 0],
+            [0, -np.cos(pitch), np.sin(pitch)],
+            [0, -np.sin(pitch), -np.cos(pitch)],
+        ]
+    )
+
+    for grid_size in (0, 4, 8, 16):
+        directions = CameraRays(grid_size)(camera_info) @ R.T
+        report(
+            f"{len(directions)} rays ({grid_size}x{grid_size} grid)",
+            measure(lambda: model.intersect(directions, 24.015, 60.01, 500.0), repeat),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200)
+    main(parser.parse_args().repeat)
@@ -0,0 +1,92 @@
+"""Calibrates the INT8 ONNX LoFTR model on recorded :attr:`.TransformNode.pnp_image`
+stacks
+
+The ``int8`` :attr:`.PoseNode.matcher_precision` of the ``onnx``
+:attr:`.PoseNode.matcher_engine` dynamically quantizes the exported model,
+which needs no calibration data but quantizes activations from their runtime
+range. This script statically quantizes the exported fp32 model with
+activation ranges calibrated on recorded stacks instead, and writes it over
+the INT8 model in the model directory so that :class:`.PoseNode` picks it up.
+
+Check the calibrated model with :mod:`test.benchmark.pose_regression` before
+deploying it. Stacks are recorded as described in :func:`.load_pnp_stacks`.
+"""
+import argparse
+import os
+
+import numpy as np
+
+from gisnav._matchers import ExportedLoFTRMatcher, _loftr_shape, _resize_for_loftr
+
+from ._data import load_pnp_stacks
+
+
+class _StackReader:
+    """ONNX Runtime calibration data reader for recorded stacks"""
+
+    def __init__(self, stacks: list, scale: float) -> None:
+        """Class initializer
+
+        :param stacks: Recorded stacks from :func:`.load_pnp_stacks`
+        :param scale: Image scaling factor applied before matching
+        """
+        self._inputs = iter(
+            {
+                name: (
+                    _resize_for_loftr(stack[:, :, channel], scale)[0][None, None]
+                    / np.float32(255.0)
+                ).astype(np.float32)
+                for name, channel in (("image0", 0), ("image1", 1))
+            }
+            for stack in stacks
+        )
+
+    def get_next(self):
+        """Returns the next model input, or None when exhausted"""
+        return next(self._inputs, None)
+
+
+def main(stacks_dir: str, model_dir: str, scale: float) -> None:
+    """Runs the calibration
+
+    :param stacks_dir: Directory containing the recorded stacks
+    :param model_dir: Exported LoFTR model directory, see
+        :attr:`.PoseNode.matcher_model_dir`
+    :param scale: Image scaling factor applied before matching, see
+        :attr:`.PoseNode.matcher_scale`
+    """
+    from onnxruntime.quantization import QuantType, quantize_static
+
+    stacks = load_pnp_stacks(stacks_dir)
+    if len(stacks) == 0:
+        raise ValueError(f"No recorded stacks found in {stacks_dir}.")
+    shapes = {stack.shape[0:2] for stack in stacks}
+    if len(shapes) != 1:
+        raise ValueError(f"Recorded stacks must have a single shape ({shapes}).")
+    stack_shape = shapes.pop()
+    shape = _loftr_shape(stack_shape, scale)
+
+    fp32 = ExportedLoFTRMatcher("onnx", model_dir, scale=scale, precision="fp32")
+    fp32.prepare(stack_shape, wait=True)
+    int8 = ExportedLoFTRMatcher("onnx", model_dir, scale=scale, precision="int8")
+
+    output_path = int8._model_path(shape, shape)
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    quantize_static(
+        fp32._model_path(shape, shape),
+        tmp_path,
+        _StackReader(stacks, scale),
+        weight_type=QuantType.QInt8,
+        activation_type=QuantType.QUInt8,
+    )
+    os.replace(tmp_path, output_path)
+    print(f"Calibrated on {len(stacks)} stacks, wrote {output_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("stacks_dir", help="Directory of recorded .npy stacks")
+    parser.add_argument("--model-dir", default="~/.cache/gisnav/models")
+    parser.add_argument("--scale", type=float, default=1.0)
+    args = parser.parse_args()
+    main(args.stacks_dir, args.model_dir, args.scale)
@@ -0,0 +1,143 @@
+"""Pose accuracy regression harness for quantized LoFTR inference
+
+Matches recorded :attr:`.TransformNode.pnp_image` stacks with the fp32 eager
+LoFTR matcher and with a quantized configuration, solves :term:`PnP` for both
+like :class:`.PoseNode` does, and reports how much the quantized
+:term:`poses <pose>` deviate from the fp32 poses. Exits with a non-zero status
+if the 95th percentile deviation exceeds the tolerances or the quantized
+configuration fails to solve PnP for stacks the fp32 matcher solved.
+
+Stacks are recorded as described in :func:`.load_pnp_stacks`.
+"""
+import argparse
+import sys
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from gisnav._matchers import Matches, create_matcher
+from gisnav.core.pose_node import PoseNode
+
+from ._data import load_pnp_stacks
+
+
+def _solve_pose(
+    matches: Matches, stack: np.ndarray, k_matrix: np.ndarray
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Returns camera rotation matrix and position for the matches, or None
+    if there are not enough confident matches
+
+    Mirrors :meth:`.PoseNode.postprocess`.
+    """
+    valid = matches["confidence"] > PoseNode.CONFIDENCE_THRESHOLD
+    mkp_qry = matches["keypoints0"][valid, :].copy()
+    mkp_ref = matches["keypoints1"][valid, :]
+    if len(mkp_qry) < PoseNode.MIN_MATCHES:
+        return None
+
+    elevation = (stack[:, :, 2].astype(np.uint16) << 8) | stack[:, :, 3]
+    mkp2_3d = PoseNode._compute_3d_points(mkp_ref, elevation)
+    height = stack.shape[0]
+    mkp2_3d[:, 1] = height - mkp2_3d[:, 1]
+    mkp_qry[:, 1] = height - mkp_qry[:, 1]
+    r, t = PoseNode._compute_pose(mkp2_3d, mkp_qry, k_matrix)
+    return r, (-r.T @ t).squeeze()
+
+
+def _rotation_deg(r0: np.ndarray, r1: np.ndarray) -> float:
+    """Returns the angle in degrees of the rotation between two rotations"""
+    rvec, _ = cv2.Rodrigues(r0.T @ r1)
+    return float(np.degrees(np.linalg.norm(rvec)))
+
+
+def main(
+    stacks_dir: str,
+    engine: str,
+    precision: str,
+    model_dir: str,
+    max_rotation: float,
+    max_position: float,
+) -> int:
+    """Runs the regression
+
+    :param stacks_dir: Directory containing the recorded stacks
+    :param engine: Inference engine of the quantized configuration
+    :param precision: Inference precision of the quantized configuration
+    :param model_dir: Exported LoFTR model directory
+    :param max_rotation: Tolerance for the 95th percentile rotation deviation
+        in degrees
+    :param max_position: Tolerance for the 95th percentile position deviation
+        in :term:`reference` image pixels
+    :return: Exit status, 0 if within tolerances
+    """
+    stacks = load_pnp_stacks(stacks_dir)
+    if len(stacks) == 0:
+        raise ValueError(f"No recorded stacks found in {stacks_dir}.")
+
+    baseline = create_matcher("loftr", engine="eager", precision="fp32")
+    candidate = create_matcher(
+        "loftr", engine=engine, precision=precision, model_dir=model_dir
+    )
+
+    rotations, positions = [], []
+    regressions = 0
+    for stack in stacks:
+        height, width = stack.shape[0:2]
+        # Approximate intrinsics, both poses are solved with the same matrix
+        k_matrix = np.array(
+            [[width, 0, width / 2], [0, width, height / 2], [0, 0, 1]], dtype=float
+        )
+        query, reference = stack[:, :, 0], stack[:, :, 1]
+        expected = _solve_pose(baseline.match(query, reference), stack, k_matrix)
+        actual = _solve_pose(candidate.match(query, reference), stack, k_matrix)
+        if expected is None:
+            continue
+        if actual is None:
+            regressions += 1
+            continue
+        rotations.append(_rotation_deg(expected[0], actual[0]))
+        positions.append(float(np.linalg.norm(expected[1] - actual[1])))
+
+    if len(rotations) == 0:
+        print("No stacks were solved by both configurations")
+        return 1
+
+    rotation_p95, position_p95 = np.percentile(rotations, 95), np.percentile(
+        positions, 95
+    )
+    print(
+        f"{engine} {precision} vs eager fp32 on {len(stacks)} stacks: "
+        f"rotation p95 {rotation_p95:.3f} deg, position p95 {position_p95:.2f} "
+        f"px, {regressions} stacks not solved"
+    )
+    passed = (
+        rotation_p95 <= max_rotation
+        and position_p95 <= max_position
+        and regressions == 0
+    )
+    print("PASS" if passed else "FAIL")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("stacks_dir", help="Directory of recorded .npy stacks")
+    parser.add_argument(
+        "--engine", choices=("eager", "torchscript", "onnx"), default="eager"
+    )
+    parser.add_argument("--precision", choices=("fp16", "int8"), default="int8")
+    parser.add_argument("--model-dir", default="~/.cache/gisnav/models")
+    parser.add_argument("--max-rotation", type=float, default=1.0)
+    parser.add_argument("--max-position", type=float, default=2.0)
+    args = parser.parse_args()
+    sys.exit(
+        main(
+            args.stacks_dir,
+            args.engine,
+            args.precision,
+            args.model_dir,
+            args.max_rotation,
+            args.max_position,
+        )
+    )
@@ -33,6 +33,7 @@ class TestTopographyCase(unittest.TestCase):
         "/gisnav/gis_node/geotransform",
         "/gisnav/gis_node/orthoimage",
         "/gisnav/transform_node/image",
+        "/gisnav/transform_node/reference/time",
         "/mavros/gimbal_control/device/attitude_status",
         "/mavros/global_position/global",
         "/mavros/local_position/pose",
@@ -49,9 +50,10 @@ class TestTopographyCase(unittest.TestCase):
         "sensor_msgs/msg/Image",
         "px4_msgs/msg/SensorGps",
         "geographic_msgs/msg/BoundingBox",
-        "sensor_msgs/msg/PointCloud2",
         "sensor_msgs/msg/Image",
         "sensor_msgs/msg/Image",
+        "sensor_msgs/msg/Image",
+        "sensor_msgs/msg/TimeReference",
         "mavros_msgs/msg/GimbalDeviceAttitudeStatus",
         "sensor_msgs/msg/NavSatFix",
         "geometry_msgs/msg/PoseStamped",
@@ -183,6 +185,7 @@ class TestTopographyArduPilotCase(TestTopographyCase):
         "/gisnav/gis_node/geotransform",
         "/gisnav/gis_node/orthoimage",
         "/gisnav/transform_node/image",
+        "/gisnav/transform_node/reference/time",
         "/mavros/gimbal_control/device/attitude_status",
         "/mavros/global_position/global",
         "/mavros/local_position/pose",
@@ -201,9 +204,10 @@ class TestTopographyArduPilotCase(TestTopographyCase):
         "sensor_msgs/msg/CameraInfo",
         "sensor_msgs/msg/Image",
         "geographic_msgs/msg/BoundingBox",
-        "sensor_msgs/msg/PointCloud2",
         "sensor_msgs/msg/Image",
         "sensor_msgs/msg/Image",
+        "sensor_msgs/msg/Image",
+        "sensor_msgs/msg/TimeReference",
         "mavros_msgs/msg/GimbalDeviceAttitudeStatus",
         "sensor_msgs/msg/NavSatFix",
         "geometry_msgs/msg/PoseStamped",
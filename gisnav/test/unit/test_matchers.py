@@ -0,0 +1,181 @@
+"""Tests for :mod:`gisnav._matchers`"""
+import importlib.util
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import cv2
+import numpy as np
+
+from gisnav._matchers import (
+    ExportedLoFTRMatcher,
+    LoFTRMatcher,
+    Matcher,
+    OpenCVMatcher,
+    ReferenceCache,
+    _loftr_shape,
+    _resize_for_loftr,
+)
+
+
+class TestMatcher(unittest.TestCase):
+    """Tests the keypoint matcher backends that do not need ``torch``"""
+
+    @staticmethod
+    def _pair():
+        """Returns a textured reference image and a rotated query image"""
+        rng = np.random.default_rng(0)
+        noise = rng.integers(0, 255, size=(60, 80), dtype=np.uint8)
+        reference = cv2.resize(noise, (640, 480), interpolation=cv2.INTER_CUBIC)
+        matrix = cv2.getRotationMatrix2D((320, 240), 5.0, 1.0)
+        return cv2.warpAffine(reference, matrix, (640, 480)), reference
+
+    def test_matcher_is_abstract(self):
+        """Tests that the matcher base class cannot be instantiated"""
+        self.assertRaises(TypeError, Matcher, 0)
+
+    def test_opencv_matches(self):
+        """Tests that the OpenCV matchers return matches in the common format"""
+        query, reference = self._pair()
+        for detector in ("orb", "akaze"):
+            with self.subTest(detector=detector):
+                if detector == "akaze" and not hasattr(cv2, "AKAZE_create"):
+                    self.skipTest("AKAZE is not available in this OpenCV build.")
+                matches = OpenCVMatcher(detector).match(query, reference)
+
+                self.assertEqual(
+                    set(matches), {"keypoints0", "keypoints1", "confidence"}
+                )
+                n = len(matches["confidence"])
+                self.assertGreater(n, 0)
+                self.assertEqual(matches["keypoints0"].shape, (n, 2))
+                self.assertEqual(matches["keypoints1"].shape, (n, 2))
+                confidence = matches["confidence"]
+                self.assertTrue(np.all((confidence >= 0) & (confidence <= 1)))
+
+    def test_opencv_reference_cache(self):
+        """Tests that reference features are encoded once per reference"""
+        query, reference = self._pair()
+        matcher = OpenCVMatcher("orb", cache_size=1)
+        first = matcher.match(query, reference)
+        second = matcher.match(query, reference.copy())
+
+        self.assertEqual(matcher.cache_stats, (1, 1))
+        np.testing.assert_array_equal(first["keypoints1"], second["keypoints1"])
+
+    def test_reference_cache_disabled(self):
+        """Tests that a disabled reference cache encodes every reference
+        without hashing it
+        """
+        cache: ReferenceCache = ReferenceCache(0)
+        reference = np.zeros((4, 4), dtype=np.uint8)
+        with mock.patch.object(ReferenceCache, "key") as key:
+            for _ in range(2):
+                self.assertEqual(cache.get(reference, lambda: "features"), "features")
+        key.assert_not_called()
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_loftr_shape(self):
+        """Tests that the LoFTR input shape used to prepare exported models
+        matches the shape of the resized image
+        """
+        for shape in ((480, 640), (720, 1280), (1080, 1920), (333, 517)):
+            for scale in (1.0, 0.5, 0.3):
+                with self.subTest(shape=shape, scale=scale):
+                    img = np.zeros(shape, dtype=np.uint8)
+                    resized, _ = _resize_for_loftr(img, scale)
+                    self.assertEqual(_loftr_shape(shape, scale), resized.shape)
+
+    def test_exported_loftr_background_export(self):
+        """Tests that the exported LoFTR matcher exports models in the
+        background and matches in eager mode until the model is ready
+        """
+        query, reference = self._pair()
+        exported = {
+            "keypoints0": np.ones((1, 2)),
+            "keypoints1": np.ones((1, 2)),
+            "confidence": np.ones(1),
+        }
+        export_done = threading.Event()
+
+        def _export(matcher, key):
+            export_done.wait(5)
+            matcher._models[key] = lambda *_: tuple(exported.values())
+
+        with tempfile.TemporaryDirectory() as model_dir, mock.patch.object(
+            ExportedLoFTRMatcher, "_export_and_load", _export
+        ), mock.patch("gisnav._matchers.LoFTRMatcher") as eager_cls:
+            matcher = ExportedLoFTRMatcher("onnx", model_dir)
+            matcher.prepare(query.shape)
+            matches = matcher.match(query, reference)
+            eager_cls.return_value.match.assert_called_once_with(query, reference)
+            self.assertIs(matches, eager_cls.return_value.match.return_value)
+
+            export_done.set()
+            matcher.prepare(query.shape, wait=True)
+            matches = matcher.match(query, reference)
+            eager_cls.return_value.match.assert_called_once()
+            np.testing.assert_array_equal(matches["confidence"], np.ones(1))
+            self.assertIsNone(matcher._eager)
+
+
+@unittest.skipUnless(
+    importlib.util.find_spec("torch") and importlib.util.find_spec("kornia"),
+    "LoFTR needs torch and kornia.",
+)
+class TestExportedLoFTRMatcher(unittest.TestCase):
+    """Tests the exported LoFTR matcher against the eager LoFTR matcher"""
+
+    _IMAGE_PATH = os.path.join(
+        os.path.dirname(__file__),
+        *(os.pardir,) * 3,
+        "docs",
+        "_static",
+        "img",
+        "gisnav_sitl_featureless_buildings.jpg",
+    )
+    """Real aerial image for creating the image pair"""
+
+    @classmethod
+    def _pair(cls):
+        """Returns a reference crop of a real aerial image and a rotated
+        query image of the same scene
+        """
+        img = cv2.imread(cls._IMAGE_PATH, cv2.IMREAD_GRAYSCALE)
+        reference = img[0:480, 0:480]
+        matrix = cv2.getRotationMatrix2D((240, 240), 5.0, 1.0)
+        return cv2.warpAffine(reference, matrix, (480, 480)), reference
+
+    def test_exported_matches_eager(self):
+        """Tests that the exported model refines matches like the eager model
+        on a real image pair instead of replaying the branches taken when
+        tracing
+        """
+        query, reference = self._pair()
+        eager = LoFTRMatcher(device="cpu").match(query, reference)
+        n = len(eager["confidence"])
+        self.assertGreater(n, 100)
+
+        for engine in ("torchscript", "onnx"):
+            with self.subTest(engine=engine):
+                if engine == "onnx" and not importlib.util.find_spec("onnxruntime"):
+                    self.skipTest("ONNX Runtime is not installed.")
+                with tempfile.TemporaryDirectory() as model_dir:
+                    matcher = ExportedLoFTRMatcher(engine, model_dir)
+                    matcher.prepare(query.shape, wait=True)
+                    exported = matcher.match(query, reference)
+
+                self.assertAlmostEqual(len(exported["confidence"]) / n, 1.0, delta=0.1)
+                # Coarse-only matches would lie on the 8 pixel coarse grid
+                self.assertTrue(np.any(exported["keypoints1"] % 8 != 0))
+                distances = np.linalg.norm(
+                    exported["keypoints0"][:, None] - eager["keypoints0"][None],
+                    axis=2,
+                ).min(axis=1)
+                self.assertLess(np.median(distances), 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+"""Tests for :mod:`gisnav._messaging`"""
+import unittest
+from unittest import mock
+
+import numpy as np
+from builtin_interfaces.msg import Time
+from std_msgs.msg import Header
+
+from gisnav import _messaging as messaging
+
+
+class TestImageCodec(unittest.TestCase):
+    """Tests that :func:`.image_to_array` and :func:`.array_to_image` round
+    trip images without loss
+    """
+
+    def test_round_trip(self):
+        """Tests round trip of the image stacks used by the nodes"""
+        rng = np.random.default_rng(0)
+        for shape, dtype, encoding in (
+            ((720, 1280), np.uint8, "8UC1"),
+            ((720, 1280, 3), np.uint8, "8UC3"),  # orthoimage stack
+            ((720, 1280, 4), np.uint8, "8UC4"),  # pnp_image stack
+            ((480, 640), np.uint16, "16UC1"),
+            ((4, 4), np.float64, "64FC1"),  # geotransform
+        ):
+            with self.subTest(shape=shape, dtype=dtype):
+                img = rng.integers(0, 255, size=shape).astype(dtype)
+                msg = messaging.array_to_image(img)
+                self.assertEqual(msg.encoding, encoding)
+                self.assertEqual((msg.height, msg.width), shape[0:2])
+
+                decoded = messaging.image_to_array(msg)
+                self.assertEqual(decoded.dtype, img.dtype)
+                np.testing.assert_array_equal(decoded, img)
+
+    def test_decode_is_zero_copy(self):
+        """Tests that decoding an unpadded native byte order image does not
+        copy the message data
+        """
+        img = np.zeros((8, 8, 4), dtype=np.uint8)
+        msg = messaging.array_to_image(img)
+
+        decoded = messaging.image_to_array(msg)
+        self.assertTrue(np.shares_memory(decoded, np.frombuffer(msg.data, np.uint8)))
+
+    def test_decode_padded_rows(self):
+        """Tests that row padding in the message step is removed"""
+        img = np.arange(6 * 5, dtype=np.uint8).reshape(6, 5)
+        msg = messaging.array_to_image(img)
+        padded = np.zeros((6, 8), dtype=np.uint8)
+        padded[:, :5] = img
+        msg.data = padded.tobytes()
+        msg.step = 8
+
+        np.testing.assert_array_equal(messaging.image_to_array(msg), img)
+
+    def test_decode_big_endian(self):
+        """Tests that big endian data is decoded to native byte order"""
+        img = np.arange(4 * 4, dtype=np.uint16).reshape(4, 4)
+        msg = messaging.array_to_image(img)
+        msg.data = img.astype(">u2").tobytes()
+        msg.is_bigendian = True
+
+        decoded = messaging.image_to_array(msg)
+        self.assertTrue(decoded.dtype.isnative)
+        np.testing.assert_array_equal(decoded, img)
+
+    def test_decode_mono8(self):
+        """Tests that color images are converted to grayscale for ``mono8``"""
+        img = np.full((4, 4, 3), 128, dtype=np.uint8)
+        msg = messaging.array_to_image(img, "bgr8")
+
+        decoded = messaging.image_to_array(msg, desired_encoding="mono8")
+        self.assertEqual(decoded.shape, (4, 4))
+        np.testing.assert_array_equal(decoded, 128)
+
+    def test_encode_invalid_encoding(self):
+        """Tests that an array that does not match the encoding is rejected"""
+        with self.assertRaises(ValueError):
+            messaging.array_to_image(np.zeros((4, 4), dtype=np.uint8), "bgr8")
+
+
+def _transform_matrix(transform) -> np.ndarray:
+    """Returns a transform message as a 4x4 homogeneous matrix"""
+    q = transform.transform.rotation
+    x, y, z, w = q.x, q.y, q.z, q.w
+    matrix = np.eye(4)
+    matrix[:3, :3] = (
+        (1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)),
+        (2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)),
+        (2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)),
+    )
+    t = transform.transform.translation
+    matrix[:3, 3] = t.x, t.y, t.z
+    return matrix
+
+
+class TestComposeTransforms(unittest.TestCase):
+    """Tests :func:`.compose_transforms`"""
+
+    def test_matches_matrix_product(self):
+        """Tests that the composed transform matches the product of the
+        homogeneous transformation matrices
+        """
+        rng = np.random.default_rng(0)
+        for _ in range(10):
+            q1, q2 = (q / np.linalg.norm(q) for q in rng.normal(size=(2, 4)))
+            t1, t2 = rng.normal(size=(2, 3)) * 100
+            stamp = Time(sec=1, nanosec=0)
+            parent = messaging.create_transform_msg(stamp, "a", "b", q1, t1)
+            child = messaging.create_transform_msg(
+                Time(sec=2, nanosec=0), "b", "c", q2, t2
+            )
+
+            composed = messaging.compose_transforms(parent, child)
+
+            self.assertEqual(composed.header.stamp, stamp)
+            self.assertEqual(composed.header.frame_id, "a")
+            self.assertEqual(composed.child_frame_id, "c")
+            np.testing.assert_allclose(
+                _transform_matrix(composed),
+                _transform_matrix(parent) @ _transform_matrix(child),
+                atol=1e-9,
+            )
+
+
+class TestGeotransformRegistry(unittest.TestCase):
+    """Tests :class:`.GeotransformRegistry`"""
+
+    @staticmethod
+    def _put(registry: messaging.GeotransformRegistry, sec: int) -> Time:
+        """Registers a geotransform for the orthoimage timestamp"""
+        stamp = Time(sec=sec, nanosec=0)
+        registry.put(stamp, np.full((4, 4), sec, dtype=np.float64))
+        return stamp
+
+    def test_expires_by_horizon(self):
+        """Tests that geotransforms older than the horizon relative to the
+        latest registered geotransform are expired
+        """
+        registry = messaging.GeotransformRegistry(max_size=10, horizon=5.0)
+        stamps = [self._put(registry, sec) for sec in (0, 3, 6, 9)]
+
+        self.assertIsNone(registry.get(stamps[0]))
+        self.assertIsNone(registry.get(stamps[1]))
+        self.assertEqual(registry.get(stamps[2])[0, 0], 6)
+        self.assertEqual(len(registry), 2)
+
+    def test_evicts_least_recently_used(self):
+        """Tests that the least recently used geotransform is evicted when
+        the registry is full
+        """
+        registry = messaging.GeotransformRegistry(max_size=2)
+        first, second = self._put(registry, 1), self._put(registry, 2)
+        registry.get(first)
+        self._put(registry, 3)
+
+        self.assertIsNotNone(registry.get(first))
+        self.assertIsNone(registry.get(second))
+
+    def test_configure(self):
+        """Tests that configuring the registry sets its bounds once and then
+        only ever increases them, and invalid bounds are rejected
+        """
+        registry = messaging.GeotransformRegistry(max_size=10)
+        registry.configure(max_size=2, horizon=2.0)
+        registry.configure(max_size=1, horizon=1.0)
+        stamps = [self._put(registry, sec) for sec in range(4)]
+        self.assertEqual(len(registry), 2)
+
+        registry.configure(max_size=5, horizon=3.0)
+        stamps = [self._put(registry, sec) for sec in range(4, 10)]
+        self.assertEqual(len(registry), 4)
+        self.assertIsNone(registry.get(stamps[-5]))
+
+        registry.configure(max_size=5, horizon=0.0)
+        stamps = [self._put(registry, sec) for sec in range(10, 20)]
+        self.assertEqual(len(registry), 5)
+        registry.configure(max_size=5, horizon=1.0)
+        self._put(registry, 20)
+        self.assertIsNotNone(registry.get(stamps[-4]))
+
+        for max_size, horizon in ((0, 1.0), (1, -1.0)):
+            with self.subTest(max_size=max_size, horizon=horizon):
+                with self.assertRaises(ValueError):
+                    registry.configure(max_size, horizon)
+
+
+class TestRegisterGeotransform(unittest.TestCase):
+    """Tests :func:`.register_geotransform`"""
+
+    def test_register(self):
+        """Tests that a decoded geotransform is registered by its stamp and
+        an invalid message is logged and ignored
+        """
+        node = mock.Mock()
+        stamp = Time(sec=123456, nanosec=789)
+        M = np.arange(16, dtype=np.float64).reshape(4, 4)
+        msg = messaging.geotransform_to_image(M, Header(stamp=stamp))
+
+        messaging.register_geotransform(node, msg)
+        np.testing.assert_array_equal(messaging.geotransform_registry.get(stamp), M)
+        node.get_logger.return_value.error.assert_not_called()
+
+        invalid = messaging.array_to_image(np.zeros((3, 4)))
+        invalid.header = Header(stamp=Time(sec=123457, nanosec=0))
+        messaging.register_geotransform(node, invalid)
+        self.assertIsNone(messaging.geotransform_registry.get(invalid.header.stamp))
+        node.get_logger.return_value.error.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
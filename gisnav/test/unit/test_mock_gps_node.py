@@ -0,0 +1,81 @@
+"""Tests for :class:`.MockGPSNode`"""
+import unittest
+from unittest import mock
+
+import numpy as np
+import rclpy
+from builtin_interfaces.msg import Time
+from sensor_msgs.msg import TimeReference
+from std_msgs.msg import Header
+
+from gisnav import _messaging as messaging
+from gisnav.extensions.mock_gps_node import MockGPSNode
+
+
+class TestCameraToReference(unittest.TestCase):
+    """Tests :meth:`.MockGPSNode._camera_to_reference`"""
+
+    def setUp(self) -> None:
+        """Creates a node with a tf buffer stand-in only, without
+        initializing ROS
+        """
+        self.node = MockGPSNode.__new__(MockGPSNode)
+        self.node.get_logger = mock.Mock()
+        self.node.tf_buffer = mock.Mock()
+
+        self.image_stamp = Time(sec=1000, nanosec=0)
+        self.reference_time = TimeReference(
+            header=Header(stamp=self.image_stamp), time_ref=Time(sec=900, nanosec=0)
+        )
+
+        q = (0.0, 0.0, np.sin(np.pi / 4), np.cos(np.pi / 4))  # 90 deg yaw
+        self.reference_to_world = messaging.create_transform_msg(
+            self.image_stamp, "reference", "world", q, np.array((10.0, 20.0, 0.0))
+        )
+        # PoseNode stamps world to camera in FCU time, far from the image stamp
+        self.world_to_camera = messaging.create_transform_msg(
+            Time(sec=5, nanosec=0),
+            "world",
+            "camera",
+            (0.0, 0.0, 0.0, 1.0),
+            np.array((1.0, 2.0, 100.0)),
+        )
+
+    def _lookup_transform(self, target_frame, source_frame, time):
+        """Serves reference to world at the exact image timestamp and world
+        to camera at the latest time only
+        """
+        if (target_frame, source_frame) == ("reference", "world"):
+            if time == rclpy.time.Time.from_msg(self.image_stamp):
+                return self.reference_to_world
+        elif (target_frame, source_frame) == ("world", "camera"):
+            if time == rclpy.time.Time():
+                return self.world_to_camera
+        raise AssertionError(f"Unexpected lookup {target_frame} {source_frame}")
+
+    def test_offset_time_bases(self):
+        """Tests that the camera to reference transform is found when the
+        world to camera transform is stamped in a different time base than
+        the query image
+        """
+        self.node.tf_buffer.lookup_transform.side_effect = self._lookup_transform
+
+        transform = self.node._camera_to_reference(self.reference_time)
+
+        self.assertIsNotNone(transform)
+        self.assertEqual(transform.header.stamp, self.image_stamp)
+        self.assertEqual(transform.header.frame_id, "reference")
+        self.assertEqual(transform.child_frame_id, "camera")
+        translation = transform.transform.translation
+        np.testing.assert_allclose(
+            (translation.x, translation.y, translation.z), (8.0, 21.0, 100.0)
+        )
+
+    def test_unavailable(self):
+        """Tests that None is returned if a transform is not available"""
+        with mock.patch.object(messaging, "get_transform", return_value=None):
+            self.assertIsNone(self.node._camera_to_reference(self.reference_time))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Tests for :class:`.PoseNode`"""
+import threading
+import time
+import unittest
+from unittest import mock
+
+from gisnav.core.pose_node import PoseNode
+
+
+class TestDropStaleFrames(unittest.TestCase):
+    """Tests that :class:`.PoseNode` only matches the newest image when
+    :attr:`.PoseNode.drop_stale_frames` is enabled
+    """
+
+    def setUp(self) -> None:
+        """Creates a node with the inference worker state only, without
+        initializing ROS
+        """
+        self.node = PoseNode.__new__(PoseNode)
+        self.node._mailbox = None
+        self.node._mailbox_condition = threading.Condition()
+        self.node._dropped_frames = 0
+        self.node._stopped = False
+        self.node._match = mock.Mock()
+        self.node._worker = threading.Thread(
+            target=self.node._inference_worker, daemon=True
+        )
+
+    def tearDown(self) -> None:
+        """Stops the inference worker if it was started"""
+        with self.node._mailbox_condition:
+            self.node._stopped = True
+            self.node._mailbox_condition.notify()
+        if self.node._worker.is_alive():
+            self.node._worker.join(timeout=1.0)
+
+    def test_mailbox_keeps_newest(self):
+        """Tests that a new image replaces an unmatched image in the mailbox
+        and is counted as dropped
+        """
+        old, new = object(), object()
+        self.node._image_cb(old)
+        self.node._image_cb(new)
+
+        self.assertIs(self.node._mailbox, new)
+        self.assertEqual(self.node._dropped_frames, 1)
+
+    def test_worker_matches_newest(self):
+        """Tests that the inference worker matches only the newest image"""
+        old, new = object(), object()
+        self.node._image_cb(old)
+        self.node._image_cb(new)
+        self.node._worker.start()
+
+        deadline = time.monotonic() + 1.0
+        while not self.node._match.called and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        self.node._match.assert_called_once_with([new])
+        self.assertIsNone(self.node._mailbox)
+
+    def test_worker_stops(self):
+        """Tests that the inference worker exits when the node is stopped"""
+        self.node._worker.start()
+        with self.node._mailbox_condition:
+            self.node._stopped = True
+            self.node._mailbox_condition.notify()
+        self.node._worker.join(timeout=1.0)
+
+        self.assertFalse(self.node._worker.is_alive())
+        self.node._match.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
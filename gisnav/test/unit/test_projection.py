@@ -0,0 +1,111 @@
+"""Tests for :mod:`gisnav._projection`"""
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from gisnav._projection import (
+    FOV_POINTS,
+    CameraRays,
+    fov_image_points,
+    grid_image_points,
+    intersect_plane,
+)
+
+
+def _camera_info(fx: float, fy: float, width: int, height: int) -> SimpleNamespace:
+    """Returns an object with the :class:`sensor_msgs.msg.CameraInfo` fields
+    read by :class:`.CameraRays`
+    """
+    k = np.array([fx, 0, width / 2, 0, fy, height / 2, 0, 0, 1], dtype=np.float64)
+    return SimpleNamespace(k=k, width=width, height=height)
+
+
+def _rotation(roll: float, pitch: float, yaw: float) -> np.ndarray:
+    """Returns a rotation matrix for the Euler angles in degrees"""
+    r, p, y = np.radians((roll, pitch, yaw))
+    rx = np.array([[1, 0, 0], [0, np.cos(r), -np.sin(r)], [0, np.sin(r), np.cos(r)]])
+    ry = np.array([[np.cos(p), 0, np.sin(p)], [0, 1, 0], [-np.sin(p), 0, np.cos(p)]])
+    rz = np.array([[np.cos(y), -np.sin(y), 0], [np.sin(y), np.cos(y), 0], [0, 0, 1]])
+    return rz @ ry @ rx
+
+
+def _legacy_projection(camera_info, R: np.ndarray, C: np.ndarray) -> np.ndarray:
+    """Point by point ground projection of the :term:`FOV` corners and
+    principal point as done by ``BBoxNode`` before :mod:`._projection`
+    """
+    intrinsics = camera_info.k.reshape((3, 3))
+    img_points = [
+        [0, 0],
+        [camera_info.width - 1, 0],
+        [camera_info.width - 1, camera_info.height - 1],
+        [0, camera_info.height - 1],
+        [camera_info.width / 2, camera_info.height / 2],
+    ]
+    ground_points = []
+    for u, v in img_points:
+        d_cam = np.linalg.inv(intrinsics) @ np.array([u, v, 1])
+        d_enu = R @ d_cam
+        t = -C[2] / d_enu[2]
+        ground_points.append((C + t * d_enu)[:2])
+    return np.vstack(ground_points)
+
+
+class TestProjection(unittest.TestCase):
+    """Tests :class:`.CameraRays` and :func:`.intersect_plane`"""
+
+    def test_matches_legacy_projection(self):
+        """Tests that the vectorized projection matches the previous point by
+        point projection
+        """
+        # Camera looking down (z-axis towards the ground) with some tilt
+        down = _rotation(180.0, 0.0, 0.0)
+        cases = [
+            (_camera_info(500, 500, 640, 480), _rotation(0, 0, 0), 100.0),
+            (_camera_info(800, 790, 1280, 720), _rotation(10, -5, 30), 120.0),
+            (_camera_info(1400, 1400, 1920, 1080), _rotation(-15, 20, 200), 50.0),
+        ]
+        for camera_info, rotation, altitude in cases:
+            with self.subTest(width=camera_info.width, altitude=altitude):
+                R = rotation @ down
+                C = np.array((3.0, -7.0, altitude))
+                expected = _legacy_projection(camera_info, R, C)
+                rays = CameraRays()(camera_info)[:FOV_POINTS]
+                np.testing.assert_allclose(
+                    intersect_plane(rays, R, C), expected, rtol=1e-9, atol=1e-9
+                )
+
+    def test_rays_cached(self):
+        """Tests that rays are recomputed only when the intrinsics change"""
+        camera_rays = CameraRays()
+        camera_info = _camera_info(500, 500, 640, 480)
+        rays = camera_rays(camera_info)
+        self.assertIs(camera_rays(_camera_info(500, 500, 640, 480)), rays)
+        self.assertIsNot(camera_rays(_camera_info(600, 600, 640, 480)), rays)
+
+    def test_grid_rays(self):
+        """Tests that grid rays follow the :term:`FOV` rays and include the
+        image corners
+        """
+        camera_info = _camera_info(500, 500, 640, 480)
+        rays = CameraRays(grid_size=3)(camera_info)
+        self.assertEqual(rays.shape, (FOV_POINTS + 9, 3))
+
+        grid = grid_image_points(640, 480, 3)
+        fov = fov_image_points(640, 480)
+        np.testing.assert_array_equal(grid[[0, 2, 8, 6]], fov[:4])
+        np.testing.assert_allclose(rays[FOV_POINTS + np.array([0, 2, 8, 6])], rays[:4])
+
+    def test_invalid_grid_size(self):
+        """Tests that grid sizes that cannot cover the image are rejected"""
+        self.assertRaises(ValueError, CameraRays, 1)
+        self.assertRaises(ValueError, CameraRays, -1)
+
+    def test_singular_intrinsics(self):
+        """Tests that singular intrinsics raise a linear algebra error"""
+        camera_info = _camera_info(0, 0, 640, 480)
+        self.assertRaises(np.linalg.LinAlgError, CameraRays(), camera_info)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Tests for :mod:`gisnav._resolution`"""
+import math
+import unittest
+
+import numpy as np
+
+from gisnav._resolution import ResolutionController
+
+
+class TestResolutionController(unittest.TestCase):
+    """Tests :class:`.ResolutionController`"""
+
+    def test_invalid_arguments(self):
+        """Tests that out of range initializer arguments are rejected"""
+        minimum = ResolutionController.MIN_PIXEL_BUDGET
+        self.assertRaises(ValueError, ResolutionController, minimum - 1)
+        self.assertRaises(ValueError, ResolutionController, minimum, -1.0)
+        self.assertRaises(ValueError, ResolutionController, minimum, 0.1, 0.0)
+        self.assertRaises(ValueError, ResolutionController, minimum, 0.1, 1.5)
+
+    def test_scale_within_budget(self):
+        """Tests that images within the pixel budget are not scaled"""
+        controller = ResolutionController(640 * 480)
+        self.assertEqual(controller.scale((480, 640)), 1.0)
+        self.assertEqual(controller.scale((240, 320, 4)), 1.0)
+
+    def test_scale_quantized(self):
+        """Tests that scaling factors are quantized to quarter octaves and
+        keep the scaled image within the pixel budget
+        """
+        for budget in (160 * 120, 320 * 240, 500_000, 640 * 480):
+            controller = ResolutionController(budget)
+            for shape in ((720, 1280), (1080, 1920), (2160, 3840)):
+                with self.subTest(budget=budget, shape=shape):
+                    scale = controller.scale(shape)
+                    steps = 4 * math.log2(scale)
+                    self.assertAlmostEqual(steps, round(steps))
+                    self.assertLessEqual(shape[0] * shape[1] * scale**2, budget)
+                    # Next quantized step up would exceed the budget
+                    larger = scale * 2**0.25
+                    self.assertGreater(shape[0] * shape[1] * larger**2, budget)
+
+    def test_resize(self):
+        """Tests that resize factors map resized pixels back to the input
+        image and that resized shapes match :meth:`.resized_shape`
+        """
+        img = np.zeros((1080, 1920), dtype=np.uint8)
+        resized, factors = ResolutionController.resize(img, 0.5)
+        self.assertEqual(resized.shape, (540, 960))
+        self.assertEqual(
+            ResolutionController.resized_shape(img.shape, 0.5), resized.shape
+        )
+        np.testing.assert_allclose(factors, (2.0, 2.0))
+
+        resized, factors = ResolutionController.resize(img, 2**-0.25)
+        self.assertEqual(
+            ResolutionController.resized_shape(img.shape, 2**-0.25), resized.shape
+        )
+        np.testing.assert_allclose(
+            factors * resized.shape[1::-1], img.shape[1::-1], rtol=1e-6
+        )
+
+        same, factors = ResolutionController.resize(img, 1.0)
+        self.assertIs(same, img)
+        np.testing.assert_array_equal(factors, (1.0, 1.0))
+
+    def test_update_without_deadline(self):
+        """Tests that the budget stays fixed without a deadline"""
+        controller = ResolutionController(320 * 240)
+        controller.update(1.0, 320 * 240)
+        self.assertEqual(controller.pixel_budget, 320 * 240)
+
+    def test_update_converges(self):
+        """Tests that the budget converges to the deadline when latency is
+        proportional to pixel count
+        """
+        controller = ResolutionController(640 * 480, deadline=0.1, smoothing=0.5)
+        controller.scale((1080, 1920))
+        seconds_per_pixel = 1e-6
+        for _ in range(50):
+            budget = controller.pixel_budget
+            controller.update(budget * seconds_per_pixel, budget)
+        self.assertAlmostEqual(controller.pixel_budget, 100_000, delta=100)
+
+    def test_update_bounds(self):
+        """Tests that the budget is clamped to the minimum budget and to the
+        largest input image seen
+        """
+        controller = ResolutionController(320 * 240, deadline=0.1, smoothing=1.0)
+        controller.scale((480, 640))
+
+        controller.update(100.0, 320 * 240)
+        self.assertEqual(controller.pixel_budget, ResolutionController.MIN_PIXEL_BUDGET)
+
+        controller.update(1e-6, 320 * 240)
+        self.assertEqual(controller.pixel_budget, 480 * 640)
+
+
+if __name__ == "__main__":
+    unittest.main()
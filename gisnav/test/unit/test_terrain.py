@@ -0,0 +1,108 @@
+"""Tests for :mod:`gisnav._terrain`"""
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from gisnav._messaging import BBox
+from gisnav._projection import CameraRays, intersect_plane
+from gisnav._terrain import ElevationModel
+
+_BBOX = BBox(24.0, 60.0, 24.02, 60.01)
+"""Bounding box of the test DEMs, roughly 1.1 x 1.1 km"""
+
+_ORIGIN = (24.01, 60.005)
+"""Ray origin longitude and latitude at the center of :data:`._BBOX`"""
+
+
+def _camera_info(width: int = 640, height: int = 480) -> SimpleNamespace:
+    """Returns an object with the :class:`sensor_msgs.msg.CameraInfo` fields
+    read by :class:`.CameraRays`
+    """
+    k = np.array([500.0, 0, width / 2, 0, 500.0, height / 2, 0, 0, 1])
+    return SimpleNamespace(k=k, width=width, height=height)
+
+
+def _nadir_rotation(pitch: float, yaw: float) -> np.ndarray:
+    """Returns camera to :term:`ENU` rotation for a camera looking down,
+    tilted forward by pitch and turned by yaw in degrees
+    """
+    p, y = np.radians((pitch, yaw))
+    down = np.diag((1.0, -1.0, -1.0))
+    rx = np.array([[1, 0, 0], [0, np.cos(p), -np.sin(p)], [0, np.sin(p), np.cos(p)]])
+    rz = np.array([[np.cos(y), -np.sin(y), 0], [np.sin(y), np.cos(y), 0], [0, 0, 1]])
+    return rz @ rx @ down
+
+
+class TestElevationModel(unittest.TestCase):
+    """Tests :class:`.ElevationModel`"""
+
+    def test_flat_terrain_matches_plane(self):
+        """Tests that the terrain footprint on flat terrain matches the flat
+        ground plane footprint as computed by :class:`.BBoxNode`
+        """
+        ground = 120.0
+        model = ElevationModel(np.full((301, 257), ground), _BBOX)
+        rays = CameraRays(grid_size=8)(_camera_info())
+
+        for pitch, yaw, altitude in ((0, 0, 100), (20, 45, 150), (-30, 200, 80)):
+            with self.subTest(pitch=pitch, yaw=yaw, altitude=altitude):
+                R = _nadir_rotation(pitch, yaw)
+                C = np.array((0.0, 0.0, altitude))
+                expected = intersect_plane(rays, R, C)
+
+                elevation = model.elevation(*_ORIGIN)
+                self.assertEqual(elevation, ground)
+                actual = model.intersect(rays @ R.T, *_ORIGIN, elevation + altitude)
+                np.testing.assert_allclose(actual, expected, atol=1e-3)
+
+    def test_hilly_terrain_first_hit(self):
+        """Tests that rays on hilly terrain hit where densely sampling the ray
+        first goes below the terrain
+        """
+        rng = np.random.default_rng(0)
+        rows, cols = np.mgrid[0:301, 0:257]
+        dem = 100 + 40 * np.sin(rows / 23.0) * np.cos(cols / 17.0)
+        dem += rng.uniform(0, 2, size=dem.shape)
+        model = ElevationModel(dem, _BBOX)
+
+        altitude = 300.0
+        # Steep enough to hit the terrain within the raster
+        directions = rng.normal(size=(50, 3))
+        directions[:, 2] = -np.linalg.norm(directions[:, :2], axis=1) * 1.5
+        hits = model.intersect(directions, *_ORIGIN, altitude)
+
+        meters_per_col = (
+            (_BBOX.right - _BBOX.left)
+            / dem.shape[1]
+            * 111320.0
+            * np.cos(np.radians(_ORIGIN[1]))
+        )
+        meters_per_row = (_BBOX.top - _BBOX.bottom) / dem.shape[0] * 110540.0
+        col0 = (_ORIGIN[0] - _BBOX.left) / (_BBOX.right - _BBOX.left) * dem.shape[1]
+        row0 = (_BBOX.top - _ORIGIN[1]) / (_BBOX.top - _BBOX.bottom) * dem.shape[0]
+        t = np.arange(0, 400, 0.01)
+        for direction, hit in zip(directions, hits):
+            with self.subTest(direction=direction):
+                direction = direction / np.linalg.norm(direction[:2])
+                col = (col0 + t * direction[0] / meters_per_col).astype(int)
+                row = (row0 - t * direction[1] / meters_per_row).astype(int)
+                below = altitude + t * direction[2] <= dem[row, col]
+                expected = t[np.argmax(below)] * direction[:2]
+                np.testing.assert_allclose(hit, expected, atol=0.05)
+
+    def test_misses(self):
+        """Tests that rays that point up or leave the raster return NaN and
+        a vertical ray hits directly below the origin
+        """
+        model = ElevationModel(np.full((64, 64), 10.0), _BBOX)
+        directions = np.array(
+            [[0.0, 0.0, -1.0], [1.0, 0.0, 0.5], [1.0, 1.0, 0.0], [1.0, 0.0, -1e-4]]
+        )
+        hits = model.intersect(directions, *_ORIGIN, 100.0)
+        np.testing.assert_allclose(hits[0], (0.0, 0.0), atol=1e-9)
+        self.assertTrue(np.isnan(hits[1:]).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Tests for :class:`.TileCache`"""
+import tempfile
+import unittest
+
+import numpy as np
+
+from gisnav._messaging import BBox
+from gisnav._tile_cache import TileCache
+
+
+class TestTileCache(unittest.TestCase):
+    """Tests that :class:`.TileCache` stores, returns and evicts rasters"""
+
+    def setUp(self) -> None:
+        """Creates a temporary cache directory"""
+        self._tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        """Removes the temporary cache directory"""
+        self._tmpdir.cleanup()
+
+    @staticmethod
+    def _key(i: int) -> str:
+        """Returns a cache key for a dummy request"""
+        return TileCache.key(
+            ("imagery",),
+            ("",),
+            "EPSG:4326",
+            BBox(i, 0.0, i + 1.0, 1.0),
+            (8, 8),
+            "image/jpeg",
+            False,
+        )
+
+    def test_get_returns_writable_copy(self):
+        """Tests that a cache hit returns an equal raster that can be modified
+        in place without modifying the cached raster
+        """
+        cache = TileCache(self._tmpdir.name, 1024 * 1024)
+        raster = np.arange(8 * 8 * 3, dtype=np.uint8).reshape(8, 8, 3)
+        cache.put(self._key(0), raster)
+
+        cached = cache.get(self._key(0))
+        assert cached is not None
+        np.testing.assert_array_equal(cached, raster)
+        self.assertTrue(cached.flags.writeable)
+
+        cached += 1
+        np.testing.assert_array_equal(cache.get(self._key(0)), raster)
+
+    def test_get_miss(self):
+        """Tests that a cache miss returns None"""
+        cache = TileCache(self._tmpdir.name, 1024 * 1024)
+        self.assertIsNone(cache.get(self._key(0)))
+
+    def test_lru_eviction(self):
+        """Tests that the least recently used raster is evicted when the byte
+        budget is exceeded
+        """
+        raster = np.zeros((64, 64), dtype=np.uint8)
+        cache = TileCache(self._tmpdir.name, 3 * raster.nbytes)
+        cache.put(self._key(0), raster)
+        cache.put(self._key(1), raster)
+        cache.get(self._key(0))  # key 1 is now least recently used
+        cache.put(self._key(2), raster)
+
+        self.assertIsNotNone(cache.get(self._key(0)))
+        self.assertIsNone(cache.get(self._key(1)))
+        self.assertIsNotNone(cache.get(self._key(2)))
+        self.assertLessEqual(cache.size, 3 * raster.nbytes)
+
+    def test_index_survives_restart(self):
+        """Tests that cached rasters are found by a new cache instance"""
+        raster = np.ones((8, 8), dtype=np.uint8)
+        TileCache(self._tmpdir.name, 1024 * 1024).put(self._key(0), raster)
+
+        cached = TileCache(self._tmpdir.name, 1024 * 1024).get(self._key(0))
+        np.testing.assert_array_equal(cached, raster)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,335 @@
+"""Tests for :class:`.TransformNode`"""
+import threading
+import unittest
+from collections import OrderedDict, deque
+from types import SimpleNamespace
+from unittest import mock
+
+import cv2
+import numpy as np
+from builtin_interfaces.msg import Time
+from rclpy.node import Node
+
+from gisnav.core.transform_node import TransformNode
+
+
+def _legacy_rotate_and_crop_center(
+    image: np.ndarray, angle_degrees: float, shape: tuple
+) -> np.ndarray:
+    """Rotates the whole image and then slices out the crop as
+    :meth:`.TransformNode._rotate_and_crop_center` used to do
+    """
+    h, w = image.shape[:2]
+    center = (w // 2, h // 2)
+    rotation_matrix = cv2.getRotationMatrix2D(center, angle_degrees, 1.0)
+    rotated_image = cv2.warpAffine(image, rotation_matrix, (w, h))
+    x = center[0] - shape[1] // 2
+    y = center[1] - shape[0] // 2
+    return rotated_image[y : y + shape[0], x : x + shape[1]]
+
+
+class TestRotateAndCropCenter(unittest.TestCase):
+    """Tests :meth:`.TransformNode._rotate_and_crop_center`"""
+
+    def test_matches_two_step_warp(self):
+        """Tests that warping only the crop matches rotating the whole image
+        and cropping it afterwards up to fixed-point rounding
+        """
+        rng = np.random.default_rng(0)
+        cases = [
+            ((1024, 1024), (480, 640), 33.0),
+            ((1024, 1024), (480, 640), -90.0),
+            ((1535, 1536), (720, 1280), 12.5),
+            ((800, 900), (599, 899), 180.0),
+        ]
+        for image_shape, crop_shape, angle in cases:
+            with self.subTest(image_shape=image_shape, angle=angle):
+                image = rng.integers(0, 255, size=(*image_shape, 3), dtype=np.uint8)
+                expected = _legacy_rotate_and_crop_center(image, angle, crop_shape)
+                actual = TransformNode._rotate_and_crop_center(image, angle, crop_shape)
+                self.assertEqual(actual.shape, expected.shape)
+                difference = np.abs(actual.astype(int) - expected.astype(int))
+                self.assertLessEqual(difference.max(), 1)
+                self.assertLess(np.count_nonzero(difference) / difference.size, 0.01)
+
+    def test_dst(self):
+        """Tests that the warped crop is written into the given array"""
+        image = np.random.default_rng(0).integers(
+            0, 255, size=(512, 512, 3), dtype=np.uint8
+        )
+        dst = np.empty((240, 320, 3), dtype=np.uint8)
+        result = TransformNode._rotate_and_crop_center(image, 10.0, (240, 320), dst)
+        self.assertIs(result, dst)
+        np.testing.assert_array_equal(
+            dst, TransformNode._rotate_and_crop_center(image, 10.0, (240, 320))
+        )
+
+
+class TestGetBuffer(unittest.TestCase):
+    """Tests :meth:`.TransformNode._get_buffer`"""
+
+    def setUp(self) -> None:
+        """Creates a node with the buffer state only, without initializing
+        ROS
+        """
+        self.node = TransformNode.__new__(TransformNode)
+        self.node._buffers = {}
+
+    def test_reused(self):
+        """Tests that a buffer is reused while its shape and dtype stay the
+        same and reallocated when they change
+        """
+        buffer = self.node._get_buffer("a", (4, 4, 3), np.uint8)
+        self.assertIs(self.node._get_buffer("a", (4, 4, 3), np.uint8), buffer)
+        self.assertIsNot(self.node._get_buffer("b", (4, 4, 3), np.uint8), buffer)
+        self.assertIsNot(self.node._get_buffer("a", (4, 5, 3), np.uint8), buffer)
+        self.assertEqual(
+            self.node._get_buffer("a", (4, 5, 3), np.float32).dtype, np.float32
+        )
+
+
+class _RotationCacheNode(TransformNode):
+    """:class:`.TransformNode` with a fixed rotation cache memory budget
+    instead of the ROS parameter
+    """
+
+    rotation_cache_max_bytes = None  # type: ignore[assignment]
+    rotation_bin = None  # type: ignore[assignment]
+
+
+class TestRotatedReference(unittest.TestCase):
+    """Tests the rotation cache of :meth:`.TransformNode._rotated_reference`"""
+
+    _CROP_SHAPE = (48, 64)
+    """Crop shape (height, width) of the cached stacks"""
+
+    _ENTRY_BYTES = 48 * 64 * 3
+    """Size of a cached rotated stack in bytes"""
+
+    def setUp(self) -> None:
+        """Creates a node with the rotation cache state only, without
+        initializing ROS
+        """
+        self.node = _RotationCacheNode.__new__(_RotationCacheNode)
+        self.node._buffers = {}
+        self.node._rotation_cache = OrderedDict()
+        self.node._rotation_cache_stamp = None
+        self.node._rotation_cache_bytes = 0
+        self.node._rotation_cache_hits = 0
+        self.node._rotation_cache_misses = 0
+        self.node.get_logger = mock.Mock()
+        self.node.rotation_cache_max_bytes = int(2.5 * self._ENTRY_BYTES)
+        self.node.rotation_bin = 1.0
+
+        self.stack = np.random.default_rng(0).integers(
+            0, 255, size=(128, 128, 3), dtype=np.uint8
+        )
+
+    @staticmethod
+    def _orthoimage(sec: int) -> SimpleNamespace:
+        """Returns an orthoimage message stand-in with the given timestamp"""
+        return SimpleNamespace(
+            header=SimpleNamespace(stamp=SimpleNamespace(sec=sec, nanosec=0))
+        )
+
+    def _get(self, rotation: float, sec: int = 1) -> np.ndarray:
+        """Returns the rotated reference for the rotation"""
+        return self.node._rotated_reference(
+            self._orthoimage(sec), self.stack, rotation, self._CROP_SHAPE
+        )
+
+    def test_hit(self):
+        """Tests that a cached rotation is returned without warping"""
+        first = self._get(10.0)
+        second = self._get(10.0)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.node.rotation_cache_stats, (1, 1))
+        np.testing.assert_array_equal(
+            first,
+            TransformNode._rotate_and_crop_center(self.stack, 10.0, self._CROP_SHAPE),
+        )
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        """Tests that the least recently used rotation is evicted when the
+        cached stacks exceed the memory budget
+        """
+        first = self._get(1.0)
+        self._get(2.0)
+        self.assertIs(self._get(1.0), first)  # 2.0 is now least recently used
+        self._get(3.0)
+
+        self.assertEqual(
+            list(self.node._rotation_cache),
+            [(1.0, self._CROP_SHAPE), (3.0, self._CROP_SHAPE)],
+        )
+        self.assertEqual(self.node._rotation_cache_bytes, 2 * self._ENTRY_BYTES)
+        self.assertIs(self._get(1.0), first)
+        self.assertEqual(self.node.rotation_cache_stats, (2, 3))
+
+    def test_oversized_not_cached(self):
+        """Tests that a stack larger than the memory budget is not cached"""
+        self.node.rotation_cache_max_bytes = self._ENTRY_BYTES - 1
+        self._get(1.0)
+
+        self.assertEqual(len(self.node._rotation_cache), 0)
+        self.assertEqual(self.node._rotation_cache_bytes, 0)
+
+    def test_new_orthoimage_clears(self):
+        """Tests that the cache is cleared when a new orthoimage arrives"""
+        self._get(1.0, sec=1)
+        self._get(1.0, sec=2)
+
+        self.assertEqual(self.node.rotation_cache_stats, (0, 2))
+        self.assertEqual(len(self.node._rotation_cache), 1)
+        self.assertEqual(self.node._rotation_cache_bytes, self._ENTRY_BYTES)
+
+    def test_disabled(self):
+        """Tests that nothing is cached with a zero memory budget or without
+        rotation bins
+        """
+        for max_bytes, rotation_bin in ((0, 1.0), (self._ENTRY_BYTES, 0.0)):
+            with self.subTest(max_bytes=max_bytes, rotation_bin=rotation_bin):
+                self.node.rotation_cache_max_bytes = max_bytes
+                self.node.rotation_bin = rotation_bin
+                self._get(1.0)
+                self._get(1.0)
+
+                self.assertEqual(len(self.node._rotation_cache), 0)
+                self.assertEqual(self.node.rotation_cache_stats, (0, 0))
+
+
+class _SyncNode(TransformNode):
+    """:class:`.TransformNode` that records the synchronized image pairs
+    instead of publishing them
+    """
+
+    sync_queue_size = None  # type: ignore[assignment]
+
+    @property  # type: ignore[override]
+    def pnp_image(self) -> SimpleNamespace:
+        """Records the synchronized image and orthoimage"""
+        image, orthoimage, _ = self._synchronized
+        self.published.append((image, orthoimage))
+        return image
+
+    @property  # type: ignore[override]
+    def reference_time(self) -> None:
+        """Not published"""
+
+
+class TestSync(unittest.TestCase):
+    """Tests pairing :attr:`.TransformNode.image` messages with an
+    orthoimage and a transform
+    """
+
+    def setUp(self) -> None:
+        """Creates a node with the synchronization state only, without
+        initializing ROS
+        """
+        self.node = _SyncNode.__new__(_SyncNode)
+        self.node._sync_queue = deque(maxlen=3)
+        self.node._sync_lock = threading.RLock()
+        self.node._sync_waiting = None
+        self.node._orthoimages = deque(maxlen=TransformNode._ORTHOIMAGE_HISTORY_SIZE)
+        self.node._sync_drops = {"orthoimage": 0, "transform": 0, "queue": 0}
+        self.node._synchronized = None
+        self.node.published = []
+        self.node.get_logger = mock.Mock()
+        self.node.tf_buffer = mock.Mock()
+        self.node._lookup_synchronized_transform = mock.Mock(return_value="tf")
+
+    @staticmethod
+    def _image(sec: int) -> SimpleNamespace:
+        """Returns an image message stand-in with the given timestamp"""
+        return SimpleNamespace(header=SimpleNamespace(stamp=Time(sec=sec, nanosec=0)))
+
+    def _receive_orthoimage(self, sec: int) -> SimpleNamespace:
+        """Receives an orthoimage with the given timestamp"""
+        orthoimage = self._image(sec)
+        self.node._orthoimage_cb(orthoimage)
+        return orthoimage
+
+    def test_pairs_orthoimage_by_stamp(self):
+        """Tests that an image is paired with the latest orthoimage stamped
+        at or before its timestamp regardless of arrival order
+        """
+        first = self._receive_orthoimage(10)
+        second = self._receive_orthoimage(20)
+        early, between, late = self._image(5), self._image(15), self._image(25)
+        for image in (early, between, late):
+            self.node._image_cb(image)
+
+        self.assertEqual(self.node.published, [(between, first), (late, second)])
+        self.assertEqual(self.node.sync_drop_stats["orthoimage"], 1)
+
+    def test_skips_republished_orthoimage(self):
+        """Tests that a republished orthoimage with the same timestamp does
+        not push distinct orthoimages out of the history
+        """
+        first = self._receive_orthoimage(10)
+        for _ in range(self.node._ORTHOIMAGE_HISTORY_SIZE):
+            self._receive_orthoimage(20)
+
+        self.assertEqual(len(self.node._orthoimages), 2)
+        image = self._image(15)
+        self.node._image_cb(image)
+        self.assertEqual(self.node.published, [(image, first)])
+
+    def test_waits_for_transform(self):
+        """Tests that queued images are published in order once the
+        transform at the head of the queue arrives in the tf buffer
+        """
+        orthoimage = self._receive_orthoimage(0)
+        self.node._lookup_synchronized_transform.return_value = False
+        images = [self._image(sec) for sec in (1, 2)]
+        for image in images:
+            self.node._image_cb(image)
+
+        self.assertEqual(self.node.published, [])
+        # Waits once for the head of the queue
+        self.node.tf_buffer.wait_for_transform_async.assert_called_once()
+        future = self.node.tf_buffer.wait_for_transform_async.return_value
+        (done_callback,) = future.add_done_callback.call_args.args
+
+        self.node._lookup_synchronized_transform.return_value = "tf"
+        done_callback(future)
+        self.assertEqual(self.node.published, [(image, orthoimage) for image in images])
+        self.assertEqual(len(self.node._sync_queue), 0)
+
+    def test_orthoimage_drains(self):
+        """Tests that the queue is also drained when an orthoimage arrives"""
+        self.node._lookup_synchronized_transform.return_value = False
+        image = self._image(5)
+        self.node._image_cb(image)
+        self.node._lookup_synchronized_transform.return_value = "tf"
+        orthoimage = self._receive_orthoimage(1)
+
+        self.assertEqual(self.node.published, [(image, orthoimage)])
+
+    def test_drops(self):
+        """Tests that images are dropped from a full queue and when their
+        transform will never become available
+        """
+        self._receive_orthoimage(0)
+        self.node._lookup_synchronized_transform.return_value = False
+        for sec in range(1, 5):
+            self.node._image_cb(self._image(sec))
+        self.assertEqual(self.node.sync_drop_stats["queue"], 1)
+
+        self.node._lookup_synchronized_transform.return_value = None
+        self.node._image_cb(self._image(5))
+        self.assertEqual(self.node.sync_drop_stats["transform"], 3)
+        self.assertEqual(self.node.published, [])
+
+    def test_queue_size_validated(self):
+        """Tests that a sync queue size less than 1 is rejected"""
+        node = _SyncNode.__new__(_SyncNode)
+        node.sync_queue_size = 0
+        with mock.patch.object(Node, "__init__", return_value=None):
+            with self.assertRaises(ValueError):
+                node.__init__("transform_node")
+
+
+if __name__ == "__main__":
+    unittest.main()